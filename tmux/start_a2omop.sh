@@ -1,4 +1,5 @@
 #!/bin/zsh
+# Generated by project-manager from ~/code/projects/tmux/sessions/a2omop.json (sha256:cd7dc88ce6b54bbe). Edit the spec, not this file.
 
 SESSION_NAME="a2omop"
 PROJECT_DIR="$HOME/code/a2cps-ehr-to-omop"
@@ -1,4 +1,5 @@
 #!/bin/zsh
+# Generated by project-manager from ~/code/projects/tmux/sessions/ehrreaccess.json (sha256:855e7492a061eda4). Edit the spec, not this file.
 
 SESSION_NAME="ehrreaccess"
 PROJECT_DIR="$HOME/code/ehr-reaccess"
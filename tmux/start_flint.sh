@@ -1,45 +1,36 @@
 #!/bin/zsh
-
-# Start Flint tmux session
+# Generated by project-manager from ~/code/projects/tmux/sessions/flint.json (sha256:c3771c6c55664f18). Edit the spec, not this file.
 
 SESSION_NAME="flint"
 PROJECT_DIR="$HOME/code/flint"
 
-# Check if session already exists
 tmux has-session -t $SESSION_NAME 2>/dev/null
 
 if [ $? != 0 ]; then
-    # Create new session with first window for zsh
     tmux new-session -d -s $SESSION_NAME -n "zsh" -c "$PROJECT_DIR" /bin/zsh
-
-    # Create window for claude (window index 1)
-    tmux new-window -t $SESSION_NAME:1 -n "claude" -c "$PROJECT_DIR" /bin/zsh
+    tmux new-window -t $SESSION_NAME:1 -n "claude" -c "$HOME/code/flint" /bin/zsh
     tmux send-keys -t $SESSION_NAME:1 "claude" C-m
 
-    # Create Codex windows for different models (windows 2-5)
-    tmux new-window -t $SESSION_NAME:2 -n "co-mini" -c "$PROJECT_DIR" /bin/zsh
+    tmux new-window -t $SESSION_NAME:2 -n "co-mini" -c "$HOME/code/flint" /bin/zsh
     tmux send-keys -t $SESSION_NAME:2 "codex --full-auto --model gpt-5.1-codex-mini -c model_reasoning_effort=\"low\"" C-m
 
-    tmux new-window -t $SESSION_NAME:3 -n "co-m" -c "$PROJECT_DIR" /bin/zsh
+    tmux new-window -t $SESSION_NAME:3 -n "co-m" -c "$HOME/code/flint" /bin/zsh
     tmux send-keys -t $SESSION_NAME:3 "codex --full-auto --model gpt-5.1-codex -c model_reasoning_effort=\"medium\"" C-m
 
-    tmux new-window -t $SESSION_NAME:4 -n "co-max" -c "$PROJECT_DIR" /bin/zsh
+    tmux new-window -t $SESSION_NAME:4 -n "co-max" -c "$HOME/code/flint" /bin/zsh
     tmux send-keys -t $SESSION_NAME:4 "codex --full-auto --model gpt-5.1-codex-max -c model_reasoning_effort=\"high\"" C-m
 
-    tmux new-window -t $SESSION_NAME:5 -n "co-gpt" -c "$PROJECT_DIR" /bin/zsh
+    tmux new-window -t $SESSION_NAME:5 -n "co-gpt" -c "$HOME/code/flint" /bin/zsh
     tmux send-keys -t $SESSION_NAME:5 "codex --full-auto --model gpt-5.1 -c model_reasoning_effort=\"high\"" C-m
 
-    # Create window for tinker (window index 6)
-    tmux new-window -t $SESSION_NAME:6 -n "tinker" -c "$PROJECT_DIR" /bin/zsh
+    tmux new-window -t $SESSION_NAME:6 -n "tinker" -c "$HOME/code/flint" /bin/zsh
     tmux send-keys -t $SESSION_NAME:6 "php artisan tinker" C-m
 
-    tmux new-window -t $SESSION_NAME:7 -n npm -c "$PROJECT_DIR" /bin/zsh
+    tmux new-window -t $SESSION_NAME:7 -n "npm" -c "$HOME/code/flint" /bin/zsh
     tmux send-keys -t $SESSION_NAME:7 "npm run dev" C-m
 
-
-    # Go back to zsh window (window index 0)
     tmux select-window -t $SESSION_NAME:0
+
 fi
 
-# Attach to session
-tmux attach-session -t $SESSION_NAME
\ No newline at end of file
+tmux attach -t $SESSION_NAME
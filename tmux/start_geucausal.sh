@@ -1,4 +1,5 @@
 #!/bin/zsh
+# Generated by project-manager from ~/code/projects/tmux/sessions/geucausal.json (sha256:562f8e7056c77467). Edit the spec, not this file.
 
 SESSION_NAME="geucausal"
 PROJECT_DIR="$HOME/code/geu-causal-presentation"
@@ -1,4 +1,5 @@
 #!/bin/zsh
+# Generated by project-manager from ~/code/projects/tmux/sessions/geupre.json (sha256:242ba55e652c4efe). Edit the spec, not this file.
 
 SESSION_NAME="geupre"
 PROJECT_DIR="$HOME/code/geu-preregistration"
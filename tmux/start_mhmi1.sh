@@ -1,4 +1,5 @@
 #!/bin/zsh
+# Generated by project-manager from ~/code/projects/tmux/sessions/mhmi1.json (sha256:e67da8b0a0f363b8). Edit the spec, not this file.
 
 SESSION_NAME="mhmi1"
 PROJECT_DIR="$HOME/code/maternal-health-missing-data-1"
@@ -83,12 +83,21 @@ else
 fi
 
 echo ""
-echo "Docker services ready. Waiting a moment for full initialization..."
-sleep 3
-echo ""
 
-# Wait for containers to be ready
-wait_for_containers || {
+# Wait for containers to be ready. pm probes both ports concurrently with
+# backoff; fall back to the polling loop when the projects venv is missing.
+PM_PYTHON="$HOME/code/projects/.venv/bin/python"
+PM_SCRIPT="$HOME/code/projects/tools/project_manager.py"
+wait_for_services() {
+    if [ -x "$PM_PYTHON" ] && [ -f "$PM_SCRIPT" ]; then
+        "$PM_PYTHON" "$PM_SCRIPT" tmux wait --tcp localhost:8000 --tcp localhost:8001 --timeout 60
+    else
+        sleep 3
+        wait_for_containers
+    fi
+}
+
+wait_for_services || {
     echo "${RED}✗${NC} Containers failed to start properly. You can still attach to the session and debug manually:"
     echo "  tmux attach -t $SESSION"
 }
@@ -1,4 +1,5 @@
 #!/bin/zsh
+# Generated by project-manager from ~/code/projects/tmux/sessions/r50.json (sha256:b15b349613a8d502). Edit the spec, not this file.
 
 SESSION_NAME="r50"
 PROJECT_DIR="$HOME/code/r50"
@@ -23,6 +24,7 @@ if [ $? != 0 ]; then
     tmux send-keys -t $SESSION_NAME:5 "codex --full-auto --model gpt-5.1 -c model_reasoning_effort=\"high\"" C-m
 
     tmux new-window -t $SESSION_NAME:6 -n "site" -c "$HOME/code/r50-code-samples-site" /bin/zsh
+
 fi
 
 tmux attach -t $SESSION_NAME
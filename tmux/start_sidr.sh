@@ -1,22 +1,18 @@
 #!/bin/zsh
-
-# Start SIDR workspace tmux session
+# Generated by project-manager from ~/code/projects/tmux/sessions/sidr.json (sha256:108b42982765fe3c). Edit the spec, not this file.
 
 SESSION_NAME="sidr"
 PROJECT_DIR="$HOME/code/jh-sidr-pipeline"
 
-# Check if session already exists
 tmux has-session -t $SESSION_NAME 2>/dev/null
 
 if [ $? != 0 ]; then
-    # Create new session with first window for pipeline
-    tmux new-session -d -s $SESSION_NAME -n "pipeline" -c "$HOME/code/jh-sidr-pipeline" /bin/zsh
+    tmux new-session -d -s $SESSION_NAME -n "pipeline" -c "$PROJECT_DIR" /bin/zsh
+    tmux send-keys -t $SESSION_NAME:0 "source venv/bin/activate" C-m
 
-    # Create Claude window in jh-sidr dir (window index 1)
     tmux new-window -t $SESSION_NAME:1 -n "claude" -c "$HOME/code/jh-sidr" /bin/zsh
     tmux send-keys -t $SESSION_NAME:1 "claude" C-m
 
-    # Create Codex windows in jh-sidr dir for different models (windows 2-5)
     tmux new-window -t $SESSION_NAME:2 -n "co-mini" -c "$HOME/code/jh-sidr" /bin/zsh
     tmux send-keys -t $SESSION_NAME:2 "codex --model gpt-5.1-codex-mini -c model_reasoning_effort=\"low\"" C-m
 
@@ -29,29 +25,19 @@ if [ $? != 0 ]; then
     tmux new-window -t $SESSION_NAME:5 -n "co-gpt" -c "$HOME/code/jh-sidr" /bin/zsh
     tmux send-keys -t $SESSION_NAME:5 "codex --model gpt-5.1 -c model_reasoning_effort=\"high\"" C-m
 
-    # Create new windows for jh-sidr-data and jh-sidr-data-restricted
     tmux new-window -t $SESSION_NAME:6 -n "data" -c "$HOME/code/jh-sidr-data" /bin/zsh
     tmux new-window -t $SESSION_NAME:7 -n "data-restricted" -c "$HOME/code/jh-sidr-data-restricted" /bin/zsh
     tmux new-window -t $SESSION_NAME:8 -n "tools" -c "$HOME/code/jh-sidr-tools" /bin/zsh
-
-    # Create a window for Python REPL
     tmux new-window -t $SESSION_NAME:9 -n "python-repl" -c "$HOME/code/jh-sidr-pipeline" /bin/zsh
     tmux send-keys -t $SESSION_NAME:9 "source venv/bin/activate" C-m
     tmux send-keys -t $SESSION_NAME:9 "python" C-m
 
-    # Create a window for example project
     tmux new-window -t $SESSION_NAME:10 -n "example" -c "$HOME/code/sidr-example-project" /bin/zsh
-
-    # Create a window for R console in example project
     tmux new-window -t $SESSION_NAME:11 -n "example-R" -c "$HOME/code/sidr-example-project" /bin/zsh
     tmux send-keys -t $SESSION_NAME:11 "R" C-m
 
-    # Activate virtual environment in the pipeline window
-    tmux send-keys -t $SESSION_NAME:0 "source venv/bin/activate" C-m
-
-    # Select the first window
     tmux select-window -t $SESSION_NAME:0
+
 fi
 
-# Attach to session
-tmux attach-session -t $SESSION_NAME
\ No newline at end of file
+tmux attach -t $SESSION_NAME
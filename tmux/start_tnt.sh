@@ -1,4 +1,5 @@
 #!/bin/zsh
+# Generated by project-manager from ~/code/projects/tmux/sessions/tnt.json (sha256:045e1e7f1d77747b). Edit the spec, not this file.
 
 SESSION_NAME="tnt"
 PROJECT_DIR="$HOME/code/syphilis-tnt"
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Shell-completion latency for ``pm``.
+
+Measures the completion index lookup in-process (cold rebuild and warm read)
+and a full TAB round trip, both in a fresh interpreter and with a private
+``pm serve`` listening, and exits non-zero when a warm lookup or any TAB
+exceeds the budget. Both TAB paths are answered by ``project_manager_complete``
+without importing click, so the daemon is not needed to stay in budget.
+
+    python tools/benchmarks/completion.py
+    python tools/benchmarks/completion.py --runs 20 --budget-ms 40
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from startup import ENTRY_SCRIPT, TOOLS_DIR, _start_daemon
+
+# (label, COMP_WORDS) pairs; the cursor is always on the last word.
+SCENARIOS = (
+    ("session", "pm tmux add-tab --session "),
+    ("repo", "pm llm:agents sync --repo "),
+    ("workspace", "pm workspace --name "),
+)
+LOOKUP_PROBE = f"""
+import sys, time
+sys.path.insert(0, {str(TOOLS_DIR)!r})
+import project_manager_core as pm
+if sys.argv[1] == "cold":
+    pm.COMPLETION_INDEX.unlink(missing_ok=True)
+start = time.perf_counter()
+pm.completion_index()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _time_lookup(python: str, mode: str) -> float:
+    result = subprocess.run(
+        [python, "-c", LOOKUP_PROBE, mode], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+def _time_tab(python: str, words: str, env: dict[str, str]) -> float:
+    env = {
+        **env,
+        "_PROJECT_MANAGER_COMPLETE": "bash_complete",
+        "COMP_WORDS": words,
+        "COMP_CWORD": str(len(words.split(" ")) - 1),
+    }
+    start = time.perf_counter()
+    subprocess.run([python, str(ENTRY_SCRIPT)], stdout=subprocess.DEVNULL, env=env, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def _report(label: str, samples: list[float], budget: float | None) -> int:
+    median = statistics.median(samples)
+    if budget is None:
+        print(f"{label:<22}  {median:6.1f}ms  {min(samples):6.1f}ms  {'-':>8}")
+        return 0
+    status = "ok" if median <= budget else "OVER"
+    print(f"{label:<22}  {median:6.1f}ms  {min(samples):6.1f}ms  {budget:6.0f}ms  {status}")
+    return status != "ok"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Samples per measurement (default: 10).")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50.0,
+        help="Median budget for warm lookups and TAB round trips in milliseconds (default: 50).",
+    )
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to benchmark.")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'Measurement':<22}  {'median':>8}  {'min':>8}  {'budget':>8}")
+    failures += _report("lookup (cold rebuild)", [_time_lookup(args.python, "cold") for _ in range(args.runs)], None)
+    failures += _report("lookup (warm)", [_time_lookup(args.python, "warm") for _ in range(args.runs)], args.budget_ms)
+
+    env = {key: value for key, value in os.environ.items() if key != "PM_SOCKET"}
+    local_env = {**env, "PM_NO_DAEMON": "1"}
+    for label, words in SCENARIOS:
+        samples = [_time_tab(args.python, words, local_env) for _ in range(args.runs)]
+        failures += _report(f"tab {label} (local)", samples, args.budget_ms)
+
+    with tempfile.TemporaryDirectory(prefix="pm-bench-") as scratch:
+        socket_path = Path(scratch) / "pm.sock"
+        daemon = _start_daemon(args.python, socket_path)
+        daemon_env = {**env, "PM_SOCKET": str(socket_path)}
+        daemon_env.pop("PM_NO_DAEMON", None)
+        try:
+            for label, words in SCENARIOS:
+                samples = [_time_tab(args.python, words, daemon_env) for _ in range(args.runs)]
+                failures += _report(f"tab {label} (daemon)", samples, args.budget_ms)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Startup-time budget for the ``pm`` CLI.
+
+Runs representative invocations in fresh interpreters and exits non-zero when
+the median wall time of any of them exceeds its budget, or when the commit
+hook path or ``pm --help`` imports modules that are meant to stay lazy.
+
+    python tools/benchmarks/startup.py
+    python tools/benchmarks/startup.py --runs 20 --budget-ms 120
+    python tools/benchmarks/startup.py --daemon   # through a private pm serve
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+ENTRY_SCRIPT = TOOLS_DIR / "project_manager.py"
+
+# (label, argv, budget multiplier). The hook path gets the tightest budget
+# because it runs on every commit.
+SCENARIOS = (
+    ("help", ["--help"], 1.0),
+    ("hook-run", ["llm:agents", "hook-run", "--help"], 1.0),
+    ("graveyard", ["graveyard", "list", "--help"], 1.0),
+    ("tmux", ["tmux", "status", "--help"], 1.25),
+)
+
+# Modules that must not be imported to dispatch an llm:agents command or print `pm --help`.
+LAZY_MODULES = (
+    "asyncio",
+    "urllib.request",
+    "concurrent.futures",
+    "project_manager_serve",
+    "project_manager_tmux",
+)
+IMPORT_PROBE = f"""
+import sys
+sys.path.insert(0, {str(TOOLS_DIR)!r})
+import click
+import project_manager_core as pm
+ctx = click.Context(pm.cli)
+group = pm.cli.get_command(ctx, "llm:agents")
+group.get_command(click.Context(group, parent=ctx), "hook-run")
+pm.cli.get_help(click.Context(pm.cli, info_name="pm"))
+print(" ".join(name for name in {LAZY_MODULES!r} if name in sys.modules))
+"""
+
+
+def _time_invocation(python: str, argv: list[str], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([python, str(ENTRY_SCRIPT), *argv], stdout=subprocess.DEVNULL, env=env, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def _start_daemon(python: str, socket_path: Path) -> subprocess.Popen:
+    env = {**os.environ, "PM_SOCKET": str(socket_path)}
+    daemon = subprocess.Popen(
+        [python, str(ENTRY_SCRIPT), "serve", "--idle-timeout", "10m"],
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while not socket_path.exists():
+        if daemon.poll() is not None or time.monotonic() > deadline:
+            daemon.kill()
+            raise SystemExit("pm serve did not start")
+        time.sleep(0.05)
+    return daemon
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Invocations per scenario (default: 10).")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=150.0,
+        help="Median wall-time budget per invocation in milliseconds (default: 150).",
+    )
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to benchmark.")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Time invocations forwarded to a private pm serve instead of in-process ones.",
+    )
+    args = parser.parse_args()
+
+    # In-process numbers must not be skewed by a daemon the user has running.
+    env = {key: value for key, value in os.environ.items() if key != "PM_NO_DAEMON"}
+    if not args.daemon:
+        env["PM_NO_DAEMON"] = "1"
+    # Warm the bytecode cache so the numbers reflect steady-state startup.
+    _time_invocation(args.python, ["--help"], env)
+
+    failures = 0
+    with tempfile.TemporaryDirectory(prefix="pm-bench-") as scratch:
+        daemon = None
+        if args.daemon:
+            socket_path = Path(scratch) / "pm.sock"
+            daemon = _start_daemon(args.python, socket_path)
+            env["PM_SOCKET"] = str(socket_path)
+        try:
+            print(f"{'Scenario':<10}  {'median':>8}  {'min':>8}  {'budget':>8}")
+            for label, argv, multiplier in SCENARIOS:
+                samples = [_time_invocation(args.python, argv, env) for _ in range(args.runs)]
+                budget = args.budget_ms * multiplier
+                median = statistics.median(samples)
+                status = "ok" if median <= budget else "OVER"
+                failures += status != "ok"
+                print(f"{label:<10}  {median:6.1f}ms  {min(samples):6.1f}ms  {budget:6.0f}ms  {status}")
+        finally:
+            if daemon is not None:
+                daemon.terminate()
+                daemon.wait()
+
+    leaked = subprocess.run(
+        [args.python, "-c", IMPORT_PROBE], capture_output=True, text=True, check=True
+    ).stdout.split()
+    if leaked:
+        failures += 1
+        print(f"hook-run/help paths imported lazy modules: {', '.join(leaked)}")
+    else:
+        print("hook-run/help path imports: ok")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the ``pm`` sync, unsync, tmux and llm-sync paths.
+
+Builds a synthetic repository (see ``synthetic_repo.py``), times the core
+operations against private copies of it, prints a table and optionally
+writes the results as JSON. ``--compare`` checks a run against an earlier
+JSON file and exits non-zero when a benchmark regressed beyond the threshold.
+Each benchmark also gets one untimed run under the ``--timings`` tracer, so
+results include filesystem syscall counts (stat, readlink, scandir, ...).
+
+    python tools/benchmarks/suite.py --profile medium --output baseline.json
+    python tools/benchmarks/suite.py --profile medium --compare baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable
+
+from synthetic_repo import PROFILES, generate_repo
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(TOOLS_DIR))
+
+import project_manager_core as core  # noqa: E402
+from project_manager_trace import Tracer  # noqa: E402
+from project_manager_tmux import TmuxWindow, _render_tmux_script  # noqa: E402
+
+RESULTS_VERSION = 1
+ALIAS_NAMES = ["CLAUDE.md", "CODEX.md", "COPILOT.md", "GEMINI.md", "AGENTS.md"]
+CANONICAL = "AGENTS.md"
+# Regressions smaller than this are treated as timer noise.
+NOISE_FLOOR_MS = 1.0
+
+
+class Suite:
+    def __init__(self, scratch: Path, template: Path, runs: int, only: list[str]) -> None:
+        self.scratch = scratch
+        self.template = template
+        self.runs = runs
+        self.only = only
+        self.results: dict[str, dict] = {}
+        self._copies = 0
+
+    def fresh_copy(self) -> Path:
+        """Copy the pristine template (untimed) so mutating benchmarks start equal."""
+
+        self._copies += 1
+        destination = self.scratch / f"copy{self._copies}"
+        shutil.copytree(self.template, destination, symlinks=True)
+        return destination
+
+    def config(self, repo: Path, dry_run: bool, discovery: str = "git") -> core.SyncConfig:
+        return core.SyncConfig(
+            repo_path=repo,
+            canonical_name=CANONICAL,
+            alias_names=list(ALIAS_NAMES),
+            branch=None,
+            dry_run=dry_run,
+            graveyard_root=self.scratch / "graveyard",
+            discovery=discovery,
+        )
+
+    def _discard(self, state: object) -> None:
+        if isinstance(state, Path) and state.parent == self.scratch:
+            shutil.rmtree(state)
+
+    def count_syscalls(self, func: Callable[[object], object], setup: Callable[[], object]) -> dict[str, int]:
+        """Run ``func(setup())`` once under the tracer and return its syscall counts."""
+
+        state = setup()
+        tracer = Tracer("bench")
+        tracer.install()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                func(state)
+        finally:
+            tracer.uninstall()
+        self._discard(state)
+        return dict(sorted(tracer.counts.items()))
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[object], object],
+        setup: Callable[[], object] = lambda: None,
+        inner: int = 1,
+    ) -> None:
+        """Time ``func(setup())`` ``runs`` times; only ``func`` is on the clock."""
+
+        if self.only and not any(pattern in name for pattern in self.only):
+            return
+        samples = []
+        for _ in range(self.runs):
+            state = setup()
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                for _ in range(inner):
+                    func(state)
+                samples.append((time.perf_counter() - started) * 1000 / inner)
+            self._discard(state)
+        syscalls = self.count_syscalls(func, setup)
+        self.results[name] = {
+            "median_ms": statistics.median(samples),
+            "min_ms": min(samples),
+            "max_ms": max(samples),
+            "runs": len(samples),
+            "inner": inner,
+            "samples_ms": samples,
+            "syscalls": syscalls,
+        }
+        print(
+            f"{name:<28}  {statistics.median(samples):9.2f}ms  {min(samples):9.2f}ms  {sum(syscalls.values()):8}",
+            flush=True,
+        )
+
+
+def _backdate(root: Path) -> None:
+    """Age every path under ``root`` past the racy-mtime window.
+
+    A freshly generated tree has every directory mtime inside
+    ``RACY_MTIME_WINDOW_NS``, so the discovery cache would refuse to trust any
+    of them and the warm run would rescan everything like the cold one.
+    """
+
+    past = time.time_ns() - core.RACY_MTIME_WINDOW_NS - 60 * 10**9
+    for current, dirs, files in os.walk(root, topdown=False):
+        for name in (*files, *dirs):
+            os.utime(os.path.join(current, name), ns=(past, past), follow_symlinks=False)
+    os.utime(root, ns=(past, past))
+
+
+def _warm_cache_missed(results: dict) -> bool:
+    """Return True if the warm discovery run made no fewer syscalls than the cold one."""
+
+    cold = results.get("gather/filesystem-cold")
+    warm = results.get("gather/filesystem-warm")
+    if cold is None or warm is None:
+        return False
+    return sum(warm["syscalls"].values()) >= sum(cold["syscalls"].values())
+
+
+def _clear_discovery_cache() -> None:
+    shutil.rmtree(core.DISCOVERY_CACHE_ROOT, ignore_errors=True)
+
+
+def _applied_copy(suite: Suite) -> Path:
+    repo = suite.fresh_copy()
+    with contextlib.redirect_stdout(io.StringIO()):
+        core.process_alias_files(suite.config(repo, dry_run=False))
+    return repo
+
+
+def _llm_sync_copy(suite: Suite) -> Path:
+    repo = suite.fresh_copy()
+    (repo / core.LLM_SYNC_CONFIG_NAME).write_text("claude\n", encoding="utf-8")
+    (repo / "CLAUDE.md").write_text("# Canonical context\n" * 50, encoding="utf-8")
+    return repo
+
+
+def run_suite(suite: Suite) -> None:
+    template = suite.template
+    names = [*ALIAS_NAMES]
+
+    suite.measure("gather/git", lambda _: core._gather_named_files(template, names, "git"))
+    suite.measure(
+        "gather/filesystem-cold",
+        lambda _: core._gather_named_files(template, names, "filesystem"),
+        setup=_clear_discovery_cache,
+    )
+    core._gather_named_files(template, names, "filesystem")
+    suite.measure("gather/filesystem-warm", lambda _: core._gather_named_files(template, names, "filesystem"))
+
+    suite.measure("sync/preview", lambda _: core.process_alias_files(suite.config(template, dry_run=True)))
+    suite.measure(
+        "sync/apply",
+        lambda repo: core.process_alias_files(suite.config(repo, dry_run=False)),
+        setup=suite.fresh_copy,
+    )
+    suite.measure(
+        "unsync/apply",
+        lambda repo: core.remove_alias_symlinks(repo, ALIAS_NAMES, dry_run=False, canonical_name=CANONICAL),
+        setup=lambda: _applied_copy(suite),
+    )
+
+    windows = [
+        TmuxWindow(name=f"win{index}", path=template / f"src/pkg{index}", commands=["git status", f"nvim file{index}.py"])
+        for index in range(12)
+    ]
+    suite.measure(
+        "tmux/render",
+        lambda _: _render_tmux_script("bench", template, windows, ensure_python_venv=True),
+        inner=200,
+    )
+
+    env = {**os.environ, "LLM_GRAVEYARD_ROOT": str(suite.scratch / "graveyard")}
+    script = str(TOOLS_DIR / "llm-sync.sh")
+    suite.measure(
+        "llm-sync/shell",
+        lambda repo: subprocess.run(
+            ["bash", script, "--repo", str(repo)], env=env, stdout=subprocess.DEVNULL, check=True
+        ),
+        setup=lambda: _llm_sync_copy(suite),
+    )
+    os.environ["LLM_GRAVEYARD_ROOT"] = env["LLM_GRAVEYARD_ROOT"]
+    suite.measure(
+        "llm-sync/in-process",
+        lambda repo: core.run_llm_sync(repo, dry_run=False),
+        setup=lambda: _llm_sync_copy(suite),
+    )
+
+
+def compare(results: dict, meta: dict, baseline_path: Path, threshold: float) -> int:
+    payload = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline = payload["results"]
+    for key in ("shape", "seed", "python"):
+        if payload["meta"].get(key) != meta[key]:
+            print(f"warning: baseline {key} differs ({payload['meta'].get(key)} vs {meta[key]})")
+    regressions = 0
+    print(f"\n{'Benchmark':<28}  {'baseline':>10}  {'now':>10}  change   syscalls")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else 1.0
+        regressed = ratio > threshold and result["median_ms"] - before["median_ms"] > NOISE_FLOOR_MS
+        regressions += regressed
+        # Baselines written before syscall counting have no counts.
+        calls = f"{sum(before['syscalls'].values())} -> " if "syscalls" in before else ""
+        print(
+            f"{name:<28}  {before['median_ms']:8.2f}ms  {result['median_ms']:8.2f}ms  "
+            f"{(ratio - 1) * 100:+6.1f}%  {calls}{sum(result['syscalls'].values())}"
+            f"{'  REGRESSED' if regressed else ''}"
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="medium", help="Synthetic repo size (default: medium).")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0).")
+    parser.add_argument("--runs", type=int, default=5, help="Samples per benchmark (default: 5).")
+    parser.add_argument("--only", action="append", default=[], help="Run benchmarks whose name contains this (repeatable).")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON from an earlier --output run.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Median slowdown ratio counted as a regression with --compare (default: 1.25).",
+    )
+    args = parser.parse_args()
+
+    shape = PROFILES[args.profile]
+    with tempfile.TemporaryDirectory(prefix="pm-suite-") as scratch_dir:
+        scratch = Path(scratch_dir)
+        # Keep discovery caches and graveyard writes out of the real home.
+        core.DISCOVERY_CACHE_ROOT = scratch / "discovery-cache"
+        template = scratch / "template"
+        started = time.perf_counter()
+        generate_repo(template, shape, args.seed)
+        _backdate(template)
+        print(f"Generated {args.profile} repo in {time.perf_counter() - started:.1f}s\n")
+        print(f"{'Benchmark':<28}  {'median':>11}  {'min':>11}  {'syscalls':>8}")
+        suite = Suite(scratch, template, args.runs, args.only)
+        run_suite(suite)
+
+    if _warm_cache_missed(suite.results):
+        print("\nerror: gather/filesystem-warm made no fewer syscalls than the cold run; the discovery cache missed")
+        return 1
+
+    payload = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "profile": args.profile,
+            "shape": asdict(shape),
+            "seed": args.seed,
+            "runs": args.runs,
+        },
+        "results": suite.results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"\nWrote {args.output}")
+    if args.compare:
+        return 1 if compare(suite.results, payload["meta"], args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
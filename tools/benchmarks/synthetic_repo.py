@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Generate synthetic repositories for the ``pm`` benchmarks.
+
+Trees are deterministic for a given profile and seed: deep directory chains,
+thousands of directories, nested sub-projects with their own ``node_modules``
+and ``.venv``, a gitignored ``data/`` tree, and assistant files (AGENTS.md, CLAUDE.md, GEMINI.md) scattered
+so that sync has symlinks to create, files to promote and aliases to back up.
+
+    python tools/benchmarks/synthetic_repo.py /tmp/pm-bench-repo --profile large
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class RepoShape:
+    directories: int
+    max_depth: int
+    fanout: int
+    files_per_dir: int
+    # Share of directories that receive assistant files.
+    assistant_ratio: float
+    # Sub-projects placed at random directories: package.json + node_modules,
+    # pyproject.toml + .venv, renv.lock + renv/library. Like a Django app with
+    # a frontend in a subfolder, the root itself is only a Python project.
+    node_projects: int
+    python_projects: int
+    r_projects: int
+    packages_per_env: int
+    # Directories under the gitignored data/ tree (run outputs and caches).
+    data_dirs: int
+    # Extra single-child chain hanging off the root, to exercise deep walks.
+    deep_chain: int
+
+
+PROFILES = {
+    "small": RepoShape(200, 6, 4, 2, 0.10, 2, 1, 1, 10, 50, 20),
+    "medium": RepoShape(2_000, 10, 6, 3, 0.05, 6, 3, 2, 25, 1_000, 40),
+    "large": RepoShape(10_000, 14, 8, 3, 0.03, 15, 8, 4, 40, 5_000, 80),
+}
+ASSISTANT_LAYOUTS = (
+    ("AGENTS.md",),
+    ("AGENTS.md", "CLAUDE.md"),
+    ("CLAUDE.md",),
+    ("AGENTS.md", "GEMINI.md"),
+    ("GEMINI.md",),
+)
+GITIGNORE = "node_modules/\n.venv/\n__pycache__/\nrenv/library/\n/data/\n"
+
+
+@dataclass
+class RepoStats:
+    directories: int = 0
+    files: int = 0
+    assistant_files: int = 0
+    dependency_dirs: int = 0
+
+
+def _write(path: Path, text: str, stats: RepoStats) -> None:
+    path.write_text(text, encoding="utf-8")
+    stats.files += 1
+
+
+def _mkdir(path: Path, stats: RepoStats) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    stats.directories += 1
+    return path
+
+
+def _plain_tree(root: Path, shape: RepoShape, rng: random.Random, stats: RepoStats) -> list[Path]:
+    """Breadth-first tree of ``shape.directories`` directories plus a deep chain."""
+
+    created = [root]
+    frontier = [(root, 0)]
+    while frontier and len(created) < shape.directories:
+        parent, depth = frontier.pop(0)
+        if depth >= shape.max_depth:
+            continue
+        for index in range(rng.randint(1, shape.fanout)):
+            if len(created) >= shape.directories:
+                break
+            child = _mkdir(parent / f"d{depth + 1}_{index}", stats)
+            created.append(child)
+            frontier.append((child, depth + 1))
+    chain = root / "deep"
+    for level in range(shape.deep_chain):
+        chain = _mkdir(chain / f"level{level}", stats)
+        created.append(chain)
+    for directory in created:
+        for index in range(shape.files_per_dir):
+            _write(directory / f"file{index}.txt", f"{directory.name} {index}\n", stats)
+    return created
+
+
+def _assistant_files(directories: list[Path], shape: RepoShape, rng: random.Random, stats: RepoStats) -> None:
+    count = max(1, int(len(directories) * shape.assistant_ratio))
+    for directory in [directories[0], *rng.sample(directories[1:], min(count, len(directories) - 1))]:
+        for name in rng.choice(ASSISTANT_LAYOUTS):
+            _write(directory / name, f"# {name} for {directory.name}\n", stats)
+            stats.assistant_files += 1
+
+
+def _dependency_env(env_root: Path, packages: int, stats: RepoStats, nested: bool) -> None:
+    """Fill a node_modules or site-packages directory with packages that carry their own docs."""
+
+    for index in range(packages):
+        package = _mkdir(env_root / f"pkg{index}", stats)
+        stats.dependency_dirs += 1
+        _write(package / "index.js", "module.exports = {};\n", stats)
+        _write(package / "README.md", f"pkg{index}\n", stats)
+        if index % 5 == 0:
+            # Vendored agent docs that sync must never touch.
+            _write(package / "CLAUDE.md", "vendored\n", stats)
+        if nested and index % 4 == 0:
+            _dependency_env(_mkdir(package / "node_modules", stats), 3, stats, nested=False)
+
+
+def _sub_projects(root: Path, directories: list[Path], shape: RepoShape, rng: random.Random, stats: RepoStats) -> None:
+    wanted = shape.node_projects + shape.python_projects + shape.r_projects
+    hosts = rng.sample(directories[1:], min(len(directories) - 1, wanted))
+    node_hosts = hosts[: shape.node_projects]
+    python_hosts = [root, *hosts[shape.node_projects : shape.node_projects + shape.python_projects]]
+    r_hosts = hosts[shape.node_projects + shape.python_projects :]
+    for host in node_hosts:
+        _write(host / "package.json", json.dumps({"name": host.name, "version": "1.0.0"}) + "\n", stats)
+        _dependency_env(_mkdir(host / "node_modules", stats), shape.packages_per_env, stats, nested=True)
+    for host in python_hosts:
+        _write(host / "pyproject.toml", f'[project]\nname = "{host.name}"\n', stats)
+        site_packages = host / ".venv" / "lib" / "python3.11" / "site-packages"
+        _dependency_env(_mkdir(site_packages, stats), shape.packages_per_env, stats, nested=False)
+    for host in r_hosts:
+        _write(host / "renv.lock", '{"R": {"Version": "4.4.1"}}\n', stats)
+        _write(_mkdir(host / "renv", stats) / "activate.R", "local({})\n", stats)
+        library = host / "renv" / "library" / "macos" / "R-4.4" / "aarch64-apple-darwin20"
+        _dependency_env(_mkdir(library, stats), shape.packages_per_env, stats, nested=False)
+
+
+def _data_tree(root: Path, shape: RepoShape, stats: RepoStats) -> None:
+    """Ignored experiment outputs, including the odd copied-in agent doc."""
+
+    for index in range(shape.data_dirs):
+        run = _mkdir(root / "data" / f"run{index // 50}" / f"step{index % 50}", stats)
+        _write(run / "metrics.json", "{}\n", stats)
+        if index % 25 == 0:
+            _write(run / "CLAUDE.md", "snapshot\n", stats)
+
+
+def generate_repo(root: Path, shape: RepoShape, seed: int = 0, git: bool = True) -> RepoStats:
+    """Create a synthetic repository at ``root`` (which must not exist yet)."""
+
+    rng = random.Random(seed)
+    stats = RepoStats()
+    _mkdir(root, stats)
+    directories = _plain_tree(root, shape, rng, stats)
+    _assistant_files(directories, shape, rng, stats)
+    _sub_projects(root, directories, shape, rng, stats)
+    _data_tree(root, shape, stats)
+    _write(root / ".gitignore", GITIGNORE, stats)
+    if git:
+        for args in (
+            ["init", "-q"],
+            ["add", "-A"],
+            ["-c", "user.name=bench", "-c", "user.email=bench@example.invalid", "commit", "-qm", "synthetic"],
+        ):
+            subprocess.run(["git", "-C", str(root), *args], check=True, stdout=subprocess.DEVNULL)
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("destination", type=Path, help="Directory to create (must not exist).")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="medium", help="Tree size (default: medium).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0).")
+    parser.add_argument("--no-git", action="store_true", help="Do not initialise and commit a git repository.")
+    args = parser.parse_args()
+
+    if args.destination.exists():
+        parser.error(f"{args.destination} already exists")
+    stats = generate_repo(args.destination, PROFILES[args.profile], args.seed, git=not args.no_git)
+    print(
+        f"Created {args.destination}: {stats.directories} directories, {stats.files} files, "
+        f"{stats.assistant_files} assistant files, {stats.dependency_dirs} dependency packages"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,8 @@ Usage: $(basename "$0") [--repo PATH] [--dry-run] [--help]
 Synchronize LLM assistant context files so that the chosen canonical tool
 remains the single source of truth. Non-canonical files receive a generated
 warning header and copy of the canonical content. Backups of overwritten files
-are stored under ~/.local/share/project-manager/llm-graveyard/.
+are stored content-addressed under ~/.local/share/project-manager/llm-graveyard/
+and recorded in its index.jsonl.
 USAGE
 }
 
@@ -42,7 +43,7 @@ if [[ ! -d "$REPO" ]]; then
   exit 1
 fi
 
-REPO="$(cd "$REPO" && pwd)"
+REPO="$(cd "$REPO" && pwd -P)"
 CONFIG_FILE="$REPO/.canonical-llm-context"
 TOOLS=("claude" "codex" "copilot")
 EXTRA_FILES=("AGENTS.md")
@@ -56,14 +57,9 @@ file_for_tool() {
   esac
 }
 
-slug_repo() {
-  local path="$1"
-  path="${path#/}"
-  path="${path//\//-}"
-  path=$(printf '%s' "$path" | tr '[:upper:]' '[:lower:]')
-  path=$(printf '%s' "$path" | sed 's/[^a-z0-9-]/-/g; s/-\{2,\}/-/g; s/^-//; s/-$//')
-  [[ -z "$path" ]] && path="repo"
-  printf '%s' "$path"
+json_escape() {
+  local value="${1//\\/\\\\}"
+  printf '%s' "${value//\"/\\\"}"
 }
 
 relative_path() {
@@ -136,16 +132,19 @@ if [[ ! -f "$canonical_path" ]]; then
 fi
 
 GRAVEYARD_ROOT="${LLM_GRAVEYARD_ROOT:-$HOME/.local/share/project-manager/llm-graveyard}"
-GRAVEYARD_DIR="$GRAVEYARD_ROOT/$(slug_repo "$REPO")"
 if [[ $DRY_RUN -eq 1 ]]; then
-  echo "[DRY-RUN] Would ensure graveyard directory $GRAVEYARD_DIR"
+  echo "[DRY-RUN] Would ensure graveyard directory $GRAVEYARD_ROOT"
 else
-  mkdir -p "$GRAVEYARD_DIR"
+  mkdir -p "$GRAVEYARD_ROOT"
 fi
 
-timestamp=$(date -u "+%Y-%m-%d %H:%M:%SZ")
-timestamp_slug=$(date -u "+%Y%m%dT%H%M%SZ")
-warning="<!-- DO NOT EDIT. Generated from ${canonical_file} on ${timestamp} -->"
+content_hash() {
+  if command -v sha256sum >/dev/null 2>&1; then
+    sha256sum "$1" | cut -d ' ' -f 1
+  else
+    shasum -a 256 "$1" | cut -d ' ' -f 1
+  fi
+}
 
 remove_generated_header() {
   local file="$1"
@@ -179,25 +178,44 @@ remove_generated_header() {
   fi
 }
 
+# Take an exclusive flock on the lock file open as fd 9. flock locks belong to
+# the open file description, so the lock outlives the helper process and is
+# held until the enclosing subshell closes fd 9. This is the same lock `pm`
+# takes (_graveyard_lock), so `pm graveyard gc` cannot rewrite the index or
+# delete a blob mid-backup. macOS has no flock(1); use Python's there.
+lock_fd9() {
+  if command -v flock >/dev/null 2>&1; then
+    flock 9
+  else
+    python3 -c 'import fcntl; fcntl.flock(9, fcntl.LOCK_EX)'
+  fi
+}
+
+# Blobs are stored once per content hash; index.jsonl records every backup.
 backup_alias_file() {
   local src="$1"
   [[ ! -f "$src" ]] && return
   local rel="$(relative_path "$src")"
-  local base="${rel##*/}"
-  local ext="${base##*.}"
-  local slug=$(printf '%s' "$rel" | tr '[:upper:]' '[:lower:]')
-  slug=$(printf '%s' "$slug" | sed 's/[^a-z0-9]/-/g; s/-\{2,\}/-/g; s/^-//; s/-$//')
-  [[ -z "$slug" ]] && slug="file"
-  local dest="$GRAVEYARD_DIR/${slug}-${timestamp_slug}"
-  if [[ "$ext" != "$base" ]]; then
-    dest="${dest}.${ext}"
-  fi
   if [[ $DRY_RUN -eq 1 ]]; then
-    echo "[DRY-RUN] Would backup $rel to $dest"
-  else
-    mkdir -p "$(dirname "$dest")"
-    cp "$src" "$dest"
+    echo "[DRY-RUN] Would backup $rel to $GRAVEYARD_ROOT"
+    return
   fi
+  local hash
+  hash=$(content_hash "$src")
+  local blob="$GRAVEYARD_ROOT/objects/${hash:0:2}/$hash"
+  mkdir -p "$GRAVEYARD_ROOT"
+  (
+    lock_fd9
+    if [[ ! -f "$blob" ]]; then
+      mkdir -p "${blob%/*}"
+      cp "$src" "$blob.$$.tmp"
+      mv "$blob.$$.tmp" "$blob"
+    fi
+    local size=$(( $(wc -c < "$blob") ))
+    printf '{"hash":"%s","repo":"%s","path":"%s","created":%s,"size":%s}\n' \
+      "$hash" "$(json_escape "$REPO")" "$(json_escape "$rel")" "$(date +%s)" "$size" \
+      >> "$GRAVEYARD_ROOT/index.jsonl"
+  ) 9>>"$GRAVEYARD_ROOT/index.lock"
 }
 
 relative_targets=()
@@ -223,6 +241,15 @@ done
 
 remove_generated_header "$canonical_path"
 canonical_content=$(cat "$canonical_path")
+# The header only depends on the canonical content, so re-rendering an
+# unchanged canonical file produces byte-identical alias files.
+canonical_hash=$(content_hash "$canonical_path")
+warning="<!-- DO NOT EDIT. Generated from ${canonical_file} (sha256:${canonical_hash:0:16}) -->"
+
+render_alias() {
+  printf '%s\n\n' "$warning"
+  printf '%s\n' "$canonical_content"
+}
 
 for target in "${clean_targets[@]}"; do
   if [[ "$target" == "$canonical_file" ]]; then
@@ -230,26 +257,19 @@ for target in "${clean_targets[@]}"; do
   fi
   target_path="$REPO/$target"
   target_rel="$(relative_path "$target_path")"
-  tmp=$(mktemp)
-  {
-    printf '%s\n\n' "$warning"
-    printf '%s\n' "$canonical_content"
-  } > "$tmp"
 
-  if [[ -f "$target_path" ]]; then
-    if cmp -s "$tmp" "$target_path"; then
-      rm -f "$tmp"
-      continue
-    fi
+  if [[ -f "$target_path" ]] && render_alias | cmp -s - "$target_path"; then
+    continue
   fi
 
   if [[ $DRY_RUN -eq 1 ]]; then
     echo "[DRY-RUN] Would update $target_rel"
-    rm -f "$tmp"
   else
     if [[ -f "$target_path" ]]; then
       backup_alias_file "$target_path"
     fi
+    tmp=$(mktemp)
+    render_alias > "$tmp"
     mkdir -p "$(dirname "$target_path")"
     mv "$tmp" "$target_path"
     echo "SYNCED_FILE: $target_rel"
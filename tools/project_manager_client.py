@@ -0,0 +1,127 @@
+"""Client side of ``pm serve``: forward one invocation to the warm daemon.
+
+Only standard-library modules that the interpreter has mostly loaded already
+are imported here, so the cost of trying the daemon is a ``connect`` call.
+The caller's stdin, stdout and stderr are handed to the daemon over the Unix
+socket (``SCM_RIGHTS``); the forked handler writes straight to the caller's
+terminal, so colours, prompts and pipes behave exactly as in-process.
+"""
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+
+SOCKET_ENV = "PM_SOCKET"
+DISABLE_ENV = "PM_NO_DAEMON"
+# Commands that must never be forwarded: the daemon itself.
+LOCAL_COMMANDS = ("serve",)
+# Modules whose code the daemon has loaded; editing any of them makes a
+# running daemon stale, and it steps aside instead of serving old code.
+SERVED_MODULES = (
+    "project_manager_client.py",
+    "project_manager_complete.py",
+    "project_manager_core.py",
+    "project_manager_ignore.py",
+    "project_manager_serve.py",
+    "project_manager_tmux.py",
+)
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def socket_path() -> str:
+    """Return the daemon socket path (``$PM_SOCKET``, else a per-user runtime location)."""
+
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return override
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "project-manager", "pm.sock")
+    return os.path.join(os.path.expanduser("~"), ".local", "share", "project-manager", "pm.sock")
+
+
+def code_signature() -> list:
+    """Identify the code on disk by the mtimes of the served modules."""
+
+    signature = []
+    for name in SERVED_MODULES:
+        try:
+            signature.append([name, os.stat(os.path.join(TOOLS_DIR, name)).st_mtime_ns])
+        except OSError:
+            signature.append([name, None])
+    return signature
+
+
+def connect(path: str | None = None) -> socket.socket | None:
+    """Connect to a running daemon, or return ``None`` if none is listening."""
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path or socket_path())
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run ``argv`` in the daemon and return its exit status.
+
+    Returns ``None`` when the invocation should run in-process instead: no
+    daemon is listening, it is disabled via ``$PM_NO_DAEMON``, or the daemon
+    declined because its code is stale. Once the daemon has accepted the
+    request the command is never retried locally, so nothing runs twice.
+    A handler may end by asking for a program that needs the terminal
+    (``tmux attach``); this process then execs it and does not return.
+    """
+
+    if os.environ.get(DISABLE_ENV) or (argv and argv[0] in LOCAL_COMMANDS):
+        return None
+    client = connect()
+    if client is None:
+        return None
+    with client:
+        request = {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "signature": code_signature(),
+        }
+        payload = json.dumps(request).encode("utf-8") + b"\n"
+        reader = client.makefile("rb")
+        try:
+            if socket.send_fds(client, [payload], [0, 1, 2]) != len(payload):
+                return None
+            reply = json.loads(reader.readline() or b"null")
+        except (OSError, ValueError):
+            return None
+        if not isinstance(reply, dict) or "pid" not in reply:
+            return None
+
+        # Ctrl-C reaches this process, not the handler; pass it on and keep
+        # waiting so the handler can report how it exited.
+        while True:
+            try:
+                line = reader.readline()
+                break
+            except KeyboardInterrupt:
+                try:
+                    os.kill(reply["pid"], signal.SIGINT)
+                except OSError:
+                    return 130
+        try:
+            reply = json.loads(line)
+            argv = reply.get("exec")
+            if argv is None:
+                return int(reply["exit"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return 1
+    # The handler built everything but left the final exec (tmux attach) to
+    # this process, which still owns the terminal's session and job control.
+    try:
+        os.execvp(argv[0], argv)
+    except OSError as exc:
+        os.write(2, f"pm: cannot run {argv[0]}: {exc}\n".encode())
+        return 127
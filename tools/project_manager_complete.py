@@ -0,0 +1,142 @@
+"""Fast path for shell completion of session, repo and workspace names.
+
+Importing click and the command modules costs more than a TAB can afford, so
+the entry script tries this module first. It imports only ``json`` and
+``shlex``, answers the common cases straight from the completion index that
+``project_manager_core.completion_index`` maintains, and declines (returns
+``False``) whenever the index is stale or the words are anything it does not
+recognise, in which case click completes as usual.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import sys
+
+COMPLETION_INDEX = os.path.join(
+    os.path.expanduser("~"), ".local", "share", "project-manager", "completion-index.json"
+)
+COMPLETION_INDEX_VERSION = 1
+# (command path, option) -> completion index key for option values.
+OPTION_SOURCES = {
+    **{
+        (("llm:agents", command), "--repo"): "repos"
+        for command in ("sync", "unsync", "install-hook", "hook-run", "remove-hook")
+    },
+    (("graveyard", "list"), "--repo"): "repos",
+    (("graveyard", "restore"), "--repo"): "repos",
+    (("workspace",), "--name"): "workspaces",
+    (("tmux", "scaffold"), "--session"): "sessions",
+    (("tmux", "add-tab"), "--session"): "sessions",
+}
+# Command path -> whether its session-name argument takes several values.
+ARGUMENT_SESSIONS = {
+    ("tmux", "up"): False,
+    ("tmux", "render"): False,
+    ("tmux", "compile"): True,
+    ("tmux", "import"): True,
+}
+
+
+def _split_words(text: str) -> list[str]:
+    # Same as click.shell_completion.split_arg_string: keep a partial last word.
+    lex = shlex.shlex(text, posix=True)
+    lex.whitespace_split = True
+    lex.commenters = ""
+    words: list[str] = []
+    try:
+        words.extend(lex)
+    except ValueError:
+        words.append(lex.token)
+    return words
+
+
+def _completion_args(shell: str) -> tuple[list[str], str]:
+    words = _split_words(os.environ["COMP_WORDS"])
+    if shell == "fish":
+        incomplete = os.environ["COMP_CWORD"]
+        if incomplete:
+            incomplete = _split_words(incomplete)[0]
+        args = words[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+    cword = int(os.environ["COMP_CWORD"])
+    return words[1:cword], words[cword] if cword < len(words) else ""
+
+
+def _source_for(args: list[str]) -> str | None:
+    """Return the index key to complete from, mirroring how click resolves the parameter."""
+
+    for (path, option), source in OPTION_SOURCES.items():
+        if len(args) > len(path) and args[: len(path)] == list(path) and args[-1] == option:
+            return source
+    for path, multiple in ARGUMENT_SESSIONS.items():
+        if args[: len(path)] != list(path):
+            continue
+        rest = args[len(path) :]
+        if not rest or (multiple and not any(word.startswith("-") for word in rest)):
+            return "sessions"
+    return None
+
+
+def _load_index() -> dict | None:
+    try:
+        with open(COMPLETION_INDEX, "rb") as handle:
+            index = json.load(handle)
+        if index.get("version") != COMPLETION_INDEX_VERSION:
+            return None
+        for path, mtime in index["sources"].items():
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                return None
+        return index
+    except (OSError, ValueError, AttributeError, KeyError):
+        return None
+
+
+def _candidates(source: str, names: list[str], incomplete: str) -> list[tuple[str, str]]:
+    if source != "repos":
+        return [("plain", name) for name in names if name.startswith(incomplete)]
+    # Mirrors project_manager_core._complete_repo.
+    home = os.path.expanduser("~")
+    expanded = os.path.expanduser(incomplete)
+    matches = []
+    for repo in names:
+        if repo.startswith(expanded):
+            shown = "~" + repo[len(home) :] if incomplete.startswith("~") and repo.startswith(home) else repo
+            matches.append(("plain", shown))
+    return matches or [("dir", incomplete)]
+
+
+def complete(instruction: str) -> bool:
+    """Print completions for ``instruction`` (e.g. ``zsh_complete``) if the fast path applies."""
+
+    shell, _, action = instruction.partition("_")
+    if action != "complete" or shell not in ("bash", "zsh", "fish"):
+        return False
+    try:
+        args, incomplete = _completion_args(shell)
+    except (KeyError, ValueError):
+        return False
+    if incomplete.startswith("-") or "=" in incomplete or "--" in args:
+        return False
+    source = _source_for(args)
+    if source is None:
+        return False
+    index = _load_index()
+    if index is None:
+        return False
+
+    items = _candidates(source, index[source], incomplete)
+    if shell == "zsh":
+        lines = [f"{kind}\n{value}\n_" for kind, value in items]
+    else:
+        lines = [f"{kind},{value}" for kind, value in items]
+    sys.stdout.buffer.write(("\n".join(lines) + "\n").encode())
+    sys.stdout.flush()
+    return True
@@ -0,0 +1,2716 @@
+"""Project Manager CLI for personal repository maintenance tasks.
+
+Run through ``project_manager.py``; this module holds the implementation so
+its bytecode is cached between invocations.
+"""
+from __future__ import annotations
+
+import copy
+import errno
+import fcntl
+import hashlib
+import importlib
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+try:
+    import click
+except ModuleNotFoundError as exc:  # pragma: no cover - dependency guard
+    raise SystemExit("The 'click' package is required. Install it with `pip install click`.") from exc
+
+import project_manager_complete
+
+DEFAULT_CANONICAL_NAME = "AGENTS.md"
+DEFAULT_ALIAS_NAMES = ("CLAUDE.md", "CODEX.md", "COPILOT.md", "GEMINI.md", "AGENTS.md")
+GRAVEYARD_DIRNAME = ".llm-graveyard"
+GRAVEYARD_OBJECTS_DIRNAME = "objects"
+GRAVEYARD_INDEX_NAME = "index.jsonl"
+GRAVEYARD_LOCK_NAME = "index.lock"
+DEFAULT_GRAVEYARD_RETENTION = {
+    "max_bytes": 512 * 1024 * 1024,
+    "max_age_days": 180,
+    "keep_per_repo": 200,
+    "auto": False,
+}
+DEFAULT_GRAVEYARD_ROOT = Path.home() / ".local" / "share" / "project-manager" / "llm-graveyard"
+DISCOVERY_CACHE_ROOT = Path.home() / ".local" / "share" / "project-manager" / "discovery-cache"
+DISCOVERY_CACHE_VERSION = 3
+COMPLETION_INDEX = Path(project_manager_complete.COMPLETION_INDEX)
+COMPLETION_INDEX_VERSION = project_manager_complete.COMPLETION_INDEX_VERSION
+# Paths modified this close to a scan may change again within the same mtime
+# tick, so cached state for them is never trusted on the next run.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+PROJECTS_ROOT = Path.home() / "code" / "projects"
+TMUX_DIR = PROJECTS_ROOT / "tmux"
+TMUX_SPEC_DIR = TMUX_DIR / "sessions"
+DIR_MAP_FILE = PROJECTS_ROOT / "vscode" / "dir_map.sh"
+ALIASES_FILE = Path.home() / "code" / "dotfiles" / "config" / ".aliases"
+CONFIG_PATH = Path.home() / ".config" / "project-manager" / "settings.json"
+LLM_SYNC_SCRIPT = Path(__file__).resolve().parent / "llm-sync.sh"
+PM_ENTRY_SCRIPT = Path(__file__).resolve().parent / "project_manager.py"
+HOOK_SIGNATURE = "# llm-sync hook installed by project-manager"
+HOOK_ENGINES = ("python", "shell")
+LLM_SYNC_CONFIG_NAME = ".canonical-llm-context"
+LLM_SYNC_TOOL_FILES = {"claude": "CLAUDE.md", "codex": "CODEX.md", "copilot": "COPILOT.md"}
+LLM_SYNC_EXTRA_FILES = ("AGENTS.md",)
+GENERATED_HEADER_PREFIX = "<!-- DO NOT EDIT."
+LLM_SYNC_FINGERPRINT_NAME = "llm-sync-fingerprint.json"
+DISCOVERY_BACKENDS = ("git", "filesystem")
+DEFAULT_DISCOVERY = "git"
+
+
+class ProjectManagerError(click.ClickException):
+    """Raised when a CLI operation encounters an unrecoverable error."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+@dataclass
+class SyncConfig:
+    repo_path: Path
+    canonical_name: str
+    alias_names: List[str]
+    branch: str | None
+    dry_run: bool
+    graveyard_root: Path
+    discovery: str = DEFAULT_DISCOVERY
+
+
+
+
+# Installed by project_manager_trace when --timings or --trace-json is given.
+_TRACER = None
+
+
+@contextmanager
+def _trace_span(name: str, **args) -> Iterator[None]:
+    """Record ``name`` as a timed phase when tracing is on; free otherwise."""
+
+    if _TRACER is None:
+        yield
+        return
+    with _TRACER.span(name, args):
+        yield
+
+
+_JSON_FILE_CACHE: dict[Path, tuple[tuple[int, int, int], object]] = {}
+
+
+def _load_json_cached(path: Path, *, copied: bool = True):
+    """Parse ``path`` as JSON, reusing the previous parse while its stat is unchanged.
+
+    A one-shot CLI run gains little from this, but ``pm serve`` keeps the memo
+    alive so forked request handlers start with settings and caches parsed.
+    Files modified within ``RACY_MTIME_WINDOW_NS`` are never memoised. Pass
+    ``copied=False`` only when the caller will not mutate the result.
+    """
+
+    info = path.stat()
+    key = (info.st_mtime_ns, info.st_size, info.st_ino)
+    cached = _JSON_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        payload = cached[1]
+    else:
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if info.st_mtime_ns < time.time_ns() - RACY_MTIME_WINDOW_NS:
+            _JSON_FILE_CACHE[path] = (key, payload)
+        else:
+            _JSON_FILE_CACHE.pop(path, None)
+    return copy.deepcopy(payload) if copied else payload
+
+
+def _load_settings() -> dict:
+    try:
+        return _load_json_cached(CONFIG_PATH)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_settings(settings: dict) -> None:
+    CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with CONFIG_PATH.open("w", encoding="utf-8") as handle:
+        json.dump(settings, handle, indent=2, sort_keys=True)
+
+
+def _llm_settings() -> dict:
+    settings = _load_settings()
+    llm_settings = settings.setdefault("llm_agents", {})
+    return settings, llm_settings
+
+
+def _slugify_path(path: Path) -> str:
+    normalized = path.expanduser().resolve()
+    parts = [p for p in normalized.parts if p not in {"", os.sep}]
+    slug = "-".join(
+        re.sub(r"[^A-Za-z0-9]+", "-", part).strip("-").lower() or "segment"
+        for part in parts
+    )
+    return slug or "repo"
+
+
+def _ensure_llm_sync_script() -> Path:
+    script_path = LLM_SYNC_SCRIPT.resolve()
+    if not script_path.exists():
+        raise ProjectManagerError(f"llm-sync script not found at {script_path}")
+    if not os.access(script_path, os.X_OK):
+        raise ProjectManagerError(
+            f"llm-sync script is not executable: {script_path}"
+        )
+    return script_path
+
+
+def run_git_command(repo: Path, args: List[str]) -> subprocess.CompletedProcess[str]:
+    with _trace_span("git", command=" ".join(args)):
+        completed = subprocess.run(
+            ["git", "-C", str(repo), *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+    if completed.returncode != 0:
+        raise ProjectManagerError(
+            f"git {' '.join(args)} failed with exit code {completed.returncode}: {completed.stderr.strip()}"
+        )
+    return completed
+
+
+def ensure_git_repo(repo: Path) -> None:
+    completed = run_git_command(repo, ["rev-parse", "--is-inside-work-tree"])
+    if completed.stdout.strip() != "true":
+        raise ProjectManagerError(f"{repo} is not a git work tree")
+
+
+def ensure_clean_worktree(repo: Path) -> None:
+    status = run_git_command(repo, ["status", "--porcelain"])
+    if status.stdout.strip():
+        raise ProjectManagerError(
+            "Repository has uncommitted changes. Please commit or stash before running sync."
+        )
+
+
+def checkout_branch(repo: Path, branch: str, dry_run: bool) -> None:
+    if dry_run:
+        click.echo(f"[DRY-RUN] Would checkout branch '{branch}' in {repo}")
+        return
+    run_git_command(repo, ["checkout", branch])
+
+
+def ensure_graveyard(path: Path, dry_run: bool) -> Path:
+    if dry_run:
+        click.echo(f"[DRY-RUN] Would ensure graveyard directory {path}")
+    else:
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def ensure_gitignore(repo: Path, graveyard: Path, dry_run: bool) -> None:
+    try:
+        relative_path = graveyard.relative_to(repo)
+    except ValueError:
+        return
+
+    gitignore = repo / ".gitignore"
+    entry = f"{relative_path.as_posix()}/"
+    existing_text = ""
+    if gitignore.exists():
+        existing_text = gitignore.read_text(encoding="utf-8")
+        existing_lines = [line.strip() for line in existing_text.splitlines()]
+        if entry in existing_lines:
+            return
+    if dry_run:
+        action = "append" if gitignore.exists() else "create"
+        click.echo(f"[DRY-RUN] Would {action} {entry!r} to {gitignore}")
+        return
+    if gitignore.exists():
+        with gitignore.open("a", encoding="utf-8") as handle:
+            if existing_text and not existing_text.endswith("\n"):
+                handle.write("\n")
+            handle.write(f"{entry}\n")
+    else:
+        gitignore.write_text(f"{entry}\n", encoding="utf-8")
+
+
+@dataclass(frozen=True)
+class ProjectTypeRule:
+    """Directories to prune wherever one of ``markers`` sits in a directory.
+
+    A single-name ``prune`` entry (``node_modules``) is skipped at any depth
+    below the directory holding the marker; an entry with a slash
+    (``renv/library``) is skipped only at that path relative to it.
+    """
+
+    name: str
+    markers: tuple[str, ...]
+    prune: tuple[str, ...]
+
+
+# Checked in every directory during discovery, so a sub-project's dependency
+# and build trees are pruned before descent. Add an ecosystem with one line.
+PROJECT_TYPE_RULES: List[ProjectTypeRule] = [
+    ProjectTypeRule("php", ("composer.json",), ("vendor",)),
+    ProjectTypeRule("node", ("package.json",), ("node_modules",)),
+    ProjectTypeRule(
+        "python",
+        ("requirements.txt", "pyproject.toml", "setup.py", "Pipfile"),
+        (".venv", "venv", ".env"),
+    ),
+    ProjectTypeRule("rust", ("Cargo.toml",), ("target",)),
+    ProjectTypeRule("maven", ("pom.xml",), ("target",)),
+    ProjectTypeRule("go", ("go.mod",), ("vendor",)),
+    ProjectTypeRule("r", ("renv.lock",), ("renv/library", "renv/staging")),
+]
+# Pruned in every repository regardless of project type.
+ALWAYS_SKIP_DIRS = frozenset(
+    {".git", GRAVEYARD_DIRNAME, "dist", "build", "__pycache__", ".pytest_cache", ".tox"}
+)
+_EMPTY: frozenset[str] = frozenset()
+
+
+def _project_markers() -> frozenset[str]:
+    return frozenset(marker for rule in PROJECT_TYPE_RULES for marker in rule.markers)
+
+
+def _prune_rules_signature() -> dict:
+    return {
+        "always": sorted(ALWAYS_SKIP_DIRS),
+        "rules": [[rule.name, list(rule.markers), list(rule.prune)] for rule in PROJECT_TYPE_RULES],
+    }
+
+
+def _prune_state(
+    names: frozenset[str], anchored: frozenset[str], markers: Iterable[str]
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Add the rules triggered by ``markers`` found in a directory to its prune state.
+
+    ``names`` are pruned at any depth; ``anchored`` holds slash paths relative
+    to the directory.
+    """
+
+    markers = set(markers)
+    if not markers:
+        return names, anchored
+    local = [entry for rule in PROJECT_TYPE_RULES if markers.intersection(rule.markers) for entry in rule.prune]
+    local_names = {entry for entry in local if "/" not in entry}
+    local_anchored = {entry for entry in local if "/" in entry}
+    return (names | local_names if local_names else names), (
+        anchored | local_anchored if local_anchored else anchored
+    )
+
+
+def _child_prune_state(
+    names: frozenset[str], anchored: frozenset[str], child: str
+) -> tuple[frozenset[str], frozenset[str]] | None:
+    """Return the inherited prune state for ``child``, or ``None`` to prune it."""
+
+    if child in names or child in anchored:
+        return None
+    if not anchored:
+        return names, _EMPTY
+    prefix = f"{child}/"
+    return names, frozenset(entry[len(prefix) :] for entry in anchored if entry.startswith(prefix))
+
+
+def _scan_directory(
+    path: str,
+    wanted: set[str],
+    markers: frozenset[str],
+) -> tuple[List[str], List[str], List[str]]:
+    """Return ``(subdirectories, matching files, project markers)`` names for one directory.
+
+    Subdirectories are not filtered; pruning depends on the markers of every
+    ancestor and is applied by the caller.
+    """
+
+    subdirs: List[str] = []
+    matches: List[str] = []
+    found_markers: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_real_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_real_dir:
+                subdirs.append(entry.name)
+                continue
+            if entry.name in markers:
+                found_markers.append(entry.name)
+            if entry.name not in wanted:
+                continue
+            try:
+                if entry.is_dir():
+                    continue
+            except OSError:
+                pass
+            matches.append(entry.name)
+    return subdirs, matches, found_markers
+
+
+def _walk_named_files(root: Path, wanted: set[str]) -> Iterator[Path]:
+    """Yield files under ``root`` whose name is in ``wanted`` using a single scandir pass.
+
+    Dependency and build directories are pruned before descending, per
+    directory according to ``PROJECT_TYPE_RULES``, as are paths matched by
+    ``.gitignore``/``.pmignore`` files. Symlinked directories are never
+    followed (matching ``Path.rglob``).
+    """
+
+    from project_manager_ignore import IGNORE_FILES, directory_matcher, root_matcher
+
+    markers = _project_markers() | set(IGNORE_FILES)
+    root_str = os.fspath(root)
+    stack = [(root_str, ALWAYS_SKIP_DIRS, _EMPTY, root_matcher(root_str))]
+    while stack:
+        current, names, anchored, matcher = stack.pop()
+        try:
+            subdirs, matches, found = _scan_directory(current, wanted, markers)
+        except OSError:
+            continue
+        matcher = directory_matcher(matcher, current, found)
+        for name in matches:
+            if not matcher.ignored(name, is_dir=False):
+                yield Path(current, name)
+        names, anchored = _prune_state(names, anchored, found)
+        # Reverse so directories are visited in scandir order when popped.
+        for name in reversed(subdirs):
+            child_state = _child_prune_state(names, anchored, name)
+            if child_state is not None and not matcher.ignored(name, is_dir=True):
+                stack.append((os.path.join(current, name), *child_state, matcher.child(name)))
+
+
+def _discovery_cache_path(repo: Path) -> Path:
+    return DISCOVERY_CACHE_ROOT / f"{_slugify_path(repo)}.json"
+
+
+def _load_discovery_cache(cache_path: Path, signature: dict) -> dict:
+    try:
+        payload = _load_json_cached(cache_path, copied=False)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("signature") != signature:
+        return {}
+    dirs = payload.get("dirs")
+    return dirs if isinstance(dirs, dict) else {}
+
+
+def _save_discovery_cache(cache_path: Path, signature: dict, dirs: dict) -> None:
+    payload = {"signature": signature, "dirs": dirs}
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _walk_named_files_cached(root: Path, wanted: set[str]) -> List[Path]:
+    """Like ``_walk_named_files`` but only rescans directories whose mtime changed.
+
+    The tree shape, matches and project markers are persisted per repository
+    under ``DISCOVERY_CACHE_ROOT``. Unchanged directories cost a single
+    ``stat``. Subdirectories are cached unfiltered, so adding a manifest or
+    ignore rule higher up re-prunes cached descendants without rescanning
+    them; ignore files themselves are re-read only when their stat changes.
+    """
+
+    from project_manager_ignore import IGNORE_FILES, directory_matcher, root_matcher
+
+    cache_path = _discovery_cache_path(root)
+    signature = {
+        "version": DISCOVERY_CACHE_VERSION,
+        "wanted": sorted(wanted),
+        "prune": _prune_rules_signature(),
+        "ignore_files": list(IGNORE_FILES),
+    }
+    cached = _load_discovery_cache(cache_path, signature)
+    racy_after = time.time_ns() - RACY_MTIME_WINDOW_NS
+    root_str = os.fspath(root)
+    markers = _project_markers() | set(IGNORE_FILES)
+
+    fresh: dict[str, dict] = {}
+    matches: List[Path] = []
+    stack = [("", ALWAYS_SKIP_DIRS, _EMPTY, root_matcher(root_str))]
+    while stack:
+        rel, names, anchored, matcher = stack.pop()
+        current = os.path.join(root_str, rel) if rel else root_str
+        try:
+            mtime_ns = os.stat(current).st_mtime_ns
+        except OSError:
+            continue
+        entry = cached.get(rel)
+        if not entry or entry.get("mtime") != mtime_ns:
+            try:
+                subdirs, names_found, markers_found = _scan_directory(current, wanted, markers)
+            except OSError:
+                continue
+            entry = {
+                "mtime": mtime_ns if mtime_ns < racy_after else None,
+                "subdirs": subdirs,
+                "matches": names_found,
+                "markers": markers_found,
+            }
+        fresh[rel] = entry
+        matcher = directory_matcher(matcher, current, entry["markers"])
+        matches.extend(
+            Path(current, name) for name in entry["matches"] if not matcher.ignored(name, is_dir=False)
+        )
+        names, anchored = _prune_state(names, anchored, entry["markers"])
+        for name in reversed(entry["subdirs"]):
+            child_state = _child_prune_state(names, anchored, name)
+            if child_state is not None and not matcher.ignored(name, is_dir=True):
+                stack.append((f"{rel}/{name}" if rel else name, *child_state, matcher.child(name)))
+
+    if fresh != cached:
+        _save_discovery_cache(cache_path, signature, fresh)
+    return matches
+
+
+def _git_candidate_paths(repo: Path) -> List[str] | None:
+    """Return tracked plus untracked, non-ignored paths relative to ``repo``.
+
+    Returns ``None`` when git is unavailable or ``repo`` is not a work tree so
+    callers can fall back to walking the filesystem.
+    """
+
+    try:
+        with _trace_span("git", command="ls-files"):
+            completed = subprocess.run(
+                ["git", "-C", str(repo), "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+    except OSError:
+        return None
+    if completed.returncode != 0:
+        return None
+    # Unmerged entries are listed once per stage; keep the first occurrence.
+    return list(dict.fromkeys(os.fsdecode(raw) for raw in completed.stdout.split(b"\0") if raw))
+
+
+def _match_git_candidates(
+    repo: Path,
+    candidates: List[str],
+    wanted: set[str],
+) -> Iterator[Path]:
+    """Filter git's path list to ``wanted`` names outside pruned directories.
+
+    Project markers and ``.pmignore`` files are taken from the same list, so a
+    tracked sub-project manifest prunes its dependency directories just like
+    the filesystem walk. git has already applied ``.gitignore``.
+    """
+
+    from project_manager_ignore import EMPTY_MATCHER, PM_IGNORE_FILE, IgnoreMatcher, directory_matcher
+
+    markers = _project_markers() | {PM_IGNORE_FILE}
+    dir_markers: dict[str, List[str]] = {}
+    for rel in candidates:
+        parent, _, name = rel.rpartition("/")
+        if name in markers:
+            dir_markers.setdefault(parent, []).append(name)
+    repo_str = os.fspath(repo)
+    root_found = dir_markers.get("", ())
+    states: dict[str, tuple[frozenset[str], frozenset[str], IgnoreMatcher] | None] = {
+        "": (
+            *_prune_state(ALWAYS_SKIP_DIRS, _EMPTY, root_found),
+            directory_matcher(EMPTY_MATCHER, repo_str, root_found),
+        )
+    }
+
+    def prune_state(directory: str) -> tuple[frozenset[str], frozenset[str], IgnoreMatcher] | None:
+        if directory in states:
+            return states[directory]
+        parent, _, name = directory.rpartition("/")
+        parent_state = prune_state(parent)
+        state = None
+        if parent_state is not None:
+            names, anchored, matcher = parent_state
+            child_state = _child_prune_state(names, anchored, name)
+            if child_state is not None and not matcher.ignored(name, is_dir=True):
+                found = dir_markers.get(directory, ())
+                state = (
+                    *_prune_state(*child_state, found),
+                    directory_matcher(matcher.child(name), os.path.join(repo_str, directory), found),
+                )
+        states[directory] = state
+        return state
+
+    for rel in candidates:
+        directory, _, name = rel.rpartition("/")
+        if name not in wanted:
+            continue
+        state = prune_state(directory)
+        if state is None or state[2].ignored(name, is_dir=False):
+            continue
+        path = repo / rel
+        # The index may still list files deleted from the work tree.
+        if not os.path.lexists(path) or path.is_dir():
+            continue
+        yield path
+
+
+def _gather_named_files(
+    repo: Path,
+    names: Iterable[str],
+    discovery: str = DEFAULT_DISCOVERY,
+) -> List[Path]:
+    wanted = set(names)
+    if not wanted:
+        return []
+    with _trace_span("gather", discovery=discovery):
+        if discovery == "git":
+            candidates = _git_candidate_paths(repo)
+            if candidates is not None:
+                return list(_match_git_candidates(repo, candidates, wanted))
+        return _walk_named_files_cached(repo, wanted)
+
+
+def gather_alias_files(
+    repo: Path,
+    alias_names: Iterable[str],
+    discovery: str = DEFAULT_DISCOVERY,
+) -> List[Path]:
+    return _gather_named_files(repo, alias_names, discovery)
+
+
+def gather_canonical_files(
+    repo: Path,
+    canonical_name: str,
+    discovery: str = DEFAULT_DISCOVERY,
+) -> List[Path]:
+    return _gather_named_files(repo, [canonical_name], discovery)
+
+
+def gather_assistant_files(
+    repo: Path,
+    alias_names: Iterable[str],
+    canonical_name: str,
+    discovery: str = DEFAULT_DISCOVERY,
+) -> tuple[List[Path], List[Path]]:
+    """Return ``(alias files, canonical files)`` from a single discovery pass."""
+
+    alias_set = set(alias_names)
+    found = _gather_named_files(repo, [*alias_set, canonical_name], discovery)
+    alias_files = [path for path in found if path.name in alias_set]
+    canonical_files = [path for path in found if path.name == canonical_name]
+    return alias_files, canonical_files
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# ioctl(dst, FICLONE, src) shares src's extents copy-on-write (btrfs, XFS, bcachefs).
+FICLONE = 0x40049409
+COPY_CHUNK_SIZE = 1024 * 1024
+# Errors after which the next, slower copy strategy may still work.
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK, errno.EBADF}
+)
+
+
+def _darwin_clonefile(src: Path, dst: Path) -> bool:
+    import ctypes
+
+    clonefile = getattr(ctypes.CDLL(None, use_errno=True), "clonefile", None)
+    if clonefile is None:
+        return False
+    return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def _copy_fd_chunks(copy_range, infd: int, outfd: int) -> None:
+    while copy_range(infd, outfd, COPY_CHUNK_SIZE):
+        pass
+
+
+def _clone_file(src: Path, dst: Path) -> str:
+    """Create ``dst`` (which must not exist) with the contents of ``src``.
+
+    Uses the cheapest mechanism that works: a reflink clone, then
+    ``copy_file_range``, ``sendfile`` and finally a chunked copy. ``dst``
+    never shares an inode with ``src``, so later writes to either leave the
+    other intact. File data never passes through Python memory as a whole.
+    Returns the method used.
+    """
+
+    if sys.platform == "darwin" and _darwin_clonefile(src, dst):
+        return "reflink"
+    with open(src, "rb") as source, open(dst, "xb") as target:
+        infd, outfd = source.fileno(), target.fileno()
+        if sys.platform.startswith("linux"):
+            try:
+                fcntl.ioctl(outfd, FICLONE, infd)
+                return "reflink"
+            except OSError:
+                pass
+        strategies = [
+            ("copy_file_range", getattr(os, "copy_file_range", None)),
+            ("sendfile", lambda infd, outfd, count: os.sendfile(outfd, infd, None, count)),
+        ]
+        for method, copy_range in strategies:
+            if copy_range is None:
+                continue
+            try:
+                _copy_fd_chunks(copy_range, infd, outfd)
+                return method
+            except OSError as exc:
+                if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+                os.lseek(infd, 0, os.SEEK_SET)
+                os.lseek(outfd, 0, os.SEEK_SET)
+                os.ftruncate(outfd, 0)
+        shutil.copyfileobj(source, target, COPY_CHUNK_SIZE)
+        return "copy"
+
+
+@dataclass(frozen=True)
+class GraveyardEntry:
+    digest: str
+    repo: str
+    path: str
+    created: float
+    size: int
+
+
+def _graveyard_root(llm_settings: dict) -> Path:
+    return Path(llm_settings.get("graveyard_root", str(DEFAULT_GRAVEYARD_ROOT))).expanduser()
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def graveyard_blob_path(graveyard_root: Path, digest: str) -> Path:
+    return graveyard_root / GRAVEYARD_OBJECTS_DIRNAME / digest[:2] / digest
+
+
+@contextmanager
+def _graveyard_lock(graveyard_root: Path) -> Iterator[None]:
+    """Serialize index appends against garbage collection."""
+
+    graveyard_root.mkdir(parents=True, exist_ok=True)
+    fd = os.open(graveyard_root / GRAVEYARD_LOCK_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _graveyard_index_line(entry: GraveyardEntry) -> str:
+    record = {
+        "hash": entry.digest,
+        "repo": entry.repo,
+        "path": entry.path,
+        "created": entry.created,
+        "size": entry.size,
+    }
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _append_graveyard_index(graveyard_root: Path, entry: GraveyardEntry) -> None:
+    # A single O_APPEND write keeps concurrent writers (fleet sync) from interleaving lines.
+    fd = os.open(
+        graveyard_root / GRAVEYARD_INDEX_NAME, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+    )
+    try:
+        os.write(fd, _graveyard_index_line(entry).encode())
+    finally:
+        os.close(fd)
+
+
+def store_backup(src: Path, graveyard_root: Path, repo_path: Path) -> GraveyardEntry:
+    """Store ``src`` in the content-addressed graveyard and record it in the index.
+
+    Content that is already stored costs only a hash and an index append.
+    New content is reflinked where the filesystem allows it and copied in
+    the kernel otherwise.
+    """
+
+    with _trace_span("backup"):
+        digest = _hash_file(src)
+        blob = graveyard_blob_path(graveyard_root, digest)
+        rel = src.relative_to(repo_path).as_posix()
+        # Hold the lock so gc cannot delete the blob between the check and the append.
+        with _graveyard_lock(graveyard_root):
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp_blob = blob.with_name(f"{digest}.{os.getpid()}.tmp")
+                try:
+                    _clone_file(src, tmp_blob)
+                    os.replace(tmp_blob, blob)
+                except OSError:
+                    tmp_blob.unlink(missing_ok=True)
+                    raise
+            entry = GraveyardEntry(
+                digest=digest,
+                repo=str(repo_path),
+                path=rel,
+                created=time.time(),
+                size=blob.stat().st_size,
+            )
+            _append_graveyard_index(graveyard_root, entry)
+    return entry
+
+
+def read_graveyard_index(graveyard_root: Path) -> List[GraveyardEntry]:
+    entries: List[GraveyardEntry] = []
+    try:
+        handle = (graveyard_root / GRAVEYARD_INDEX_NAME).open("r", encoding="utf-8")
+    except FileNotFoundError:
+        return entries
+    with handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+                entries.append(
+                    GraveyardEntry(
+                        digest=record["hash"],
+                        repo=record["repo"],
+                        path=record["path"],
+                        created=float(record["created"]),
+                        size=int(record.get("size", -1)),
+                    )
+                )
+            except (ValueError, KeyError, TypeError):
+                continue
+    return entries
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    max_bytes: int | None
+    max_age_days: float | None
+    keep_per_repo: int | None
+
+
+@dataclass(frozen=True)
+class GcResult:
+    kept: int
+    evicted: int
+    removed_blobs: int
+    reclaimed_bytes: int
+
+
+def _retention_policy(llm_settings: dict, **overrides: float | int | None) -> RetentionPolicy:
+    stored = {**DEFAULT_GRAVEYARD_RETENTION, **llm_settings.get("graveyard_retention", {})}
+    values = {
+        key: overrides[key] if overrides.get(key) is not None else stored.get(key)
+        for key in ("max_bytes", "max_age_days", "keep_per_repo")
+    }
+    # Zero disables a limit.
+    return RetentionPolicy(**{key: value or None for key, value in values.items()})
+
+
+def _select_retained(
+    entries: List[GraveyardEntry],
+    policy: RetentionPolicy,
+    now: float,
+) -> tuple[List[GraveyardEntry], List[GraveyardEntry]]:
+    """Split entries into ``(kept, evicted)``, evicting the oldest backups first."""
+
+    cutoff = now - policy.max_age_days * 86400 if policy.max_age_days else None
+    per_repo: dict[str, int] = {}
+    blob_sizes: dict[str, int] = {}
+    total_bytes = 0
+    kept: List[GraveyardEntry] = []
+    evicted: List[GraveyardEntry] = []
+
+    for entry in sorted(entries, key=lambda item: item.created, reverse=True):
+        if cutoff is not None and entry.created < cutoff:
+            evicted.append(entry)
+            continue
+        if policy.keep_per_repo and per_repo.get(entry.repo, 0) >= policy.keep_per_repo:
+            evicted.append(entry)
+            continue
+        # Blobs are shared, so only the first (newest) reference counts against the budget.
+        if entry.digest not in blob_sizes:
+            size = max(entry.size, 0)
+            if policy.max_bytes and total_bytes + size > policy.max_bytes:
+                evicted.append(entry)
+                continue
+            blob_sizes[entry.digest] = size
+            total_bytes += size
+        per_repo[entry.repo] = per_repo.get(entry.repo, 0) + 1
+        kept.append(entry)
+
+    return kept, evicted
+
+
+def _legacy_graveyard_entries(graveyard_root: Path) -> dict[GraveyardEntry, Path]:
+    """Describe backups in the pre-index ``<graveyard>/<repo-slug>/`` layout.
+
+    Each file becomes an entry keyed by its own path (there is no content hash
+    to share), attributed to its slug directory and dated by its mtime, so the
+    retention policy treats old and new backups alike.
+    """
+
+    legacy: dict[GraveyardEntry, Path] = {}
+    try:
+        slugs = [item for item in os.scandir(graveyard_root) if item.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return legacy
+    for slug in slugs:
+        if slug.name == GRAVEYARD_OBJECTS_DIRNAME:
+            continue
+        with os.scandir(slug.path) as items:
+            for item in items:
+                if not item.is_file(follow_symlinks=False):
+                    continue
+                info = item.stat(follow_symlinks=False)
+                entry = GraveyardEntry(
+                    digest=f"{slug.name}/{item.name}",
+                    repo=slug.name,
+                    path=item.name,
+                    created=info.st_mtime,
+                    size=info.st_size,
+                )
+                legacy[entry] = Path(item.path)
+    return legacy
+
+
+def collect_graveyard_garbage(
+    graveyard_root: Path,
+    policy: RetentionPolicy,
+    dry_run: bool,
+) -> GcResult:
+    """Apply ``policy`` to the graveyard index and delete blobs nothing references.
+
+    Work is proportional to the number of index entries; the objects directory
+    is never listed. Backups left in per-repo slug directories by older
+    versions are weighed by the same policy and deleted in place.
+    """
+
+    if not graveyard_root.is_dir():
+        return GcResult(kept=0, evicted=0, removed_blobs=0, reclaimed_bytes=0)
+
+    with _graveyard_lock(graveyard_root):
+        entries = read_graveyard_index(graveyard_root)
+        legacy = _legacy_graveyard_entries(graveyard_root)
+        kept, evicted = _select_retained([*entries, *legacy], policy, time.time())
+        kept_digests = {entry.digest for entry in kept if entry not in legacy}
+        doomed = {entry.digest for entry in evicted if entry not in legacy} - kept_digests
+
+        reclaimed = 0
+        removed = 0
+        for entry in evicted:
+            path = legacy.get(entry)
+            if path is None:
+                continue
+            try:
+                if not dry_run:
+                    path.unlink()
+            except FileNotFoundError:
+                continue
+            reclaimed += entry.size
+            removed += 1
+        if not dry_run:
+            for path in {path.parent for path in legacy.values()}:
+                try:
+                    path.rmdir()  # only succeeds once every backup in it is gone
+                except OSError:
+                    pass
+        for digest in doomed:
+            blob = graveyard_blob_path(graveyard_root, digest)
+            try:
+                size = blob.stat().st_size
+                if not dry_run:
+                    blob.unlink()
+            except FileNotFoundError:
+                continue
+            reclaimed += size
+            removed += 1
+
+        if not dry_run and any(entry not in legacy for entry in evicted):
+            indexed = sorted(
+                (entry for entry in kept if entry not in legacy), key=lambda entry: entry.created
+            )
+            _write_atomic(
+                graveyard_root / GRAVEYARD_INDEX_NAME,
+                "".join(_graveyard_index_line(entry) for entry in indexed).encode(),
+            )
+
+    return GcResult(
+        kept=len(kept), evicted=len(evicted), removed_blobs=removed, reclaimed_bytes=reclaimed
+    )
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def _parse_size(value: str) -> int:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?\s*", value, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"invalid size: {value!r}")
+    exponent = " kmgt".index(match.group(2).lower() or " ")
+    return int(float(match.group(1)) * 1024**exponent)
+
+
+def _echo_gc_result(result: GcResult, dry_run: bool) -> None:
+    prefix = "[DRY-RUN] Would evict" if dry_run else "Evicted"
+    click.echo(
+        f"{prefix} {result.evicted} of {result.kept + result.evicted} backups, "
+        f"removing {result.removed_blobs} blobs ({_format_bytes(result.reclaimed_bytes)} reclaimed)."
+    )
+
+
+PLAN_DESYMLINK = "de-symlink"
+PLAN_BACKUP = "backup"
+PLAN_PROMOTE = "promote"
+PLAN_UNLINK = "unlink"
+PLAN_SYMLINK = "symlink"
+
+
+@dataclass(frozen=True)
+class PlannedOperation:
+    action: str
+    path: Path
+    destination: Path | None = None
+    link_target: str | None = None
+
+
+@dataclass(frozen=True)
+class SyncPlan:
+    repo_path: Path
+    graveyard_root: Path
+    operations: tuple[PlannedOperation, ...]
+    # State of every repo path the plan touches, captured before any change.
+    preconditions: tuple[tuple[Path, str], ...]
+    found_files: bool
+
+
+# Errors that Path.exists() treats as "not there".
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ELOOP})
+
+
+class _StatCache:
+    """Per-run memo of ``lstat``, ``stat`` and ``readlink`` results.
+
+    Sync asks about the same alias and canonical paths many times while
+    planning; with this cache each path costs at most one ``lstat`` (plus a
+    ``stat`` or ``readlink`` for symlinks). Mutations must go through
+    ``unlink``, ``rename``, ``symlink`` or ``forget`` so cached answers stay
+    correct.
+    """
+
+    def __init__(self) -> None:
+        self._lstat: dict[Path, os.stat_result | None] = {}
+        # Symlink-following results; any mutation can change them.
+        self._followed: dict[Path, os.stat_result | None] = {}
+        self._links: dict[Path, str] = {}
+
+    @staticmethod
+    def _call(func, path: Path) -> os.stat_result | None:
+        try:
+            return func(path)
+        except OSError as exc:
+            if exc.errno in _MISSING_ERRNOS:
+                return None
+            raise
+
+    def lstat(self, path: Path) -> os.stat_result | None:
+        if path not in self._lstat:
+            self._lstat[path] = self._call(os.lstat, path)
+        return self._lstat[path]
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        info = self.lstat(path)
+        if info is None or not stat.S_ISLNK(info.st_mode):
+            return info
+        if path not in self._followed:
+            self._followed[path] = self._call(os.stat, path)
+        return self._followed[path]
+
+    def readlink(self, path: Path) -> str:
+        if path not in self._links:
+            self._links[path] = os.readlink(path)
+        return self._links[path]
+
+    def exists(self, path: Path) -> bool:
+        return self.stat(path) is not None
+
+    def is_file(self, path: Path) -> bool:
+        info = self.stat(path)
+        return info is not None and stat.S_ISREG(info.st_mode)
+
+    def is_symlink(self, path: Path) -> bool:
+        info = self.lstat(path)
+        return info is not None and stat.S_ISLNK(info.st_mode)
+
+    def state(self, path: Path) -> str:
+        """Describe ``path`` without following symlinks, for plan preconditions."""
+
+        info = self.lstat(path)
+        if info is None:
+            return "absent"
+        if stat.S_ISLNK(info.st_mode):
+            return f"symlink:{self.readlink(path)}"
+        if stat.S_ISDIR(info.st_mode):
+            return "dir"
+        return f"file:{info.st_size}:{info.st_mtime_ns}"
+
+    def forget(self, path: Path) -> None:
+        self._lstat.pop(path, None)
+        self._links.pop(path, None)
+        self._followed.clear()
+
+    def _removed(self, path: Path) -> None:
+        self.forget(path)
+        self._lstat[path] = None
+
+    def unlink(self, path: Path) -> None:
+        path.unlink()
+        self._removed(path)
+
+    def rename(self, path: Path, destination: Path) -> None:
+        path.rename(destination)
+        self.forget(destination)
+        self._removed(path)
+
+    def symlink(self, path: Path, target: str) -> None:
+        path.symlink_to(target)
+        self.forget(path)
+        self._links[path] = target
+
+
+class _PlanState:
+    """Simulated view of the work tree as planned operations are queued."""
+
+    def __init__(self, cache: _StatCache) -> None:
+        self.cache = cache
+        self.overrides: dict[Path, str] = {}
+        self.preconditions: dict[Path, str] = {}
+
+    def depend(self, path: Path) -> None:
+        """Record ``path`` as an input of the plan without changing it."""
+
+        if path not in self.preconditions and path not in self.overrides:
+            self.preconditions[path] = self.cache.state(path)
+
+    def touch(self, path: Path, new_state: str) -> None:
+        self.depend(path)
+        self.overrides[path] = new_state
+
+    def exists(self, path: Path) -> bool:
+        if path in self.overrides:
+            return self.overrides[path] != "absent"
+        return self.cache.exists(path)
+
+    def is_symlink(self, path: Path) -> bool:
+        if path in self.overrides:
+            return self.overrides[path] == "symlink"
+        return self.cache.is_symlink(path)
+
+
+def _plan_canonical_regular(canonical_path: Path, state: _PlanState) -> List[PlannedOperation]:
+    if not state.exists(canonical_path) or not state.is_symlink(canonical_path):
+        return []
+    state.touch(canonical_path, "file")
+    return [PlannedOperation(PLAN_DESYMLINK, canonical_path)]
+
+
+def _plan_alias_symlink(
+    alias_path: Path,
+    canonical_path: Path,
+    state: _PlanState,
+) -> List[PlannedOperation]:
+    if alias_path == canonical_path or not state.exists(canonical_path):
+        return []
+
+    desired_target = os.path.relpath(canonical_path, alias_path.parent)
+    operations: List[PlannedOperation] = []
+
+    if state.is_symlink(alias_path):
+        # Links sync wrote hold exactly this relative target; comparing the
+        # string avoids resolving every path component.
+        if state.cache.readlink(alias_path) == desired_target:
+            return []
+        current_target = alias_path.resolve(strict=False)
+        if state.exists(current_target) and current_target == canonical_path.resolve():
+            return []
+        operations.append(PlannedOperation(PLAN_UNLINK, alias_path))
+    elif state.exists(alias_path):
+        operations.append(PlannedOperation(PLAN_BACKUP, alias_path))
+        operations.append(PlannedOperation(PLAN_UNLINK, alias_path))
+
+    state.depend(canonical_path)  # the new link is only right while its target is
+    state.touch(alias_path, "symlink")
+    operations.append(PlannedOperation(PLAN_SYMLINK, alias_path, link_target=desired_target))
+    return operations
+
+
+def plan_alias_sync(config: SyncConfig) -> SyncPlan:
+    """Discover assistant files once and compute every change sync would make."""
+
+    with _trace_span("plan"):
+        alias_files, canonical_files = gather_assistant_files(
+            config.repo_path, config.alias_names, config.canonical_name, config.discovery
+        )
+        canonical_set = set(canonical_files)
+
+        state = _PlanState(_StatCache())
+        operations: List[PlannedOperation] = []
+
+        for canonical_path in sorted(canonical_set):
+            operations.extend(_plan_canonical_regular(canonical_path, state))
+
+        for alias_path in alias_files:
+            canonical_path = alias_path.with_name(config.canonical_name)
+            if not state.exists(alias_path) or state.is_symlink(alias_path):
+                continue
+            if state.exists(canonical_path):
+                continue
+
+            operations.append(PlannedOperation(PLAN_BACKUP, alias_path))
+            operations.append(PlannedOperation(PLAN_PROMOTE, alias_path, destination=canonical_path))
+            state.touch(alias_path, "absent")
+            state.touch(canonical_path, "file")
+            canonical_set.add(canonical_path)
+
+        found_files = bool(canonical_set or alias_files)
+        if found_files:
+            with _trace_span("resolve"):
+                unique_alias_names = list(dict.fromkeys(config.alias_names))
+                for canonical_path in sorted(canonical_set):
+                    if not state.exists(canonical_path):
+                        continue
+                    for alias_name in unique_alias_names:
+                        if alias_name == config.canonical_name:
+                            continue
+                        alias_path = canonical_path.with_name(alias_name)
+                        operations.extend(
+                            _plan_alias_symlink(alias_path, canonical_path, state)
+                        )
+
+        return SyncPlan(
+            repo_path=config.repo_path,
+            graveyard_root=config.graveyard_root,
+            operations=tuple(operations),
+            preconditions=tuple(state.preconditions.items()),
+            found_files=found_files,
+        )
+
+
+def _describe_operation(operation: PlannedOperation, repo: Path) -> str:
+    rel_path = operation.path.relative_to(repo)
+    if operation.action == PLAN_DESYMLINK:
+        return f"replace symlink canonical {rel_path} with regular file"
+    if operation.action == PLAN_BACKUP:
+        return f"backup {rel_path} to graveyard"
+    if operation.action == PLAN_PROMOTE:
+        return f"promote {rel_path} -> {operation.destination.relative_to(repo)}"
+    if operation.action == PLAN_UNLINK:
+        return f"remove {rel_path}"
+    target = Path(os.path.normpath(operation.path.parent / operation.link_target))
+    return f"create symlink {rel_path} -> {target.relative_to(repo)}"
+
+
+def render_sync_plan(plan: SyncPlan) -> None:
+    ensure_graveyard(plan.graveyard_root, dry_run=True)
+    ensure_gitignore(plan.repo_path, plan.graveyard_root, dry_run=True)
+    if not plan.found_files:
+        click.echo("No canonical or alternate assistant files found. Nothing to do.")
+        return
+    for operation in plan.operations:
+        click.echo(f"[DRY-RUN] Would {_describe_operation(operation, plan.repo_path)}")
+
+
+def _ensure_canonical_is_regular(canonical_path: Path, cache: _StatCache) -> None:
+    """Replace the symlink ``canonical_path`` with a copy of its target, atomically."""
+
+    tmp_path = canonical_path.with_name(f".{canonical_path.name}.{os.getpid()}.tmp")
+    try:
+        _clone_file(canonical_path, tmp_path)
+        os.replace(tmp_path, canonical_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        cache.forget(canonical_path)
+
+
+def _apply_operation(
+    operation: PlannedOperation, plan: SyncPlan, cache: _StatCache
+) -> None:
+    path = operation.path
+    if operation.action == PLAN_DESYMLINK:
+        _ensure_canonical_is_regular(path, cache)
+    elif operation.action == PLAN_BACKUP:
+        store_backup(path, plan.graveyard_root, plan.repo_path)
+    elif operation.action == PLAN_PROMOTE:
+        operation.destination.parent.mkdir(parents=True, exist_ok=True)
+        cache.rename(path, operation.destination)
+    elif operation.action == PLAN_UNLINK:
+        cache.unlink(path)
+    elif operation.action == PLAN_SYMLINK:
+        cache.symlink(path, operation.link_target)
+
+
+def apply_sync_plan(plan: SyncPlan) -> int:
+    """Execute a previously computed plan, refusing to run if its inputs changed."""
+
+    with _trace_span("apply", operations=len(plan.operations)):
+        # A fresh cache, so preconditions are checked against the disk as it is now.
+        cache = _StatCache()
+        stale = [
+            path for path, expected in plan.preconditions if cache.state(path) != expected
+        ]
+        if stale:
+            listing = ", ".join(str(path.relative_to(plan.repo_path)) for path in stale)
+            raise ProjectManagerError(
+                f"Files changed since the sync plan was computed ({listing}). Re-run sync."
+            )
+
+        graveyard = ensure_graveyard(plan.graveyard_root, dry_run=False)
+        ensure_gitignore(plan.repo_path, graveyard, dry_run=False)
+        for operation in plan.operations:
+            _apply_operation(operation, plan, cache)
+        return len(plan.operations)
+
+
+def process_alias_files(config: SyncConfig) -> int:
+    plan = plan_alias_sync(config)
+    if config.dry_run:
+        render_sync_plan(plan)
+        return len(plan.operations)
+    return apply_sync_plan(plan)
+
+
+def remove_alias_symlinks(
+    repo: Path,
+    alias_names: Iterable[str],
+    dry_run: bool,
+    discovery: str = DEFAULT_DISCOVERY,
+    canonical_name: str | None = None,
+) -> int:
+    if canonical_name is None:
+        alias_files = gather_alias_files(repo, alias_names, discovery)
+    else:
+        # Share the discovery cache signature used by sync.
+        alias_files, _ = gather_assistant_files(repo, alias_names, canonical_name, discovery)
+
+    removed = 0
+    for alias_path in alias_files:
+        if not alias_path.is_symlink():
+            continue
+        rel_alias = alias_path.relative_to(repo)
+        if dry_run:
+            click.echo(f"[DRY-RUN] Would remove symlink {rel_alias}")
+        else:
+            alias_path.unlink()
+        removed += 1
+    return removed
+
+
+def _workspace_folders(workspace_file: Path) -> List[Path]:
+    try:
+        payload = json.loads(workspace_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return []
+    folders = payload.get("folders", []) if isinstance(payload, dict) else []
+    return [
+        workspace_file.parent / Path(entry["path"]).expanduser()
+        for entry in folders
+        if isinstance(entry, dict) and entry.get("path")
+    ]
+
+
+def _dir_map_paths(dir_map_file: Path) -> List[Path]:
+    try:
+        text = dir_map_file.read_text(encoding="utf-8")
+    except OSError:
+        return []
+    paths: List[Path] = []
+    for line in text.splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        match = re.search(r'\[[^\]]+\]="([^"]+)"', line)
+        if match:
+            paths.append(Path(os.path.expandvars(match.group(1))).expanduser())
+    return paths
+
+
+def _unique_directories(paths: Iterable[Path]) -> List[Path]:
+    unique: dict[Path, None] = {}
+    for path in paths:
+        resolved = path.expanduser().resolve()
+        if resolved.is_dir():
+            unique.setdefault(resolved, None)
+    return list(unique)
+
+
+def discover_fleet_repos() -> List[Path]:
+    """Collect every project directory referenced by tmux launchers, workspaces and dir_map.sh."""
+
+    candidates: List[Path] = []
+    for script in sorted(TMUX_DIR.glob("start_*.sh")):
+        try:
+            project_dir = _parse_project_dir(script.read_text(encoding="utf-8"))
+        except OSError:
+            continue
+        if project_dir is not None:
+            candidates.append(project_dir)
+    for workspace_file in sorted(PROJECTS_ROOT.glob("*.code-workspace")):
+        candidates.extend(_workspace_folders(workspace_file))
+    candidates.extend(_dir_map_paths(DIR_MAP_FILE))
+    return _unique_directories(candidates)
+
+
+def _completion_sources() -> dict[str, int | None]:
+    """Return the mtimes the completion index depends on (``None`` when missing)."""
+
+    sources: dict[str, int | None] = {}
+    for path in (TMUX_DIR, TMUX_SPEC_DIR, PROJECTS_ROOT, DIR_MAP_FILE):
+        try:
+            sources[str(path)] = path.stat().st_mtime_ns
+        except OSError:
+            sources[str(path)] = None
+    return sources
+
+
+def _build_completion_index(sources: dict[str, int | None]) -> dict:
+    sessions = {path.stem for path in TMUX_SPEC_DIR.glob("*.json")}
+    sessions.update(path.stem[len("start_") :] for path in TMUX_DIR.glob("start_*.sh"))
+    racy_after = time.time_ns() - RACY_MTIME_WINDOW_NS
+    return {
+        "version": COMPLETION_INDEX_VERSION,
+        # A racy mtime is stored as -1 so it never matches and the next TAB rebuilds.
+        "sources": {
+            path: -1 if mtime is not None and mtime >= racy_after else mtime
+            for path, mtime in sources.items()
+        },
+        "sessions": sorted(sessions),
+        "repos": [str(path) for path in discover_fleet_repos()],
+        "workspaces": sorted(path.stem for path in PROJECTS_ROOT.glob("*.code-workspace")),
+    }
+
+
+def completion_index() -> dict:
+    """Return session, repo and workspace names for shell completion.
+
+    The index is persisted in ``COMPLETION_INDEX`` and rebuilt only when the
+    mtime of the tmux, session-spec or projects directory (or ``dir_map.sh``)
+    changed, so a TAB costs four ``stat`` calls and one small JSON read.
+    """
+
+    sources = _completion_sources()
+    try:
+        index = _load_json_cached(COMPLETION_INDEX, copied=False)
+        if index.get("version") == COMPLETION_INDEX_VERSION and index.get("sources") == sources:
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+    index = _build_completion_index(sources)
+    try:
+        _write_atomic(COMPLETION_INDEX, json.dumps(index).encode("utf-8"))
+    except OSError:
+        pass
+    return index
+
+
+def _complete_session(ctx: click.Context, param: click.Parameter, incomplete: str) -> List[str]:
+    return [name for name in completion_index()["sessions"] if name.startswith(incomplete)]
+
+
+def _complete_workspace(ctx: click.Context, param: click.Parameter, incomplete: str) -> List[str]:
+    return [name for name in completion_index()["workspaces"] if name.startswith(incomplete)]
+
+
+def _complete_repo(ctx: click.Context, param: click.Parameter, incomplete: str) -> list:
+    """Offer known project directories, falling back to plain directory completion."""
+
+    from click.shell_completion import CompletionItem
+
+    home = str(Path.home())
+    expanded = os.path.expanduser(incomplete)
+    matches = []
+    for repo in completion_index()["repos"]:
+        if repo.startswith(expanded):
+            # Keep the user's ~ spelling so the shell's prefix match still holds.
+            shown = "~" + repo[len(home) :] if incomplete.startswith("~") and repo.startswith(home) else repo
+            matches.append(CompletionItem(shown))
+    return matches or [CompletionItem(incomplete, type="dir")]
+
+
+def read_repo_list(source: Path) -> List[Path]:
+    """Read repository paths from a file, one per line; blank lines and # comments are ignored."""
+
+    try:
+        with click.open_file(str(source), "r", encoding="utf-8") as handle:
+            text = handle.read()
+    except OSError as exc:
+        raise ProjectManagerError(f"Could not read repository list {source}: {exc}") from exc
+    entries = [line.split("#", 1)[0].strip() for line in text.splitlines()]
+    return _unique_directories(
+        Path(os.path.expandvars(entry)).expanduser() for entry in entries if entry
+    )
+
+
+@dataclass(frozen=True)
+class FleetResult:
+    repo_path: Path
+    plan: SyncPlan | None
+    error: str | None
+    plan_seconds: float
+    applied: int = 0
+    apply_seconds: float = 0.0
+
+
+def _plan_fleet_repo(config: SyncConfig) -> FleetResult:
+    started = time.perf_counter()
+    try:
+        ensure_git_repo(config.repo_path)
+        plan = plan_alias_sync(config)
+    except ProjectManagerError as exc:
+        return FleetResult(config.repo_path, None, exc.message, time.perf_counter() - started)
+    except OSError as exc:
+        return FleetResult(config.repo_path, None, str(exc), time.perf_counter() - started)
+    return FleetResult(config.repo_path, plan, None, time.perf_counter() - started)
+
+
+def _apply_fleet_plan(result: FleetResult) -> FleetResult:
+    started = time.perf_counter()
+    try:
+        applied = apply_sync_plan(result.plan)
+    except ProjectManagerError as exc:
+        return replace(result, error=exc.message, apply_seconds=time.perf_counter() - started)
+    except OSError as exc:
+        return replace(result, error=str(exc), apply_seconds=time.perf_counter() - started)
+    return replace(result, applied=applied, apply_seconds=time.perf_counter() - started)
+
+
+def _fleet_status(result: FleetResult, applied: bool) -> str:
+    if result.error:
+        return "error"
+    if not result.plan.operations:
+        return "up to date"
+    return "applied" if applied else "pending"
+
+
+def _echo_table(header: tuple[str, ...], rows: List[tuple[str, ...]], err: bool = False) -> None:
+    widths = [max(len(row[index]) for row in (header, *rows)) for index in range(len(header))]
+    for row in (header, *rows):
+        click.echo("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip(), err=err)
+
+
+def _echo_fleet_summary(results: List[FleetResult], applied: bool) -> None:
+    header = ("Repository", "Status", "Ops", "Plan", "Apply")
+    rows = [
+        (
+            _homeify_path(result.repo_path),
+            _fleet_status(result, applied),
+            str(len(result.plan.operations)) if result.plan else "-",
+            f"{result.plan_seconds * 1000:.0f}ms",
+            f"{result.apply_seconds * 1000:.0f}ms" if result.apply_seconds else "-",
+        )
+        for result in results
+    ]
+    _echo_table(header, rows)
+    for result in results:
+        if result.error:
+            click.echo(f"{_homeify_path(result.repo_path)}: {result.error}", err=True)
+
+
+def sync_fleet(configs: List[SyncConfig], jobs: int, dry_run: bool) -> List[FleetResult]:
+    """Plan every repository concurrently, confirm once, then apply the plans concurrently."""
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    started = time.perf_counter()
+    applied = False
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        with _trace_span("fleet-plan", repos=len(configs)):
+            results = list(pool.map(_plan_fleet_repo, configs))
+
+        pending = [result for result in results if result.plan and result.plan.operations]
+        for result in pending:
+            click.echo(f"== {_homeify_path(result.repo_path)} ==")
+            render_sync_plan(result.plan)
+
+        if pending and not dry_run:
+            if click.confirm(f"Apply these changes to {len(pending)} repositories?", default=True):
+                click.echo("Applying changes...")
+                with _trace_span("fleet-apply", repos=len(pending)):
+                    finished = {
+                        result.repo_path: result for result in pool.map(_apply_fleet_plan, pending)
+                    }
+                results = [finished.get(result.repo_path, result) for result in results]
+                applied = True
+            else:
+                click.echo("Aborted without making changes.")
+
+    _echo_fleet_summary(results, applied)
+    noun = "repository" if len(results) == 1 else "repositories"
+    click.echo(f"Processed {len(results)} {noun} in {time.perf_counter() - started:.2f}s.")
+    return results
+
+def _llm_sync_graveyard() -> Path:
+    root = os.environ.get("LLM_GRAVEYARD_ROOT")
+    if root:
+        return Path(root).expanduser()
+    _, llm_settings = _llm_settings()
+    return _graveyard_root(llm_settings)
+
+
+def _read_canonical_tool(repo: Path) -> str | None:
+    config_path = repo / LLM_SYNC_CONFIG_NAME
+    try:
+        value = config_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    tool = re.sub(r"\s+", "", value).lower()
+    return tool if tool in LLM_SYNC_TOOL_FILES else None
+
+
+def _strip_generated_header(data: bytes) -> bytes | None:
+    """Return ``data`` without a generated header, or ``None`` if it has none."""
+
+    if not data.startswith(GENERATED_HEADER_PREFIX.encode()):
+        return None
+    _, _, rest = data.partition(b"\n")
+    if rest.startswith(b"\n"):
+        rest = rest[1:]
+    return rest
+
+
+def render_llm_alias(canonical_file: str, canonical_data: bytes) -> bytes:
+    """Render an alias file exactly as llm-sync.sh does."""
+
+    digest = hashlib.sha256(canonical_data).hexdigest()[:16]
+    warning = f"{GENERATED_HEADER_PREFIX} Generated from {canonical_file} (sha256:{digest}) -->"
+    # $(cat file) in the shell script drops trailing newlines before printf adds one.
+    return warning.encode() + b"\n\n" + canonical_data.rstrip(b"\n") + b"\n"
+
+
+def run_llm_sync(repo: Path, dry_run: bool) -> List[str]:
+    """In-process equivalent of llm-sync.sh.
+
+    Emits the same ``SYNCED_FILE:`` lines and returns the repo-relative paths
+    that were written.
+    """
+
+    synced: List[str] = []
+
+    def mark_synced(path: Path) -> None:
+        rel = path.relative_to(repo).as_posix()
+        click.echo(f"SYNCED_FILE: {rel}")
+        synced.append(rel)
+
+    config_path = repo / LLM_SYNC_CONFIG_NAME
+    canonical_tool = _read_canonical_tool(repo)
+    if canonical_tool is None:
+        if not sys.stdin.isatty():
+            raise ProjectManagerError(
+                "canonical context not configured. Run llm-sync interactively first."
+            )
+        canonical_tool = click.prompt(
+            "Select canonical LLM context",
+            type=click.Choice(list(LLM_SYNC_TOOL_FILES)),
+            err=True,
+        )
+        click.echo(f"Selected canonical context: {canonical_tool}")
+        config_path.write_text(f"{canonical_tool}\n", encoding="utf-8")
+        mark_synced(config_path)
+
+    canonical_file = LLM_SYNC_TOOL_FILES[canonical_tool]
+    canonical_path = repo / canonical_file
+    if not canonical_path.is_file():
+        raise ProjectManagerError(f"Canonical file not found: {canonical_file}")
+
+    graveyard = _llm_sync_graveyard()
+    if dry_run:
+        click.echo(f"[DRY-RUN] Would ensure graveyard directory {graveyard}")
+    else:
+        graveyard.mkdir(parents=True, exist_ok=True)
+
+    canonical_data = canonical_path.read_bytes()
+    stripped = _strip_generated_header(canonical_data)
+    if stripped is not None:
+        if dry_run:
+            click.echo(f"[DRY-RUN] Would remove generated header from {canonical_file}")
+        else:
+            _write_atomic(canonical_path, stripped)
+            mark_synced(canonical_path)
+            canonical_data = stripped
+
+    rendered = render_llm_alias(canonical_file, canonical_data)
+    targets = dict.fromkeys([*LLM_SYNC_TOOL_FILES.values(), *LLM_SYNC_EXTRA_FILES])
+
+    cache = _StatCache()
+    for target in targets:
+        if target == canonical_file:
+            continue
+        target_path = repo / target
+        exists = cache.is_file(target_path)
+        if exists and target_path.read_bytes() == rendered:
+            continue
+        if dry_run:
+            click.echo(f"[DRY-RUN] Would update {target}")
+            continue
+        if exists:
+            store_backup(target_path, graveyard, repo)
+        if cache.is_symlink(target_path):
+            cache.unlink(target_path)
+        _write_atomic(target_path, rendered)
+        cache.forget(target_path)
+        mark_synced(target_path)
+
+    return synced
+
+
+def llm_sync_managed_files() -> List[str]:
+    return list(
+        dict.fromkeys([LLM_SYNC_CONFIG_NAME, *LLM_SYNC_TOOL_FILES.values(), *LLM_SYNC_EXTRA_FILES])
+    )
+
+
+def _git_dir(repo: Path) -> Path:
+    git_dir = repo / ".git"
+    if git_dir.is_dir():
+        return git_dir
+    # Worktrees and submodules use a .git file; ask git where the real directory is.
+    completed = run_git_command(repo, ["rev-parse", "--absolute-git-dir"])
+    return Path(completed.stdout.strip())
+
+
+def _llm_sync_fingerprint(repo: Path) -> dict | None:
+    """Stat-only fingerprint of every file llm-sync reads or writes.
+
+    Returns ``None`` when a file changed too recently for its mtime to be
+    trusted, so racy states are never recorded as synced.
+    """
+
+    racy_after = time.time_ns() - RACY_MTIME_WINDOW_NS
+    fingerprint: dict[str, list[int] | None] = {}
+    for name in llm_sync_managed_files():
+        try:
+            info = os.stat(repo / name)
+        except FileNotFoundError:
+            fingerprint[name] = None
+            continue
+        if info.st_mtime_ns >= racy_after:
+            return None
+        fingerprint[name] = [info.st_size, info.st_mtime_ns, info.st_ino]
+    return fingerprint
+
+
+def _load_llm_sync_fingerprint(path: Path) -> dict | None:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+class LazyGroup(click.Group):
+    """Click group whose heavier subcommands live in sibling modules.
+
+    ``lazy_subcommands`` maps a command name to ``"module:attribute"``; the
+    module is only imported when that command is dispatched, so hot paths like
+    the pre-commit hook never load it. ``lazy_help`` gives each one's short
+    help so ``--help`` can list it without the import.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        lazy_help: dict[str, str] | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+        self.lazy_help = dict(lazy_help or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":", 1)
+            self.add_command(getattr(importlib.import_module(module_name), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.lazy_help and name not in self.commands:
+                rows.append((name, click.utils.make_default_short_help(self.lazy_help[name], limit)))
+                continue
+            command = self.get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+LAZY_SUBCOMMANDS = {
+    "serve": "project_manager_serve:serve",
+    "tmux": "project_manager_tmux:tmux",
+}
+# First docstring line of each lazy command, kept in step by tests/test_lazy_help.py.
+LAZY_SUBCOMMAND_HELP = {
+    "serve": "Keep a warm pm process on a Unix socket so commands skip startup.",
+    "tmux": "Manage tmux project scripts.",
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, lazy_help=LAZY_SUBCOMMAND_HELP)
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Print per-phase wall time and syscall counts to stderr when the command finishes.",
+)
+@click.option(
+    "--trace-json",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write a Chrome trace of the run (open in Perfetto or chrome://tracing).",
+)
+@click.pass_context
+def cli(ctx: click.Context, timings: bool, trace_json: Path | None) -> None:
+    """Personal project maintenance helpers."""
+
+    if timings or trace_json:
+        from project_manager_trace import start_tracing
+
+        start_tracing(ctx, timings, trace_json)
+
+
+@cli.group(name="llm:agents")
+def llm_agents_group() -> None:
+    """Manage LLM assistant documentation files."""
+
+
+def _effective_aliases(
+    llm_settings: dict,
+    canonical: str,
+    alias_names: Iterable[str],
+) -> List[str]:
+    alias_names = list(alias_names)
+    if alias_names:
+        effective_aliases = list(dict.fromkeys(alias_names))
+    else:
+        stored_aliases = llm_settings.get("aliases")
+        if stored_aliases is None:
+            stored_aliases = llm_settings.get("legacy")
+        effective_aliases = list(stored_aliases) if stored_aliases else list(DEFAULT_ALIAS_NAMES)
+    return [name for name in effective_aliases if name != canonical]
+
+
+def _sync_config_for(
+    repo: Path,
+    llm_settings: dict,
+    canonical: str | None,
+    alias_names: Iterable[str],
+    branch: str | None,
+    discovery: str | None,
+    dry_run: bool,
+) -> SyncConfig:
+    effective_canonical = canonical or llm_settings.get("canonical", DEFAULT_CANONICAL_NAME)
+    effective_discovery = (discovery or llm_settings.get("discovery", DEFAULT_DISCOVERY)).lower()
+    effective_aliases = _effective_aliases(llm_settings, effective_canonical, alias_names)
+    if "AGENTS.md" not in effective_aliases and effective_canonical != "AGENTS.md":
+        effective_aliases.append("AGENTS.md")
+
+    repo = repo.expanduser().resolve()
+
+    return SyncConfig(
+        repo_path=repo,
+        canonical_name=effective_canonical,
+        alias_names=effective_aliases,
+        branch=branch,
+        dry_run=dry_run,
+        graveyard_root=_graveyard_root(llm_settings),
+        discovery=effective_discovery,
+    )
+
+
+def _auto_gc(llm_settings: dict) -> None:
+    result = collect_graveyard_garbage(
+        _graveyard_root(llm_settings), _retention_policy(llm_settings), dry_run=False
+    )
+    if result.evicted:
+        _echo_gc_result(result, dry_run=False)
+
+
+@llm_agents_group.command("sync")
+@click.option(
+    "--repo",
+    "repo_path",
+    default=".",
+    type=click.Path(path_type=Path, exists=True, file_okay=False, dir_okay=True),
+    shell_complete=_complete_repo,
+    help="Path to the git repository (default: current directory).",
+)
+@click.option(
+    "--all",
+    "all_repos",
+    is_flag=True,
+    help="Sync every repository referenced by tmux launchers, workspaces and dir_map.sh.",
+)
+@click.option(
+    "--repos-from",
+    type=click.Path(path_type=Path, allow_dash=True),
+    default=None,
+    help="Sync every repository listed in a file, one path per line ('-' for stdin).",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel workers for --all/--repos-from (default: CPU count, max 8).",
+)
+@click.option(
+    "--branch",
+    default=None,
+    help="Branch to checkout before syncing (requires clean worktree).",
+)
+@click.option(
+    "--canonical",
+    default=None,
+    help="Canonical filename to retain (defaults to stored preference).",
+)
+@click.option(
+    "--alias",
+    "alias_names",
+    multiple=True,
+    help="Alternate filenames to promote to the canonical name (repeat option).",
+)
+@click.option(
+    "--discovery",
+    type=click.Choice(DISCOVERY_BACKENDS, case_sensitive=False),
+    default=None,
+    help="How to find assistant files: git index (honors .gitignore) or a filesystem walk.",
+)
+@click.option(
+    "--gc/--no-gc",
+    "run_gc",
+    default=None,
+    help="Garbage-collect the graveyard after applying changes (default: retention 'auto' setting).",
+)
+@click.option("--dry-run", is_flag=True, help="Preview actions without modifying files.")
+def sync_llm_agents(
+    repo_path: Path,
+    all_repos: bool,
+    repos_from: Path | None,
+    jobs: int | None,
+    branch: str | None,
+    canonical: str,
+    alias_names: tuple[str, ...],
+    discovery: str | None,
+    run_gc: bool | None,
+    dry_run: bool,
+) -> None:
+    """Canonicalize assistant documentation files within a repository."""
+
+    settings, llm_settings = _llm_settings()
+    if run_gc is None:
+        retention = {**DEFAULT_GRAVEYARD_RETENTION, **llm_settings.get("graveyard_retention", {})}
+        run_gc = bool(retention.get("auto"))
+
+    if all_repos or repos_from is not None:
+        if branch:
+            raise ProjectManagerError("--branch cannot be combined with --all or --repos-from.")
+        repos = discover_fleet_repos() if all_repos else []
+        if repos_from is not None:
+            repos = _unique_directories([*repos, *read_repo_list(repos_from)])
+        if not repos:
+            raise ProjectManagerError("No repositories found to sync.")
+        configs = [
+            _sync_config_for(repo, llm_settings, canonical, alias_names, None, discovery, dry_run)
+            for repo in repos
+        ]
+        results = sync_fleet(configs, jobs or min(8, os.cpu_count() or 1), dry_run)
+        if run_gc and any(result.applied for result in results):
+            _auto_gc(llm_settings)
+        return
+
+    base_config = _sync_config_for(
+        repo_path, llm_settings, canonical, alias_names, branch, discovery, dry_run
+    )
+
+    ensure_git_repo(base_config.repo_path)
+    if base_config.branch:
+        ensure_clean_worktree(base_config.repo_path)
+        checkout_branch(base_config.repo_path, base_config.branch, dry_run)
+
+    plan = plan_alias_sync(base_config)
+
+    if dry_run:
+        render_sync_plan(plan)
+        return
+
+    click.echo("Preview (no changes made):")
+    render_sync_plan(plan)
+    if not plan.operations:
+        return
+
+    if not click.confirm("Apply these changes?", default=True):
+        click.echo("Aborted without making changes.")
+        return
+
+    click.echo("Applying changes...")
+    apply_sync_plan(plan)
+    if run_gc:
+        _auto_gc(llm_settings)
+
+
+@llm_agents_group.command("unsync")
+@click.option(
+    "--repo",
+    "repo_path",
+    default=".",
+    type=click.Path(path_type=Path, exists=True, file_okay=False, dir_okay=True),
+    shell_complete=_complete_repo,
+    help="Path to the git repository (default: current directory).",
+)
+@click.option(
+    "--branch",
+    default=None,
+    help="Branch to checkout before removing symlinks (requires clean worktree).",
+)
+@click.option(
+    "--canonical",
+    default=None,
+    help="Canonical filename used for assistant documentation.",
+)
+@click.option(
+    "--alias",
+    "alias_names",
+    multiple=True,
+    help="Alternate filenames to remove if they are symlinks (repeat option).",
+)
+@click.option(
+    "--discovery",
+    type=click.Choice(DISCOVERY_BACKENDS, case_sensitive=False),
+    default=None,
+    help="How to find assistant files: git index (honors .gitignore) or a filesystem walk.",
+)
+@click.option("--dry-run", is_flag=True, help="Preview which symlinks would be removed.")
+def unsync_llm_agents(
+    repo_path: Path,
+    branch: str | None,
+    canonical: str | None,
+    alias_names: tuple[str, ...],
+    discovery: str | None,
+    dry_run: bool,
+) -> None:
+    """Remove assistant alias symlinks within a repository."""
+
+    _, llm_settings = _llm_settings()
+    effective_canonical = canonical or llm_settings.get("canonical", DEFAULT_CANONICAL_NAME)
+    effective_discovery = (discovery or llm_settings.get("discovery", DEFAULT_DISCOVERY)).lower()
+
+    effective_aliases = _effective_aliases(llm_settings, effective_canonical, alias_names)
+
+    repo = repo_path.expanduser().resolve()
+
+    ensure_git_repo(repo)
+    if branch:
+        ensure_clean_worktree(repo)
+        checkout_branch(repo, branch, dry_run)
+
+    removed = remove_alias_symlinks(
+        repo, effective_aliases, dry_run, effective_discovery, effective_canonical
+    )
+
+    if removed == 0:
+        click.echo("No assistant symlinks found.")
+    elif not dry_run:
+        noun = "symlink" if removed == 1 else "symlinks"
+        click.echo(f"Removed {removed} {noun}.")
+
+@llm_agents_group.command("install-hook")
+@click.option(
+    "--repo",
+    "repo_path",
+    default=".",
+    type=click.Path(path_type=Path, exists=True, file_okay=False, dir_okay=True),
+    shell_complete=_complete_repo,
+    help="Repository where the hook should be installed.",
+)
+@click.option("--force", is_flag=True, help="Overwrite an existing pre-commit hook.")
+@click.option(
+    "--engine",
+    type=click.Choice(HOOK_ENGINES, case_sensitive=False),
+    default="python",
+    show_default=True,
+    help="Run the sync in-process via `llm:agents hook-run` or through llm-sync.sh.",
+)
+def install_llm_hook(repo_path: Path, force: bool, engine: str) -> None:
+    """Install a pre-commit hook that syncs assistant context files before commits."""
+
+    repo = repo_path.expanduser().resolve()
+    ensure_git_repo(repo)
+    git_dir = repo / ".git"
+    if not git_dir.exists():
+        raise ProjectManagerError(
+            f"{repo} does not appear to be a git repository (missing .git directory)"
+        )
+
+    hooks_dir = git_dir / "hooks"
+    hook_path = hooks_dir / "pre-commit"
+    hooks_dir.mkdir(parents=True, exist_ok=True)
+
+    if hook_path.exists():
+        existing = hook_path.read_text(encoding="utf-8")
+        if HOOK_SIGNATURE not in existing and not force:
+            raise ProjectManagerError(
+                "A pre-commit hook already exists and was not installed by project-manager. "
+                "Use --force to overwrite it."
+            )
+
+    if engine.lower() == "python":
+        hook_lines = _python_hook_lines()
+    else:
+        hook_lines = _shell_hook_lines(_ensure_llm_sync_script())
+    hook_path.write_text("\n".join(hook_lines) + "\n", encoding="utf-8")
+    hook_path.chmod(0o755)
+    click.echo(f"Installed pre-commit hook at {hook_path}")
+
+
+def _staged_fast_path_lines() -> List[str]:
+    managed = " ".join(f"':(top){name}'" for name in llm_sync_managed_files())
+    return [
+        "# Skip the sync entirely when no managed file is staged.",
+        f'if git -C "$REPO_ROOT" diff --cached --quiet -- {managed}; then',
+        "  exit 0",
+        "fi",
+    ]
+
+
+def _python_hook_lines() -> List[str]:
+    return [
+        "#!/bin/bash",
+        "set -euo pipefail",
+        HOOK_SIGNATURE,
+        f'PYTHON="{sys.executable}"',
+        f'PM_SCRIPT="{PM_ENTRY_SCRIPT}"',
+        'REPO_ROOT="$(git rev-parse --show-toplevel)"',
+        *_staged_fast_path_lines(),
+        'if [ ! -f "$PM_SCRIPT" ]; then',
+        '  echo "llm-sync: missing project manager at $PM_SCRIPT" >&2',
+        '  exit 1',
+        'fi',
+        'exec "$PYTHON" "$PM_SCRIPT" llm:agents hook-run --repo "$REPO_ROOT" --stage',
+        "",
+    ]
+
+
+def _shell_hook_lines(script_path: Path) -> List[str]:
+    return [
+        "#!/bin/bash",
+        "set -euo pipefail",
+        HOOK_SIGNATURE,
+        f'SCRIPT_PATH="{script_path}"',
+        'REPO_ROOT="$(git rev-parse --show-toplevel)"',
+        *_staged_fast_path_lines(),
+        'if [ ! -x "$SCRIPT_PATH" ]; then',
+        '  echo "llm-sync: missing script at $SCRIPT_PATH" >&2',
+        '  exit 1',
+        'fi',
+        'output="$("$SCRIPT_PATH" --repo "$REPO_ROOT")"',
+        'status=$?',
+        'printf "%s\n" "$output"',
+        'if [ $status -ne 0 ]; then',
+        '  exit $status',
+        'fi',
+        'while IFS= read -r line; do',
+        '  case "$line" in',
+        '    "SYNCED_FILE:"*)',
+        '      file="${line#SYNCED_FILE: }"',
+        '      if [ -n "$file" ]; then',
+        '        git -C "$REPO_ROOT" add "$file"',
+        '      fi',
+        '      ;;',
+        '  esac',
+        'done <<< "$output"',
+        "",
+    ]
+
+
+@llm_agents_group.command("hook-run")
+@click.option(
+    "--repo",
+    "repo_path",
+    default=".",
+    type=click.Path(path_type=Path, exists=True, file_okay=False, dir_okay=True),
+    shell_complete=_complete_repo,
+    help="Repository to synchronize (default: current directory).",
+)
+@click.option("--stage", is_flag=True, help="Stage every synced file with a single git add.")
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Sync even if nothing changed since the last successful run.",
+)
+@click.option("--dry-run", is_flag=True, help="Preview actions without modifying files.")
+def hook_run_llm_agents(repo_path: Path, stage: bool, force: bool, dry_run: bool) -> None:
+    """Run the llm-sync pre-commit work in-process (replaces llm-sync.sh)."""
+
+    repo = repo_path.expanduser().resolve()
+    if dry_run:
+        run_llm_sync(repo, dry_run)
+        return
+
+    fingerprint_path = _git_dir(repo) / LLM_SYNC_FINGERPRINT_NAME
+    if not force:
+        with _trace_span("fingerprint"):
+            current = _llm_sync_fingerprint(repo)
+            unchanged = current is not None and current == _load_llm_sync_fingerprint(fingerprint_path)
+        if unchanged:
+            return
+
+    with _trace_span("llm-sync"):
+        synced = run_llm_sync(repo, dry_run)
+    if stage and synced:
+        run_git_command(repo, ["add", "--", *synced])
+
+    fingerprint = _llm_sync_fingerprint(repo)
+    if fingerprint is not None:
+        _write_atomic(fingerprint_path, json.dumps(fingerprint).encode())
+
+
+@llm_agents_group.command("remove-hook")
+@click.option(
+    "--repo",
+    "repo_path",
+    default=".",
+    type=click.Path(path_type=Path, exists=True, file_okay=False, dir_okay=True),
+    shell_complete=_complete_repo,
+    help="Repository where the hook should be removed.",
+)
+@click.option("--force", is_flag=True, help="Remove the hook even if it was not installed by project-manager.")
+def remove_llm_hook(repo_path: Path, force: bool) -> None:
+    """Remove the llm-sync pre-commit hook if present."""
+
+    repo = repo_path.expanduser().resolve()
+    ensure_git_repo(repo)
+    hooks_dir = repo / ".git" / "hooks"
+    hook_path = hooks_dir / "pre-commit"
+
+    if not hook_path.exists():
+        click.echo("No pre-commit hook found; nothing to remove.")
+        return
+
+    content = hook_path.read_text(encoding="utf-8")
+    if HOOK_SIGNATURE not in content and not force:
+        raise ProjectManagerError(
+            "Existing pre-commit hook was not installed by project-manager. Use --force to remove it."
+        )
+
+    hook_path.unlink()
+    click.echo(f"Removed pre-commit hook at {hook_path}")
+
+
+@llm_agents_group.command("configure")
+@click.option(
+    "--canonical",
+    default=None,
+    help="Set the canonical filename to use by default.",
+)
+@click.option(
+    "--alias",
+    "alias_names",
+    multiple=True,
+    help="Set alternate filenames (repeat option).",
+)
+@click.option(
+    "--graveyard",
+    "graveyard_root",
+    type=click.Path(path_type=Path),
+    help="Set backup directory root (default stored globally).",
+)
+@click.option("--show", is_flag=True, help="Display current settings without modifying them.")
+def configure_llm_agents(
+    canonical: str | None,
+    alias_names: tuple[str, ...],
+    graveyard_root: Path | None,
+    show: bool,
+) -> None:
+    """Persist LLM file preferences used by sync across repositories."""
+
+    settings, llm_settings = _llm_settings()
+
+    current_graveyard_root = _graveyard_root(llm_settings)
+
+    current_canonical = llm_settings.get("canonical", DEFAULT_CANONICAL_NAME)
+    current_aliases = llm_settings.get("aliases")
+    if current_aliases is None:
+        legacy_aliases = llm_settings.get("legacy")
+        current_aliases = list(legacy_aliases) if legacy_aliases else list(DEFAULT_ALIAS_NAMES)
+
+    if graveyard_root is not None:
+        graveyard_root = graveyard_root.expanduser()
+
+    if show:
+        click.echo("Current LLM settings:")
+        click.echo(f"  canonical: {current_canonical}")
+        click.echo(f"  aliases  : {', '.join(current_aliases)}")
+        click.echo(f"  graveyard: {current_graveyard_root}")
+        return
+
+    if canonical is None and not alias_names and graveyard_root is None:
+        click.echo("Current LLM settings:")
+        click.echo(f"  canonical: {current_canonical}")
+        click.echo(f"  aliases  : {', '.join(current_aliases)}")
+        click.echo(f"  graveyard: {current_graveyard_root}")
+
+        choices = list(dict.fromkeys([current_canonical, *current_aliases]))
+        if not choices:
+            choices = [current_canonical]
+
+        canonical = click.prompt(
+            "Choose canonical filename",
+            default=current_canonical,
+        ).strip() or current_canonical
+
+        default_aliases = [name for name in choices if name != canonical]
+        alias_input = click.prompt(
+            "Alternate filenames (comma-separated)",
+            default=", ".join(default_aliases),
+        ).strip()
+        alias_names = tuple(
+            part.strip()
+            for part in alias_input.split(",")
+            if part.strip()
+        )
+        if not alias_names and default_aliases:
+            alias_names = tuple(default_aliases)
+
+        prompt_graveyard = click.prompt(
+            "Backup storage directory",
+            default=str(current_graveyard_root),
+        ).strip()
+        graveyard_root = Path(prompt_graveyard).expanduser() if prompt_graveyard else current_graveyard_root
+
+    if graveyard_root is None:
+        graveyard_root = current_graveyard_root
+
+    updated = False
+    if canonical:
+        llm_settings["canonical"] = canonical
+        updated = True
+    if alias_names:
+        llm_settings["aliases"] = list(dict.fromkeys(alias_names))
+        llm_settings.pop("legacy", None)
+        updated = True
+
+    if graveyard_root != current_graveyard_root:
+        llm_settings["graveyard_root"] = str(graveyard_root)
+        updated = True
+
+    if not updated:
+        click.echo("No changes provided. Use --canonical and/or --alias to update settings.")
+        return
+
+    _save_settings(settings)
+    click.echo("Preferences saved. Future syncs will use these defaults.")
+
+
+@cli.group()
+def graveyard() -> None:
+    """Inspect and restore backups stored in the shared graveyard."""
+
+
+def _format_timestamp(value: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(value))
+
+
+@graveyard.command("list")
+@click.option(
+    "--repo",
+    "repo_path",
+    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
+    default=None,
+    shell_complete=_complete_repo,
+    help="Only show backups taken from this repository.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=0),
+    default=50,
+    show_default=True,
+    help="Maximum number of entries to show, newest first (0 for all).",
+)
+def graveyard_list(repo_path: Path | None, limit: int) -> None:
+    """List graveyard backups from the index."""
+
+    _, llm_settings = _llm_settings()
+    entries = read_graveyard_index(_graveyard_root(llm_settings))
+    if repo_path is not None:
+        repo = str(repo_path.expanduser().resolve())
+        entries = [entry for entry in entries if entry.repo == repo]
+    if not entries:
+        click.echo("No backups found.")
+        return
+
+    entries.sort(key=lambda entry: entry.created, reverse=True)
+    for entry in entries[:limit] if limit else entries:
+        click.echo(
+            f"{_format_timestamp(entry.created)}  {entry.digest[:12]}  {entry.size:>8}  "
+            f"{_homeify_path(Path(entry.repo))}  {entry.path}"
+        )
+
+
+def _size_option(ctx: click.Context, param: click.Parameter, value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return _parse_size(value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+
+@graveyard.command("gc")
+@click.option(
+    "--max-size",
+    callback=_size_option,
+    default=None,
+    help="Total size budget for stored blobs, e.g. 500M or 2G (0 disables).",
+)
+@click.option(
+    "--max-age",
+    "max_age_days",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Evict backups older than this many days (0 disables).",
+)
+@click.option(
+    "--keep",
+    "keep_per_repo",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Keep at most this many backups per repository (0 disables).",
+)
+@click.option("--save", is_flag=True, help="Store the given limits as the default retention policy.")
+@click.option("--dry-run", is_flag=True, help="Report what would be evicted without deleting anything.")
+def graveyard_gc(
+    max_size: int | None,
+    max_age_days: float | None,
+    keep_per_repo: int | None,
+    save: bool,
+    dry_run: bool,
+) -> None:
+    """Evict old backups according to the retention policy and reclaim space."""
+
+    settings, llm_settings = _llm_settings()
+    overrides = {
+        "max_bytes": max_size,
+        "max_age_days": max_age_days,
+        "keep_per_repo": keep_per_repo,
+    }
+    policy = _retention_policy(llm_settings, **overrides)
+    if save:
+        retention = llm_settings.setdefault("graveyard_retention", {})
+        retention.update({key: value for key, value in overrides.items() if value is not None})
+        _save_settings(settings)
+
+    click.echo(
+        "Retention: "
+        f"size {_format_bytes(policy.max_bytes) if policy.max_bytes else 'unlimited'}, "
+        f"age {f'{policy.max_age_days:g} days' if policy.max_age_days else 'unlimited'}, "
+        f"per repo {policy.keep_per_repo or 'unlimited'}"
+    )
+    result = collect_graveyard_garbage(_graveyard_root(llm_settings), policy, dry_run)
+    _echo_gc_result(result, dry_run)
+
+
+@graveyard.command("restore")
+@click.argument("digest")
+@click.option(
+    "--repo",
+    "repo_path",
+    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
+    default=None,
+    shell_complete=_complete_repo,
+    help="Only consider backups taken from this repository.",
+)
+@click.option(
+    "--to",
+    "destination",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write the backup here instead of its original location.",
+)
+@click.option("--force", is_flag=True, help="Overwrite the destination if it already exists.")
+@click.option("--dry-run", is_flag=True, help="Preview the restore without writing files.")
+def graveyard_restore(
+    digest: str,
+    repo_path: Path | None,
+    destination: Path | None,
+    force: bool,
+    dry_run: bool,
+) -> None:
+    """Restore a backup by (a prefix of) its content hash."""
+
+    _, llm_settings = _llm_settings()
+    root = _graveyard_root(llm_settings)
+    entries = [entry for entry in read_graveyard_index(root) if entry.digest.startswith(digest)]
+    if repo_path is not None:
+        repo = str(repo_path.expanduser().resolve())
+        entries = [entry for entry in entries if entry.repo == repo]
+    if not entries:
+        raise ProjectManagerError(f"No backup matches {digest!r}.")
+    if len({entry.digest for entry in entries}) > 1:
+        raise ProjectManagerError(f"Hash prefix {digest!r} is ambiguous; use more characters.")
+
+    entry = max(entries, key=lambda item: item.created)
+    blob = graveyard_blob_path(root, entry.digest)
+    if not blob.exists():
+        raise ProjectManagerError(f"Backup content missing from graveyard: {blob}")
+
+    target = (destination or Path(entry.repo) / entry.path).expanduser()
+    if os.path.lexists(target) and not force:
+        raise ProjectManagerError(f"{target} already exists. Use --force to overwrite it.")
+    if dry_run:
+        click.echo(f"[DRY-RUN] Would restore {entry.digest[:12]} to {target}")
+        return
+
+    if target.is_file() and not target.is_symlink():
+        try:
+            store_backup(target, root, Path(entry.repo))
+        except ValueError:
+            pass  # --to outside the original repository; nothing to record
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_target = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        _clone_file(blob, tmp_target)
+        os.replace(tmp_target, target)
+    except OSError:
+        tmp_target.unlink(missing_ok=True)
+        raise
+    click.echo(f"Restored {entry.path} ({entry.digest[:12]}) to {target}")
+
+
+def _parse_project_dir(script_text: str) -> Path | None:
+    for line in script_text.splitlines():
+        if line.startswith("PROJECT_DIR="):
+            value = line.split("=", 1)[1].strip().strip('"')
+            expanded = os.path.expandvars(value)
+            return Path(expanded).expanduser().resolve()
+    return None
+
+
+def _homeify_path(path: Path) -> str:
+    home = Path.home().resolve()
+    try:
+        relative = path.resolve().relative_to(home)
+        return f"$HOME/{relative.as_posix()}"
+    except ValueError:
+        return str(path)
+
+
+@cli.command("new")
+@click.argument("directory")
+@click.option("--dry-run", is_flag=True, help="Preview actions without applying changes.")
+def new_project(directory: str, dry_run: bool) -> None:
+    """Create a project skeleton under $HOME and scaffold tmux + aliases."""
+
+    from project_manager_tmux import (
+        TmuxSession,
+        _alias_token,
+        _ensure_aliases_for_session,
+        _prompt_tmux_windows,
+        _tmux_script_path,
+        _tmux_spec_path,
+        write_session,
+    )
+
+    base_dir = click.prompt("Base directory under home", default="code")
+    base_path = (Path.home() / base_dir).expanduser().resolve()
+
+    relative_path = Path(directory)
+    project_path = (base_path / relative_path).expanduser().resolve()
+    click.echo(f"Project directory: {project_path}")
+    if dry_run:
+        click.echo("[DRY-RUN] Would create project directory if missing")
+    else:
+        project_path.mkdir(parents=True, exist_ok=True)
+
+    is_empty = not any(project_path.iterdir())
+    git_dir = project_path / ".git"
+    if is_empty and not git_dir.exists():
+        click.echo("[INFO] Directory empty; eligible for git init")
+        result = subprocess.run(
+            ["git", "init"],
+            cwd=str(project_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        if dry_run:
+            click.echo("[DRY-RUN] Would run git init")
+        else:
+            if result.returncode != 0:
+                raise ProjectManagerError(f"git init failed: {result.stderr.strip()}")
+            click.echo(f"Initialized git repository in {project_path}")
+
+    default_session = relative_path.name.replace("-", "_") or "project"
+    session_name = click.prompt("Tmux session name", default=default_session).strip()
+    if not session_name:
+        raise ProjectManagerError("Tmux session name cannot be empty.")
+
+    windows, ensure_python_venv, _ = _prompt_tmux_windows(project_path, None)
+    session = TmuxSession(
+        name=session_name,
+        project_dir=project_path,
+        windows=windows,
+        python_venv=ensure_python_venv,
+    )
+    script_path = _tmux_script_path(session_name).expanduser().resolve()
+
+    overwrite = True
+    if script_path.exists():
+        overwrite = click.confirm(f"{script_path} exists. Overwrite?", default=False)
+        if dry_run:
+            click.echo(f"[DRY-RUN] Would {'overwrite' if overwrite else 'skip overwriting'} existing script")
+            if not overwrite:
+                return
+        elif not overwrite:
+            raise ProjectManagerError("Aborted: tmux script already exists.")
+
+    if dry_run:
+        click.echo(f"[DRY-RUN] Would write session spec to {_tmux_spec_path(session_name)}")
+        click.echo(f"[DRY-RUN] Would write tmux script to {script_path}")
+    else:
+        spec_path, script_path = write_session(session, overwrite=overwrite)
+        click.echo(f"Created session spec at {spec_path}")
+        click.echo(f"Created tmux script at {script_path}")
+
+    if dry_run:
+        click.echo("[DRY-RUN] Would update shell aliases")
+    else:
+        token = _alias_token(session_name)
+        alias_added = _ensure_aliases_for_session(session_name, script_path)
+        if alias_added:
+            click.echo(
+                f"Registered aliases tm{token} and tma{token} in {ALIASES_FILE}"
+            )
+            click.echo(
+                "Reminder: reload your shell (e.g. run your dotfiles bootstrap) so the new aliases are available."
+            )
+        else:
+            click.echo(
+                f"Aliases tm{token} and tma{token} already present in {ALIASES_FILE}"
+            )
+
+    if dry_run:
+        click.echo("Dry-run complete. Re-run without --dry-run to apply changes.")
+    else:
+        click.echo(f"Project directory ready at {project_path}")
+
+
+@cli.command("workspace")
+@click.option(
+    "--name",
+    default=None,
+    shell_complete=_complete_workspace,
+    help="Workspace filename stem (defaults to current directory name).",
+)
+@click.option(
+    "--projects-root",
+    default=str(PROJECTS_ROOT),
+    type=click.Path(path_type=Path, exists=True, file_okay=False, dir_okay=True),
+    help="Directory where workspace files live (defaults to ~/code/projects).",
+)
+@click.option(
+    "--folder",
+    "folders",
+    multiple=True,
+    type=click.Path(path_type=Path),
+    help="Additional folders to include (repeatable). Defaults to current directory.",
+)
+@click.option("--force", is_flag=True, help="Overwrite existing workspace file if present.")
+def scaffold_workspace(
+    name: str | None,
+    projects_root: Path,
+    folders: tuple[Path, ...],
+    force: bool,
+) -> None:
+    """Generate a VS Code / Positron workspace file under the projects directory."""
+
+    root = projects_root.expanduser().resolve()
+    if name is None:
+        name = Path.cwd().stem
+    name = name.strip()
+    if not name:
+        raise ProjectManagerError("Workspace name cannot be empty.")
+
+    workspace_path = root / f"{name}.code-workspace"
+    if workspace_path.exists() and not force:
+        raise ProjectManagerError(
+            f"Workspace file already exists at {workspace_path}. Use --force to overwrite."
+        )
+
+    if folders:
+        folder_paths = [path.expanduser().resolve() for path in folders]
+    else:
+        folder_paths = [Path.cwd().resolve()]
+
+    def relative_to_workspace(path: Path) -> str:
+        rel = os.path.relpath(path, start=workspace_path.parent)
+        return Path(rel).as_posix()
+
+    folder_entries = [
+        {"path": relative_to_workspace(folder_path)} for folder_path in folder_paths
+    ]
+
+    payload = {
+        "folders": folder_entries,
+        "settings": {},
+    }
+
+    workspace_path.parent.mkdir(parents=True, exist_ok=True)
+    with workspace_path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+        handle.write("\n")
+
+    click.echo(f"Created workspace at {workspace_path}")
+    click.echo("Folders:")
+    for entry in folder_entries:
+        click.echo(f"  - {entry['path']}")
+
+
+def main() -> None:
+    cli(prog_name="project-manager")
@@ -0,0 +1,320 @@
+"""Compiled ``.gitignore`` / ``.pmignore`` matching for assistant-file discovery.
+
+Patterns follow gitignore semantics: ``#`` comments, ``!`` negation, a
+trailing ``/`` for directories only, a slash elsewhere to anchor the pattern
+to its file's directory, and ``*``, ``?``, ``[...]`` and ``**`` globs, with
+bracket expressions parsed the way git's wildmatch parses them. Each
+ignore file is compiled to regular expressions once (per process, keyed by
+stat). ``IgnoreMatcher`` carries the rules in effect inside one directory, so
+a walk can test entries by name and skip ignored subtrees without descending.
+"""
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Collection, Iterable
+
+# Read in this order in every directory, so .pmignore rules win over .gitignore.
+IGNORE_FILES = (".gitignore", ".pmignore")
+PM_IGNORE_FILE = ".pmignore"
+# Repository-wide excludes that git applies but that live outside the tree.
+GIT_INFO_EXCLUDE = os.path.join(".git", "info", "exclude")
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    pattern: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+    # Anchored rules match the path relative to the ignore file's directory;
+    # the rest match the entry name at any depth.
+    anchored: bool
+
+
+# POSIX classes allowed inside brackets, as regex set members. Like git,
+# they are ASCII-only.
+_POSIX_CLASSES = {
+    "alnum": "a-zA-Z0-9",
+    "alpha": "a-zA-Z",
+    "blank": " \\t",
+    "cntrl": "\\x00-\\x1f\\x7f",
+    "digit": "0-9",
+    "graph": "!-~",
+    "lower": "a-z",
+    "print": " -~",
+    "punct": "!-/:-@\\[-`{-~",
+    "space": " \\t\\n\\r\\f\\v",
+    "upper": "A-Z",
+    "xdigit": "0-9A-Fa-f",
+}
+
+
+def _set_member(char: str) -> str:
+    return "\\" + char if char in "\\]^-[" else char
+
+
+def _translate_bracket(segment: str, index: int) -> tuple[str, int]:
+    """Translate the bracket expression opened just before ``index``, as git's wildmatch does.
+
+    A ``]`` right after the opening ``[`` (or ``[!``/``[^``) is a member,
+    ``a-z`` is a range (an inverted one matches only its start) and ``[:alpha:]``
+    style classes are expanded. Brackets never match ``/``. Returns the regex
+    and the index after the closing ``]``; raises ``re.error`` where git's
+    matcher would give up on the pattern.
+    """
+
+    negated = segment[index : index + 1] in ("!", "^")
+    index += negated
+    members: list[str] = []
+    range_start: str | None = None
+    first = True
+    while True:
+        if index >= len(segment):
+            raise re.error("unterminated character set")
+        char = segment[index]
+        index += 1
+        if char == "]" and not first:
+            break
+        first = False
+        if char == "\\":
+            if index >= len(segment):
+                raise re.error("unterminated character set")
+            char = segment[index]
+            index += 1
+        elif char == "-" and range_start is not None and segment[index : index + 1] not in ("", "]"):
+            end = segment[index]
+            index += 1
+            if end == "\\":
+                if index >= len(segment):
+                    raise re.error("unterminated character set")
+                end = segment[index]
+                index += 1
+            # wildmatch has already counted the start as a member, so an
+            # inverted range still matches its first character.
+            if range_start <= end:
+                members[-1] = f"{_set_member(range_start)}-{_set_member(end)}"
+            range_start = None
+            continue
+        elif char == "[" and segment[index : index + 1] == ":":
+            close = segment.find("]", index + 1)
+            if close == -1:
+                raise re.error("unterminated character set")
+            if close > index + 1 and segment[close - 1] == ":":
+                name = segment[index + 1 : close - 1]
+                if name not in _POSIX_CLASSES:
+                    raise re.error(f"unknown character class [:{name}:]")
+                members.append(_POSIX_CLASSES[name])
+                range_start = None
+                index = close + 1
+                continue
+        members.append(_set_member(char))
+        range_start = char
+
+    if negated:
+        return f"[^/{''.join(members)}]", index
+    return f"(?!/)[{''.join(members)}]", index
+
+
+def _translate_segment(segment: str) -> str:
+    out = []
+    index = 0
+    while index < len(segment):
+        char = segment[index]
+        index += 1
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "\\":
+            if index >= len(segment):
+                raise re.error("trailing backslash")
+            out.append(re.escape(segment[index]))
+            index += 1
+        elif char == "[":
+            translated, index = _translate_bracket(segment, index)
+            out.append(translated)
+        else:
+            out.append(re.escape(char))
+    return "".join(out)
+
+
+def compile_ignore_line(line: str) -> IgnoreRule | None:
+    """Compile one gitignore line.
+
+    Returns ``None`` for blanks and comments, and for malformed patterns
+    (an unterminated ``[``, an unknown ``[:class:]``, a trailing backslash),
+    which git never matches either.
+    """
+
+    line = line.rstrip("\n").rstrip("\r")
+    # Trailing spaces are ignored unless escaped.
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+    if not line or line.startswith("#"):
+        return None
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    anchored = "/" in line
+    line = line.lstrip("/")
+
+    parts = []
+    segments = line.split("/")
+    try:
+        for position, segment in enumerate(segments):
+            last = position == len(segments) - 1
+            if segment == "**":
+                parts.append(".+" if last else "(?:[^/]+/)*")
+            else:
+                parts.append(_translate_segment(segment) + ("" if last else "/"))
+        pattern = re.compile("".join(parts) + r"\Z")
+    except re.error:
+        return None
+    return IgnoreRule(pattern, negated, dir_only, anchored)
+
+
+def _combined(rules: list[IgnoreRule]) -> re.Pattern[str] | None:
+    if not rules:
+        return None
+    return re.compile("|".join(f"(?:{rule.pattern.pattern})" for rule in rules))
+
+
+@dataclass(frozen=True)
+class IgnoreRules:
+    """The compiled rules of one ignore file.
+
+    ``names`` and ``paths`` join the name-only and anchored patterns into one
+    regex each, so the common case (no rule matches) costs at most two
+    ``match`` calls however long the file is.
+    """
+
+    rules: tuple[IgnoreRule, ...]
+    names: re.Pattern[str] | None
+    paths: re.Pattern[str] | None
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[IgnoreRule]) -> IgnoreRules:
+        rules = tuple(rules)
+        return cls(
+            rules,
+            _combined([rule for rule in rules if not rule.anchored]),
+            _combined([rule for rule in rules if rule.anchored]),
+        )
+
+    def match(self, name: str, relative: str, is_dir: bool) -> bool | None:
+        """``True``/``False`` from the last matching rule, ``None`` if none match."""
+
+        if not (self.names is not None and self.names.match(name)) and not (
+            self.paths is not None and self.paths.match(relative)
+        ):
+            return None
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.pattern.match(relative if rule.anchored else name):
+                return not rule.negated
+        return None
+
+
+NO_RULES = IgnoreRules.from_rules(())
+
+
+def compile_ignore_lines(lines: Iterable[str]) -> IgnoreRules:
+    return IgnoreRules.from_rules(rule for rule in map(compile_ignore_line, lines) if rule is not None)
+
+
+_FILE_RULES: dict[str, tuple[tuple[int, int], IgnoreRules]] = {}
+
+
+def load_ignore_file(path: str) -> IgnoreRules:
+    """Compile the ignore file at ``path``; missing or unreadable files yield no rules."""
+
+    try:
+        info = os.stat(path)
+    except OSError:
+        return NO_RULES
+    key = (info.st_mtime_ns, info.st_size)
+    cached = _FILE_RULES.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(path, "r", encoding="utf-8", errors="surrogateescape") as handle:
+            rules = compile_ignore_lines(handle)
+    except OSError:
+        return NO_RULES
+    _FILE_RULES[path] = (key, rules)
+    return rules
+
+
+class IgnoreMatcher:
+    """Ignore rules in effect inside one directory.
+
+    ``path`` is this directory relative to the walk root (``""`` or ending in
+    ``/``), and ``groups`` pairs each ignore file's rules with the length of
+    ``path`` where that file lives, so ``path[base:]`` is the directory
+    relative to the file. Deeper files come later and take precedence, as do
+    later lines within a file.
+    """
+
+    __slots__ = ("groups", "path", "anchored")
+
+    def __init__(
+        self,
+        groups: tuple[tuple[int, IgnoreRules], ...] = (),
+        path: str = "",
+        anchored: bool = False,
+    ) -> None:
+        self.groups = groups
+        self.path = path
+        self.anchored = anchored
+
+    def with_rules(self, rules: IgnoreRules) -> IgnoreMatcher:
+        """Add rules from an ignore file located in this directory."""
+
+        if not rules.rules:
+            return self
+        anchored = self.anchored or rules.paths is not None
+        return IgnoreMatcher((*self.groups, (len(self.path), rules)), self.path, anchored)
+
+    def child(self, name: str) -> IgnoreMatcher:
+        """Return the matcher for subdirectory ``name``."""
+
+        # Name-only rules never look at the path, so without anchored rules
+        # every subdirectory can share this matcher.
+        if not self.anchored:
+            return self
+        return IgnoreMatcher(self.groups, f"{self.path}{name}/", True)
+
+    def ignored(self, name: str, is_dir: bool) -> bool:
+        for base, rules in reversed(self.groups):
+            relative = self.path[base:] + name if rules.paths is not None else name
+            verdict = rules.match(name, relative, is_dir)
+            if verdict is not None:
+                return verdict
+        return False
+
+
+EMPTY_MATCHER = IgnoreMatcher()
+
+
+def directory_matcher(parent: IgnoreMatcher, directory: str, ignore_files: Collection[str]) -> IgnoreMatcher:
+    """Extend ``parent`` with the ignore files found in ``directory`` (in ``IGNORE_FILES`` order)."""
+
+    matcher = parent
+    for name in IGNORE_FILES:
+        if name in ignore_files:
+            matcher = matcher.with_rules(load_ignore_file(os.path.join(directory, name)))
+    return matcher
+
+
+def root_matcher(root: str) -> IgnoreMatcher:
+    """Start a walk at ``root`` with the repository's ``.git/info/exclude`` rules."""
+
+    return EMPTY_MATCHER.with_rules(load_ignore_file(os.path.join(root, GIT_INFO_EXCLUDE)))
@@ -0,0 +1,292 @@
+"""``pm serve``: keep a warm project manager process on a Unix socket.
+
+Loaded on demand by ``project_manager_core.cli``. The daemon imports every
+command module once and keeps settings, repository discovery caches and the
+tmux launcher index parsed in memory. Each forwarded invocation runs in a
+forked child, so it starts warm but keeps its own cwd, environment and stdio.
+``project_manager_client`` is the other half of the protocol.
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import click
+
+import project_manager_tmux
+from project_manager_client import code_signature, connect, socket_path
+from project_manager_core import (
+    DISCOVERY_CACHE_ROOT,
+    ProjectManagerError,
+    _load_json_cached,
+    _load_settings,
+    cli,
+)
+from project_manager_tmux import _duration_option, _format_duration, known_sessions
+
+DEFAULT_SERVE_IDLE = "8h"
+SERVE_LOG = Path.home() / ".local" / "share" / "project-manager" / "serve.log"
+# How often an idle daemon re-stats its caches and checks for code changes.
+SERVE_REFRESH_SECONDS = 30.0
+SERVE_REQUEST_TIMEOUT = 5.0
+SERVE_MAX_REQUEST_BYTES = 1 << 20
+# Imported lazily by individual commands; preloading them is free for forked
+# handlers.
+SERVE_PRELOAD_MODULES = ("asyncio", "concurrent.futures", "urllib.request", "project_manager_ignore")
+
+
+def warm_caches() -> None:
+    """Load every command module and parse the caches request handlers read.
+
+    Cheap to repeat: parsed files are memoised by stat, so only files that
+    changed since the previous call are read again.
+    """
+
+    for module_name in SERVE_PRELOAD_MODULES:
+        importlib.import_module(module_name)
+    ctx = click.Context(cli)
+    for name in cli.list_commands(ctx):
+        cli.get_command(ctx, name)
+    _load_settings()
+    for cache_path in DISCOVERY_CACHE_ROOT.glob("*.json"):
+        try:
+            _load_json_cached(cache_path, copied=False)
+        except (OSError, ValueError):
+            continue
+    known_sessions()
+
+
+def _log(message: str) -> None:
+    click.echo(f"{time.strftime('%Y-%m-%d %H:%M:%S')} pm serve[{os.getpid()}]: {message}", err=True)
+
+
+def _reply(conn: socket.socket, payload: dict) -> None:
+    conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+
+
+def _receive_request(conn: socket.socket) -> tuple[dict, list[int]]:
+    conn.settimeout(SERVE_REQUEST_TIMEOUT)
+    data, fds, _flags, _addr = socket.recv_fds(conn, 65536, 3)
+    try:
+        while b"\n" not in data:
+            chunk = conn.recv(65536)
+            if not chunk or len(data) > SERVE_MAX_REQUEST_BYTES:
+                raise ValueError("truncated request")
+            data += chunk
+        request = json.loads(data)
+        if not isinstance(request, dict):
+            raise ValueError("malformed request")
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+    return request, fds
+
+
+def _exit_status(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    click.echo(code, err=True)
+    return 1
+
+
+def _handle_request(conn: socket.socket, request: dict, fds: list[int]) -> None:
+    """Run one forwarded invocation inside a forked child. Never returns."""
+
+    status = 1
+    try:
+        os.setsid()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+        sys.stdout = open(1, "w", encoding="utf-8", buffering=1 if os.isatty(1) else -1, closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", errors="backslashreplace", buffering=1, closefd=False)
+        # A missing cwd aborts before the pid is sent, so the client falls back.
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = ["project-manager", *request["argv"]]
+        _reply(conn, {"pid": os.getpid()})
+
+        def hand_off(argv: list[str]) -> None:
+            # Programs that need the terminal (tmux attach) must run in the
+            # caller's session; the client execs them in place of this reply.
+            sys.stdout.flush()
+            sys.stderr.flush()
+            _reply(conn, {"exec": argv})
+            os._exit(0)
+
+        project_manager_tmux.EXEC_HANDOFF = hand_off
+        try:
+            cli.main(args=list(request["argv"]), prog_name="project-manager")
+            status = 0
+        except SystemExit as exc:
+            status = _exit_status(exc.code)
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        _reply(conn, {"exit": status})
+    finally:
+        os._exit(status)
+
+
+def _serve_forever(listener: socket.socket, idle_seconds: float) -> None:
+    signature = code_signature()
+    listener.settimeout(min(SERVE_REFRESH_SECONDS, idle_seconds))
+    deadline = time.monotonic() + idle_seconds
+    while True:
+        try:
+            conn, _ = listener.accept()
+        except socket.timeout:
+            if code_signature() != signature:
+                _log("code changed on disk; exiting")
+                return
+            if time.monotonic() >= deadline:
+                _log(f"idle for {_format_duration(idle_seconds)}; exiting")
+                return
+            warm_caches()
+            continue
+        deadline = time.monotonic() + idle_seconds
+        with conn:
+            try:
+                request, fds = _receive_request(conn)
+            except (OSError, ValueError):
+                continue
+            try:
+                if request.get("op") == "stop":
+                    _reply(conn, {"stopped": os.getpid()})
+                    _log("stop requested; exiting")
+                    return
+                if request.get("signature") != signature:
+                    # Forked handlers would run the old code; decline so the
+                    # client runs in-process, and make way for a fresh daemon.
+                    _reply(conn, {"stale": True})
+                    _log("code changed on disk; exiting")
+                    return
+                if len(fds) != 3 or not isinstance(request.get("argv"), list):
+                    continue
+                if os.fork() == 0:
+                    listener.close()
+                    _handle_request(conn, request, fds)
+            finally:
+                for fd in fds:
+                    os.close(fd)
+
+
+def _bind_listener(path: Path) -> socket.socket:
+    client = connect(str(path))
+    if client is not None:
+        client.close()
+        raise ProjectManagerError(f"pm serve is already listening on {path}")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if path.is_socket():
+            path.unlink()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(path))
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+        listener.listen(64)
+    except OSError as exc:
+        raise ProjectManagerError(f"Could not listen on {path}: {exc}") from exc
+    return listener
+
+
+def _stop_daemon(path: Path) -> None:
+    client = connect(str(path))
+    if client is None:
+        click.echo(f"No pm serve daemon is listening on {path}.")
+        return
+    with client:
+        client.sendall(json.dumps({"op": "stop"}).encode("utf-8") + b"\n")
+        reply = json.loads(client.makefile("rb").readline() or b"{}")
+    click.echo(f"Stopped pm serve (pid {reply.get('stopped', '?')}).")
+
+
+def _detach() -> bool:
+    """Fork into the background; return ``True`` in the daemon, ``False`` in the caller."""
+
+    if os.fork() != 0:
+        return False
+    os.setsid()
+    SERVE_LOG.parent.mkdir(parents=True, exist_ok=True)
+    log_fd = os.open(SERVE_LOG, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    null_fd = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null_fd, 0)
+    os.dup2(log_fd, 1)
+    os.dup2(log_fd, 2)
+    os.close(null_fd)
+    os.close(log_fd)
+    return True
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Socket to listen on (default: $PM_SOCKET, else under $XDG_RUNTIME_DIR or ~/.local/share). "
+    "Clients find a non-default socket through $PM_SOCKET.",
+)
+@click.option(
+    "--idle-timeout",
+    "idle_seconds",
+    default=DEFAULT_SERVE_IDLE,
+    show_default=True,
+    callback=_duration_option,
+    help="Exit after this long without requests (e.g. 30m, 8h).",
+)
+@click.option("--detach", is_flag=True, help=f"Run in the background, logging to {SERVE_LOG}.")
+@click.option("--stop", is_flag=True, help="Stop the running daemon and exit.")
+def serve(socket_file: Path | None, idle_seconds: float, detach: bool, stop: bool) -> None:
+    """Keep a warm pm process on a Unix socket so commands skip startup.
+
+    While it is listening, the pm entry script forwards every invocation to
+    it and runs in-process otherwise. Set PM_NO_DAEMON=1 to bypass it for one
+    command. The daemon exits by itself when pm's code changes on disk.
+    """
+
+    path = socket_file or Path(socket_path())
+    if stop:
+        _stop_daemon(path)
+        return
+
+    listener = _bind_listener(path)
+    if detach and not _detach():
+        listener.close()
+        click.echo(f"pm serve listening on {path} (log: {SERVE_LOG}).")
+        return
+
+    identity = path.stat().st_ino
+    try:
+        warm_caches()
+        _log(f"listening on {path} (idle timeout {_format_duration(idle_seconds)})")
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        # Handlers are never waited for; let the kernel reap them.
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        _serve_forever(listener, idle_seconds)
+    except KeyboardInterrupt:
+        _log("interrupted; exiting")
+    finally:
+        listener.close()
+        try:
+            if path.stat().st_ino == identity:
+                path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,1907 @@
+"""tmux session commands for the project manager CLI.
+
+Loaded on demand by ``project_manager_core.cli`` the first time ``pm tmux`` is
+dispatched. Readiness probes import asyncio and urllib only when they run.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Iterable, List
+
+import click
+
+from project_manager_core import (
+    ALIASES_FILE,
+    TMUX_DIR,
+    TMUX_SPEC_DIR,
+    ProjectManagerError,
+    _complete_session,
+    _echo_table,
+    _format_bytes,
+    _homeify_path,
+    _load_json_cached,
+    _parse_project_dir,
+    _trace_span,
+    _write_atomic,
+)
+
+TMUX_SNAPSHOT_DIR = Path.home() / ".local" / "share" / "project-manager" / "tmux-snapshots"
+TMUX_LAUNCHER_CACHE = Path.home() / ".local" / "share" / "project-manager" / "tmux-launchers.json"
+TMUX_LAUNCHER_CACHE_VERSION = 1
+DEFAULT_REAP_IDLE = "4h"
+READINESS_KINDS = ("tcp", "http", "path", "command")
+PROBE_INITIAL_DELAY = 0.05
+PROBE_MAX_DELAY = 2.0
+PROBE_ATTEMPT_TIMEOUT = 2.0
+GENERATED_LAUNCHER_PREFIX = "# Generated by project-manager from"
+TMUX_LAZY_OPTION = "@pm-lazy"
+# Fired whenever a session's current window changes: if the new window still
+# carries deferred commands (one per line in @pm-lazy), type each into its pane
+# followed by Enter, then clear the option so they only ever run once.
+TMUX_LAZY_HOOK = (
+    f'if-shell -F "#{{{TMUX_LAZY_OPTION}}}" "run-shell '
+    f"'tmux show-options -wqv -t #{{window_id}} {TMUX_LAZY_OPTION} | while IFS= read -r line; do "
+    'tmux send-keys -t #{pane_id} -l \\"\\$line\\"; tmux send-keys -t #{pane_id} Enter; done; '
+    f"tmux set-option -wu -t #{{window_id}} {TMUX_LAZY_OPTION}'\""
+)
+# Set by a ``pm serve`` handler. The handler runs in its own session, so an
+# exec'd ``tmux attach`` would miss the terminal's job control and SIGWINCH;
+# the hook hands the argv back to the client, which execs it instead.
+EXEC_HANDOFF: Callable[[List[str]], None] | None = None
+
+
+@dataclass
+class TmuxWindow:
+    name: str
+    path: Path
+    commands: List[str]
+    lazy: bool = False
+
+
+@dataclass
+class ReadinessCheck:
+    kind: str
+    target: str
+    timeout: float = 60.0
+
+
+@dataclass
+class TmuxSession:
+    name: str
+    project_dir: Path
+    windows: List[TmuxWindow]
+    python_venv: bool = False
+    ready: List[ReadinessCheck] = field(default_factory=list)
+    launcher: Path | None = None
+    main_name: str = "main"
+    main_commands: List[str] = field(default_factory=list)
+    select_window: int | None = None
+
+
+def _escape_double_quotes(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _render_readiness_check(check: ReadinessCheck) -> List[str]:
+    if check.kind == "tcp":
+        host, _, port = check.target.rpartition(":")
+        condition = f'nc -z "{_escape_double_quotes(host or "localhost")}" {port} >/dev/null 2>&1'
+    elif check.kind == "http":
+        condition = f'curl -fsS -o /dev/null "{_escape_double_quotes(check.target)}" >/dev/null 2>&1'
+    elif check.kind == "path":
+        condition = f'[ -e "{_escape_double_quotes(check.target)}" ]'
+    else:
+        condition = f"{check.target} >/dev/null 2>&1"
+    timeout = int(check.timeout)
+    label = _escape_double_quotes(f"{check.kind} {check.target}")
+    return [
+        f"    PM_DEADLINE=$((SECONDS + {timeout}))",
+        f"    until {condition}; do",
+        "        if [ $SECONDS -ge $PM_DEADLINE ]; then",
+        f'            echo "Timed out after {timeout}s waiting for {label}"',
+        "            break",
+        "        fi",
+        "        sleep 1",
+        "    done",
+        "",
+    ]
+
+
+def _render_tmux_script(
+    session_name: str,
+    project_dir: Path,
+    windows: List[TmuxWindow],
+    ensure_python_venv: bool,
+    ready: Iterable[ReadinessCheck] = (),
+    header: str | None = None,
+    main_name: str = "main",
+    main_commands: Iterable[str] = (),
+    select_window: int | None = None,
+) -> str:
+    project_dir_str = _escape_double_quotes(_homeify_path(project_dir))
+    lines: List[str] = ["#!/bin/zsh"]
+    if header:
+        lines.append(header)
+    lines.extend(
+        [
+            "",
+            f"SESSION_NAME=\"{session_name}\"",
+            f"PROJECT_DIR=\"{project_dir_str}\"",
+        ]
+    )
+
+    if ensure_python_venv:
+        lines.append('PYTHON_VENV="$PROJECT_DIR/.venv"')
+
+    lines.extend(
+        [
+            "",
+            "tmux has-session -t $SESSION_NAME 2>/dev/null",
+            "",
+            "if [ $? != 0 ]; then",
+        ]
+    )
+
+    if ensure_python_venv:
+        lines.extend(
+            [
+                "    if [ ! -d \"$PYTHON_VENV\" ]; then",
+                "        echo \"Creating Python virtual environment at $PYTHON_VENV\"",
+                "        python3 -m venv \"$PYTHON_VENV\"",
+                "    fi",
+                "",
+            ]
+        )
+
+    for check in ready:
+        lines.extend(_render_readiness_check(check))
+
+    lines.append(
+        f'    tmux new-session -d -s $SESSION_NAME -n "{_escape_double_quotes(main_name)}" -c "$PROJECT_DIR" /bin/zsh'
+    )
+    main_commands = list(main_commands)
+    for command in main_commands:
+        lines.append(f'    tmux send-keys -t $SESSION_NAME:0 "{_escape_double_quotes(command)}" C-m')
+    if main_commands:
+        lines.append("")
+
+    has_lazy = False
+    for index, window in enumerate(windows, start=1):
+        window_path = _escape_double_quotes(_homeify_path(window.path))
+        if window.lazy and window.commands:
+            has_lazy = True
+            lines.append(
+                f'    tmux new-window -d -t $SESSION_NAME:{index} -n "{window.name}" -c "{window_path}" /bin/zsh'
+            )
+            deferred = "$'\\n'".join(f'"{_escape_double_quotes(command)}"' for command in window.commands)
+            lines.append(f"    tmux set-option -w -t $SESSION_NAME:{index} {TMUX_LAZY_OPTION} {deferred}")
+            lines.append("")
+            continue
+        lines.append(
+            f'    tmux new-window -t $SESSION_NAME:{index} -n "{window.name}" -c "{window_path}" /bin/zsh'
+        )
+        for command in window.commands:
+            lines.append(
+                f'    tmux send-keys -t $SESSION_NAME:{index} "{_escape_double_quotes(command)}" C-m'
+            )
+        if window.commands:
+            lines.append("")
+
+    if has_lazy:
+        lines.append(f"    tmux set-hook -t $SESSION_NAME session-window-changed {shlex.quote(TMUX_LAZY_HOOK)}")
+    if select_window is not None:
+        lines.append(f"    tmux select-window -t $SESSION_NAME:{select_window}")
+
+    if lines[-1] != "":
+        lines.append("")
+
+    lines.extend(["fi", "", "tmux attach -t $SESSION_NAME", ""])
+    return "\n".join(lines)
+
+
+def _write_script(path: Path, content: str, overwrite: bool) -> None:
+    if path.exists() and not overwrite:
+        raise ProjectManagerError(f"File already exists: {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    path.chmod(0o755)
+
+
+def _tmux_script_path(session_name: str) -> Path:
+    return TMUX_DIR / f"start_{session_name}.sh"
+
+
+def _tmux_spec_path(session_name: str) -> Path:
+    return TMUX_SPEC_DIR / f"{session_name}.json"
+
+
+def _spec_path_value(path: Path) -> str:
+    home = Path.home().resolve()
+    try:
+        return f"~/{path.resolve().relative_to(home).as_posix()}"
+    except ValueError:
+        return str(path)
+
+
+def _spec_path(value: object, source: Path, field_name: str) -> Path:
+    if not isinstance(value, str) or not value:
+        raise ProjectManagerError(f"{source}: '{field_name}' must be a non-empty path string.")
+    return Path(os.path.expandvars(value)).expanduser()
+
+
+def session_to_spec(session: TmuxSession) -> dict:
+    """Serialise a session into the JSON spec layout stored under tmux/sessions."""
+
+    spec: dict = {
+        "session": session.name,
+        "project_dir": _spec_path_value(session.project_dir),
+        "python_venv": session.python_venv,
+    }
+    if session.launcher is not None:
+        spec["launcher"] = _spec_path_value(session.launcher)
+    if session.main_name != "main" or session.main_commands:
+        spec["main"] = {"name": session.main_name, "commands": list(session.main_commands)}
+    spec["windows"] = []
+    for window in session.windows:
+        entry: dict = {"name": window.name}
+        if window.path != session.project_dir:
+            entry["path"] = _spec_path_value(window.path)
+        entry["commands"] = list(window.commands)
+        if window.lazy:
+            entry["lazy"] = True
+        spec["windows"].append(entry)
+    if session.ready:
+        spec["ready"] = [
+            {"kind": check.kind, "target": check.target, "timeout": check.timeout}
+            for check in session.ready
+        ]
+    if session.select_window is not None:
+        spec["select_window"] = session.select_window
+    return spec
+
+
+def session_from_spec(data: object, source: Path) -> TmuxSession:
+    if not isinstance(data, dict):
+        raise ProjectManagerError(f"{source}: session spec must be a JSON object.")
+    name = data.get("session")
+    if not isinstance(name, str) or not name.strip():
+        raise ProjectManagerError(f"{source}: 'session' must be a non-empty string.")
+    project_dir = _spec_path(data.get("project_dir"), source, "project_dir")
+
+    windows: List[TmuxWindow] = []
+    for position, entry in enumerate(data.get("windows") or [], start=1):
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+            raise ProjectManagerError(f"{source}: window {position} needs a 'name'.")
+        commands = entry.get("commands") or []
+        if not isinstance(commands, list) or not all(isinstance(item, str) for item in commands):
+            raise ProjectManagerError(f"{source}: window '{entry['name']}' commands must be strings.")
+        path = _spec_path(entry["path"], source, "path") if "path" in entry else project_dir
+        windows.append(
+            TmuxWindow(
+                name=entry["name"],
+                path=path,
+                commands=list(commands),
+                lazy=bool(entry.get("lazy", False)),
+            )
+        )
+
+    ready: List[ReadinessCheck] = []
+    for entry in data.get("ready") or []:
+        kind = entry.get("kind") if isinstance(entry, dict) else None
+        if kind not in READINESS_KINDS or not isinstance(entry.get("target"), str):
+            raise ProjectManagerError(
+                f"{source}: readiness checks need a 'target' and a kind of {', '.join(READINESS_KINDS)}."
+            )
+        ready.append(ReadinessCheck(kind=kind, target=entry["target"], timeout=float(entry.get("timeout", 60))))
+
+    main = data.get("main") or {}
+    main_commands = (main.get("commands") or []) if isinstance(main, dict) else None
+    if (
+        not isinstance(main, dict)
+        or not isinstance(main.get("name", "main"), str)
+        or not isinstance(main_commands, list)
+        or not all(isinstance(item, str) for item in main_commands)
+    ):
+        raise ProjectManagerError(f"{source}: 'main' needs a string 'name' and string 'commands'.")
+
+    select_window = data.get("select_window")
+    if select_window is not None and (
+        isinstance(select_window, bool)
+        or not isinstance(select_window, int)
+        or not 0 <= select_window <= len(windows)
+    ):
+        raise ProjectManagerError(f"{source}: 'select_window' must be a window index from 0 to {len(windows)}.")
+
+    launcher = _spec_path(data["launcher"], source, "launcher") if "launcher" in data else None
+    return TmuxSession(
+        name=name.strip(),
+        project_dir=project_dir,
+        windows=windows,
+        python_venv=bool(data.get("python_venv", False)),
+        ready=ready,
+        launcher=launcher,
+        main_name=main.get("name", "main"),
+        main_commands=list(main_commands),
+        select_window=select_window,
+    )
+
+
+def load_session_spec(spec_path: Path) -> TmuxSession:
+    try:
+        data = json.loads(spec_path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ProjectManagerError(f"Session spec not found: {spec_path}") from exc
+    except json.JSONDecodeError as exc:
+        raise ProjectManagerError(f"Invalid JSON in {spec_path}: {exc}") from exc
+    return session_from_spec(data, spec_path)
+
+
+def save_session_spec(spec_path: Path, session: TmuxSession) -> None:
+    payload = json.dumps(session_to_spec(session), indent=2) + "\n"
+    _write_atomic(spec_path, payload.encode("utf-8"))
+
+
+def _launcher_path_for(session: TmuxSession) -> Path:
+    return session.launcher or _tmux_script_path(session.name)
+
+
+def _launcher_spec_digest(script_path: Path) -> str | None:
+    """Return the spec hash recorded in a generated launcher, or None if hand-written."""
+
+    try:
+        with script_path.open("r", encoding="utf-8") as handle:
+            head = [handle.readline() for _ in range(3)]
+    except FileNotFoundError:
+        return None
+    for line in head:
+        if line.startswith(GENERATED_LAUNCHER_PREFIX):
+            match = re.search(r"\(sha256:([0-9a-f]+)\)", line)
+            if match:
+                return match.group(1)
+    return None
+
+
+def compile_session_spec(spec_path: Path, force: bool = False) -> tuple[Path, bool]:
+    """Regenerate the launcher for ``spec_path`` only when the spec hash changed.
+
+    Returns the launcher path and whether it was rewritten. A hand-written
+    launcher (no generated header) is never overwritten without ``force``.
+    """
+
+    session = load_session_spec(spec_path)
+    raw = spec_path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()[:16]
+    script_path = _launcher_path_for(session)
+
+    existing = _launcher_spec_digest(script_path)
+    if not force:
+        if existing == digest:
+            return script_path, False
+        if existing is None and script_path.exists():
+            raise ProjectManagerError(
+                f"{script_path} was not generated from {spec_path.name}; use --force to replace it."
+            )
+
+    header = (
+        f"{GENERATED_LAUNCHER_PREFIX} {_spec_path_value(spec_path)} (sha256:{digest}). "
+        "Edit the spec, not this file."
+    )
+    content = _render_tmux_script(
+        session.name,
+        session.project_dir,
+        session.windows,
+        session.python_venv,
+        ready=session.ready,
+        header=header,
+        main_name=session.main_name,
+        main_commands=session.main_commands,
+        select_window=session.select_window,
+    )
+    _write_script(script_path, content, overwrite=True)
+    return script_path, True
+
+
+def write_session(session: TmuxSession, overwrite: bool) -> tuple[Path, Path]:
+    """Store ``session`` as a spec and compile its launcher."""
+
+    spec_path = _tmux_spec_path(session.name)
+    if not overwrite:
+        for path in (spec_path, _launcher_path_for(session)):
+            if path.exists():
+                raise ProjectManagerError(f"File already exists: {path}")
+    save_session_spec(spec_path, session)
+    script_path, _ = compile_session_spec(spec_path, force=overwrite)
+    return spec_path, script_path
+
+
+def _session_commands(session: TmuxSession) -> List[List[str]]:
+    """Build the same tmux layout as the generated launcher, as argv lists."""
+
+    variables = dict(os.environ)
+    variables["SESSION_NAME"] = session.name
+    variables["PROJECT_DIR"] = str(session.project_dir)
+    if session.python_venv:
+        variables["PYTHON_VENV"] = str(session.project_dir / ".venv")
+
+    def expand(value: str) -> str:
+        return _SHELL_VAR_PATTERN.sub(
+            lambda match: variables.get(match.group(1) or match.group(2), match.group(0)), value
+        )
+
+    commands: List[List[str]] = [
+        ["new-session", "-d", "-s", session.name, "-n", session.main_name, "-c", str(session.project_dir), "/bin/zsh"]
+    ]
+    for command in session.main_commands:
+        commands.append(["send-keys", "-t", f"{session.name}:0", expand(command), "C-m"])
+    has_lazy = False
+    for index, window in enumerate(session.windows, start=1):
+        target = f"{session.name}:{index}"
+        if window.lazy and window.commands:
+            has_lazy = True
+            commands.append(
+                ["new-window", "-d", "-t", target, "-n", window.name, "-c", str(window.path), "/bin/zsh"]
+            )
+            deferred = "\n".join(expand(command) for command in window.commands)
+            commands.append(["set-option", "-w", "-t", target, TMUX_LAZY_OPTION, deferred])
+            continue
+        commands.append(["new-window", "-t", target, "-n", window.name, "-c", str(window.path), "/bin/zsh"])
+        for command in window.commands:
+            commands.append(["send-keys", "-t", target, expand(command), "C-m"])
+    if has_lazy:
+        commands.append(["set-hook", "-t", session.name, "session-window-changed", TMUX_LAZY_HOOK])
+    if session.select_window is not None:
+        commands.append(["select-window", "-t", f"{session.name}:{session.select_window}"])
+    return commands
+
+
+def _prompt_tmux_windows(
+    project_dir: Path,
+    project_type: str | None,
+) -> tuple[List[TmuxWindow], bool, str]:
+    choices = ["data", "laravel", "cli"]
+    if project_type is None:
+        detected_type = click.prompt(
+            "Project type",
+            type=click.Choice(choices, case_sensitive=False),
+            default="cli",
+        )
+    else:
+        detected_type = project_type
+    detected_type = detected_type.lower()
+
+    windows: List[TmuxWindow] = []
+    include_claude = click.confirm("Include claude window?", default=True)
+    include_codex = click.confirm("Include codex window?", default=True)
+    include_zai = click.confirm("Include zai window?", default=True)
+
+    if include_claude:
+        windows.append(TmuxWindow(name="claude", path=project_dir, commands=["claude"]))
+    if include_codex:
+        windows.append(TmuxWindow(name="codex", path=project_dir, commands=["codex"]))
+    if include_zai:
+        windows.append(TmuxWindow(name="zai", path=project_dir, commands=["zai"]))
+
+    ensure_python_venv = False
+
+    if detected_type == "data":
+        use_r = click.confirm("Include R tooling?", default=True)
+        use_python = click.confirm("Include Python tooling (create virtualenv)?", default=False)
+
+        if use_r and click.confirm("Add R REPL window?", default=True):
+            windows.append(TmuxWindow(name="R", path=project_dir, commands=["R"]))
+
+        if use_python:
+            ensure_python_venv = True
+            if click.confirm("Add Python REPL window?", default=True):
+                windows.append(
+                    TmuxWindow(
+                        name="python",
+                        path=project_dir,
+                        commands=['source "$PYTHON_VENV/bin/activate"', "python3"],
+                    )
+                )
+
+    elif detected_type == "laravel":
+        if click.confirm("Add Laravel Tinker window?", default=True):
+            windows.append(TmuxWindow(name="tinker", path=project_dir, commands=["php artisan tinker"]))
+        if click.confirm("Add Laravel Horizon window?", default=True):
+            windows.append(TmuxWindow(name="horizon", path=project_dir, commands=["php artisan horizon"]))
+        if click.confirm("Add npm dev window?", default=True):
+            windows.append(TmuxWindow(name="npm", path=project_dir, commands=["npm run dev"]))
+
+    if windows and click.confirm("Defer window commands until each window is first selected?", default=False):
+        windows = [replace(window, lazy=True) for window in windows]
+
+    return windows, ensure_python_venv, detected_type
+
+
+@click.group()
+def tmux() -> None:
+    """Manage tmux project scripts."""
+
+
+@tmux.command("scaffold")
+@click.option(
+    "--session",
+    "session_name",
+    default=None,
+    shell_complete=_complete_session,
+    help="Tmux session name (e.g. computing).",
+)
+@click.option(
+    "--type",
+    "project_type",
+    type=click.Choice(["data", "laravel", "cli"], case_sensitive=False),
+    default=None,
+    help="Project type to scaffold.",
+)
+@click.option("--project-dir", type=click.Path(path_type=Path), default=None, help="Root directory for the project.")
+@click.option("--output", type=click.Path(path_type=Path), default=None, help="Custom output path for the script.")
+@click.option("--force", is_flag=True, help="Overwrite existing script if present.")
+def tmux_scaffold(
+    session_name: str | None,
+    project_type: str | None,
+    project_dir: Path | None,
+    output: Path | None,
+    force: bool,
+) -> None:
+    """Interactively scaffold a tmux start script in the projects directory."""
+
+    if session_name is None:
+        session_name = click.prompt("Session name", type=str)
+    session_name = session_name.strip()
+    if not session_name:
+        raise ProjectManagerError("Session name cannot be empty.")
+
+    default_dir = project_dir or Path.cwd()
+    project_dir = click.prompt(
+        "Project directory",
+        default=str(default_dir),
+        type=click.Path(path_type=Path),
+    )
+    project_dir = project_dir.expanduser().resolve()
+
+    windows, ensure_python_venv, _ = _prompt_tmux_windows(project_dir, project_type)
+
+    session = TmuxSession(
+        name=session_name,
+        project_dir=project_dir,
+        windows=windows,
+        python_venv=ensure_python_venv,
+        launcher=output.expanduser().resolve() if output else None,
+    )
+    spec_path, script_path = write_session(session, overwrite=force)
+
+    click.echo(f"Created session spec at {spec_path}")
+    click.echo(f"Created tmux script at {script_path}")
+
+    token = _alias_token(session_name)
+    alias_added = _ensure_aliases_for_session(session_name, script_path)
+    if alias_added:
+        click.echo(
+            f"Registered aliases tm{token} and tma{token} in {ALIASES_FILE}"
+        )
+        click.echo(
+            "Reminder: reload your shell (e.g. run your dotfiles bootstrap) so the new aliases are available."
+        )
+    else:
+        click.echo(
+            f"Aliases tm{token} and tma{token} already present in {ALIASES_FILE}"
+        )
+
+
+def _next_window_index(script_text: str) -> int:
+    matches = list(re.finditer(r":(\d+)\b", script_text))
+    indices = [int(match.group(1)) for match in matches]
+    return (max(indices) + 1) if indices else 1
+
+
+def _insert_before_final_fi(script_text: str, snippet: str) -> str:
+    lines = script_text.splitlines()
+    insert_at = None
+    for idx, line in enumerate(lines):
+        if line.strip() == "fi":
+            if any("tmux attach" in rest for rest in lines[idx + 1 :]):
+                insert_at = idx
+    if insert_at is None:
+        raise ProjectManagerError("Could not find insertion point in script.")
+    new_lines = lines[:insert_at] + snippet.splitlines() + lines[insert_at:]
+    return "\n".join(new_lines) + ("\n" if script_text.endswith("\n") else "")
+
+
+@tmux.command("add-tab")
+@click.option(
+    "--session",
+    "session_name",
+    required=True,
+    shell_complete=_complete_session,
+    help="Session name matching the script filename.",
+)
+@click.option("--name", "tab_name", required=True, help="Name for the new tmux window.")
+@click.option("--path", "tab_path", type=click.Path(path_type=Path), default=None, help="Working directory for the tab.")
+@click.option("--script", "script_path", type=click.Path(path_type=Path), default=None, help="Explicit path to the tmux start script.")
+def tmux_add_tab(
+    session_name: str,
+    tab_name: str,
+    tab_path: Path | None,
+    script_path: Path | None,
+) -> None:
+    """Add an additional window to an existing tmux session spec or start script."""
+
+    spec_path = _tmux_spec_path(session_name)
+    if script_path is None and spec_path.exists():
+        session = load_session_spec(spec_path)
+        if any(window.name == tab_name for window in session.windows):
+            raise ProjectManagerError(f"Session '{session.name}' already has a window named '{tab_name}'.")
+        target_dir = (tab_path or session.project_dir).expanduser().resolve()
+        session.windows.append(TmuxWindow(name=tab_name, path=target_dir, commands=[]))
+        save_session_spec(spec_path, session)
+        launcher, _ = compile_session_spec(spec_path)
+        click.echo(f"Added window '{tab_name}' (index {len(session.windows)}) to {spec_path}")
+        click.echo(f"Recompiled {launcher}")
+        return
+
+    path = script_path.expanduser().resolve() if script_path else _tmux_script_path(session_name)
+    if not path.exists():
+        raise ProjectManagerError(f"Script not found: {path}")
+
+    text = path.read_text(encoding="utf-8")
+    project_dir = _parse_project_dir(text)
+    if project_dir is None:
+        raise ProjectManagerError("Could not determine PROJECT_DIR from script.")
+
+    target_dir = (tab_path or project_dir).expanduser().resolve()
+    next_index = _next_window_index(text)
+
+    snippet_lines = [
+        f'    tmux new-window -t $SESSION_NAME:{next_index} -n "{tab_name}" -c "{_escape_double_quotes(_homeify_path(target_dir))}" /bin/zsh'
+    ]
+    snippet = "\n" + "\n".join(snippet_lines) + "\n"
+
+    updated_text = _insert_before_final_fi(text, snippet)
+    path.write_text(updated_text, encoding="utf-8")
+    click.echo(f"Added window '{tab_name}' (index {next_index}) to {path}")
+
+
+TMUX_LAYOUT_COMMANDS = frozenset(
+    {
+        "new-session",
+        "new-window",
+        "send-keys",
+        "select-window",
+        "split-window",
+        "select-pane",
+        "select-layout",
+        "rename-window",
+        "resize-pane",
+        "set-option",
+        "set-window-option",
+        "set-environment",
+    }
+)
+_SHELL_VAR_PATTERN = re.compile(r"\$(?:\{(\w+)\}|(\w+))")
+_SHELL_ASSIGNMENT_PATTERN = re.compile(r"^(\w+)=(.*)$")
+_SHELL_REDIRECTIONS = {"2>/dev/null", ">/dev/null", "&>/dev/null", "2>&1", "1>/dev/null"}
+_SHELL_SEPARATORS = {"||", "&&", ";", "|", "&"}
+_SHELL_CONTROL_WORDS = {"if", "then", "else", "elif", "fi", "echo", "sleep", "exit", "clear", "}", "done", "do"}
+
+
+@dataclass(frozen=True)
+class LauncherCommands:
+    session_name: str | None
+    commands: List[List[str]]
+    skipped: List[str]
+    session: TmuxSession | None = None
+
+
+def _expand_shell_vars(text: str, variables: dict) -> str:
+    """Expand ``$VAR``/``${VAR}`` outside single quotes, leaving unknown names intact.
+
+    Inside double quotes bash also drops the backslash before ``$``, a
+    backquote or a newline, which ``shlex`` would keep, so that is done here;
+    escaped quotes and backslashes are left to ``shlex``.
+    """
+
+    result: List[str] = []
+    quote: str | None = None
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char == "\\" and quote != "'":
+            escaped = text[index + 1 : index + 2]
+            if quote == '"' and escaped in ("$", "`"):
+                result.append(escaped)
+            elif quote == '"' and escaped == "\n":
+                pass
+            else:
+                result.append(text[index : index + 2])
+            index += 2
+            continue
+        if char in "'\"":
+            if quote is None:
+                quote = char
+            elif quote == char:
+                quote = None
+        elif char == "$" and quote != "'":
+            match = _SHELL_VAR_PATTERN.match(text, index)
+            if match:
+                name = match.group(1) or match.group(2)
+                if name in variables:
+                    result.append(variables[name])
+                    index = match.end()
+                    continue
+        result.append(char)
+        index += 1
+    return "".join(result)
+
+
+def _split_shell_words(line: str) -> List[str]:
+    try:
+        words = shlex.split(line, comments=True)
+    except ValueError as exc:
+        raise ProjectManagerError(f"Could not parse launcher line: {line.strip()} ({exc})") from exc
+    command: List[str] = []
+    for word in words:
+        if word in _SHELL_SEPARATORS:
+            break
+        if word in _SHELL_REDIRECTIONS:
+            continue
+        command.append(word)
+    return command
+
+
+def _parse_launcher_commands(script_text: str) -> LauncherCommands:
+    """Extract the tmux layout commands of a launcher script in execution order.
+
+    Top-level ``VAR=value`` assignments are expanded the way the shell would;
+    session lifecycle commands (``has-session``, ``kill-session``, ``attach``)
+    are dropped because ``pm tmux up`` handles them itself. Any other shell
+    step is reported in ``skipped`` rather than executed.
+    """
+
+    variables = dict(os.environ)
+    commands: List[List[str]] = []
+    skipped: List[str] = []
+    session_name: str | None = None
+
+    for raw_line in script_text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        assignment = _SHELL_ASSIGNMENT_PATTERN.match(line)
+        if assignment:
+            words = _split_shell_words(_expand_shell_vars(assignment.group(2), variables))
+            variables[assignment.group(1)] = words[0] if words else ""
+            continue
+        words = _split_shell_words(_expand_shell_vars(line, variables))
+        if not words:
+            continue
+        if words[0] != "tmux":
+            if words[0] not in _SHELL_CONTROL_WORDS and not words[0].startswith("["):
+                skipped.append(line)
+            continue
+        if len(words) < 2 or words[1] not in TMUX_LAYOUT_COMMANDS:
+            continue
+        if words[1] == "new-session" and "-s" in words[:-1]:
+            session_name = words[words.index("-s") + 1]
+        commands.append(words[1:])
+
+    return LauncherCommands(session_name=session_name, commands=commands, skipped=skipped)
+
+
+def _chain_tmux_commands(commands: List[List[str]]) -> List[str]:
+    """Join tmux commands into a single argv separated by ``;`` tokens."""
+
+    argv: List[str] = []
+    for command in commands:
+        if argv:
+            argv.append(";")
+        for arg in command:
+            # A trailing ";" inside an argument would otherwise end the command.
+            argv.append(arg[:-1] + "\\;" if arg.endswith(";") else arg)
+    return argv
+
+
+_TMUX_SAFE_WORD = re.compile(r"^[\w@%+=:,./-]+$")
+
+
+def _tmux_quote(arg: str) -> str:
+    if _TMUX_SAFE_WORD.match(arg):
+        return arg
+    if "'" not in arg and "\n" not in arg:
+        return f"'{arg}'"
+    escaped = arg.replace("\\", "\\\\").replace('"', '\\"').replace("$", "\\$").replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def render_tmux_commands(commands: List[List[str]], output_format: str) -> str:
+    if output_format == "source":
+        return "".join(" ".join(_tmux_quote(arg) for arg in command) + "\n" for command in commands)
+    chained = ["tmux", *_chain_tmux_commands(commands)]
+    return " ".join(shlex.quote(arg) for arg in chained) + "\n"
+
+
+def _run_tmux(args: List[str], check: bool = True) -> subprocess.CompletedProcess[str]:
+    try:
+        with _trace_span("tmux", command=args[0] if args else ""):
+            result = subprocess.run(["tmux", *args], capture_output=True, text=True)
+    except FileNotFoundError as exc:
+        raise ProjectManagerError("tmux is not installed or not on PATH.") from exc
+    if check and result.returncode != 0:
+        message = result.stderr.strip() or result.stdout.strip() or "unknown error"
+        raise ProjectManagerError(f"tmux {args[0]} failed: {message}")
+    return result
+
+
+def _tmux_session_exists(session_name: str, socket_name: str | None = None) -> bool:
+    prefix = ["-L", socket_name] if socket_name else []
+    return _run_tmux([*prefix, "has-session", "-t", f"={session_name}"], check=False).returncode == 0
+
+
+def _option_value(command: List[str], flag: str) -> str | None:
+    if flag in command[:-1]:
+        return command[command.index(flag) + 1]
+    return None
+
+
+def defer_window_commands(commands: List[List[str]]) -> tuple[List[List[str]], int]:
+    """Turn per-window ``send-keys`` into deferred commands run on first selection.
+
+    Only ``send-keys -t <window> <text> C-m`` aimed at a whole window created
+    by ``new-window`` is deferred; pane-targeted keys and the first window stay
+    eager. Returns the rewritten commands and the number of deferred windows.
+    """
+
+    session_name = next(
+        (_option_value(command, "-s") for command in commands if command[0] == "new-session"), None
+    )
+    result: List[List[str]] = []
+    aliases: dict[str, int] = {}
+    window_targets: dict[int, str] = {}
+    window_positions: dict[int, int] = {}
+    deferred: dict[int, List[str]] = {}
+
+    for command in commands:
+        if command[0] == "new-window":
+            ident = len(window_positions)
+            target = _option_value(command, "-t") or ""
+            name = _option_value(command, "-n")
+            if target.rpartition(":")[2].isdigit():
+                aliases[target] = ident
+                window_targets[ident] = target
+            if name and session_name:
+                aliases[f"{session_name}:{name}"] = ident
+                window_targets.setdefault(ident, f"{session_name}:{name}")
+            window_positions[ident] = len(result)
+            result.append(list(command))
+            continue
+        if (
+            command[0] == "send-keys"
+            and len(command) == 5
+            and command[1] == "-t"
+            and command[2] in aliases
+            and command[4] in ("C-m", "Enter")
+        ):
+            deferred.setdefault(aliases[command[2]], []).append(command[3])
+            continue
+        result.append(command)
+
+    for ident, texts in deferred.items():
+        if ident not in window_targets:
+            continue
+        window_command = result[window_positions[ident]]
+        if "-d" not in window_command:
+            window_command.insert(1, "-d")
+        result.append(["set-option", "-w", "-t", window_targets[ident], TMUX_LAZY_OPTION, "\n".join(texts)])
+    if deferred and session_name:
+        result.append(["set-hook", "-t", session_name, "session-window-changed", TMUX_LAZY_HOOK])
+    return result, len(deferred)
+
+
+def _load_launcher(session_name: str, script_path: Path | None) -> tuple[Path, LauncherCommands]:
+    spec_path = _tmux_spec_path(session_name)
+    if script_path is None and spec_path.exists():
+        session = load_session_spec(spec_path)
+        return spec_path, LauncherCommands(session.name, _session_commands(session), [], session)
+
+    path = script_path.expanduser().resolve() if script_path else _tmux_script_path(session_name)
+    if not path.exists():
+        raise ProjectManagerError(f"Script not found: {path}")
+    launcher = _parse_launcher_commands(path.read_text(encoding="utf-8"))
+    if not launcher.commands or launcher.commands[0][0] != "new-session":
+        raise ProjectManagerError(f"No tmux new-session command found in {path}")
+    return path, launcher
+
+
+def _benchmark_commands(commands: List[List[str]]) -> List[List[str]]:
+    """Drop send-keys payloads so benchmark panes never run project commands."""
+
+    neutral: List[List[str]] = []
+    for command in commands:
+        if command[0] == "send-keys" and "-t" in command[:-1]:
+            neutral.append(["send-keys", "-t", command[command.index("-t") + 1]])
+        else:
+            neutral.append(command)
+    return neutral
+
+
+def _time_tmux_boot(commands: List[List[str]], socket_name: str, chained: bool) -> float:
+    start = time.perf_counter()
+    try:
+        if chained:
+            _run_tmux(["-L", socket_name, *_chain_tmux_commands(commands)])
+        else:
+            for command in commands:
+                _run_tmux(["-L", socket_name, *command])
+        return time.perf_counter() - start
+    finally:
+        _run_tmux(["-L", socket_name, "kill-server"], check=False)
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    check: ReadinessCheck
+    ready: bool
+    attempts: int
+    elapsed: float
+    error: str | None = None
+
+
+def _probe_host_port(target: str) -> tuple[str, int]:
+    host, _, port = target.rpartition(":")
+    if not port.isdigit():
+        raise ProjectManagerError(f"TCP probe target must be host:port, got '{target}'.")
+    return host or "localhost", int(port)
+
+
+def _http_ready(url: str, timeout: float) -> None:
+    import urllib.request
+
+    with urllib.request.urlopen(url, timeout=timeout):
+        pass
+
+
+async def _probe_once(check: ReadinessCheck, timeout: float) -> None:
+    """Run a single attempt of ``check``; raise ``OSError``/``TimeoutError`` when not ready."""
+
+    import asyncio
+
+    if check.kind == "tcp":
+        host, port = _probe_host_port(check.target)
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        writer.close()
+    elif check.kind == "http":
+        await asyncio.wait_for(asyncio.to_thread(_http_ready, check.target, timeout), timeout + 1)
+    elif check.kind == "path":
+        if not Path(os.path.expandvars(check.target)).expanduser().exists():
+            raise FileNotFoundError(check.target)
+    else:
+        process = await asyncio.create_subprocess_shell(
+            check.target, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            returncode = await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        if returncode != 0:
+            raise OSError(f"exit status {returncode}")
+
+
+async def _run_probe(check: ReadinessCheck) -> ProbeResult:
+    """Retry ``check`` with jittered exponential backoff until it passes or its deadline expires."""
+
+    import asyncio
+    import random
+    import urllib.error
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + check.timeout
+    delay = PROBE_INITIAL_DELAY
+    attempts = 0
+    error: str | None = None
+    while True:
+        attempts += 1
+        remaining = deadline - loop.time()
+        try:
+            await _probe_once(check, max(0.01, min(PROBE_ATTEMPT_TIMEOUT, remaining)))
+            return ProbeResult(check, True, attempts, loop.time() - start)
+        except (OSError, asyncio.TimeoutError, urllib.error.URLError, ValueError) as exc:
+            error = str(exc) or type(exc).__name__
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return ProbeResult(check, False, attempts, loop.time() - start, error)
+        await asyncio.sleep(min(remaining, random.uniform(delay / 2, delay)))
+        delay = min(delay * 2, PROBE_MAX_DELAY)
+
+
+async def _gather_probes(checks: List[ReadinessCheck]) -> List[ProbeResult]:
+    import asyncio
+
+    return list(await asyncio.gather(*(_run_probe(check) for check in checks)))
+
+
+def run_readiness_probes(checks: List[ReadinessCheck]) -> List[ProbeResult]:
+    """Run every probe concurrently; total wall time is bounded by the slowest deadline."""
+
+    import asyncio
+
+    for check in checks:
+        if check.kind == "tcp":
+            _probe_host_port(check.target)
+    return asyncio.run(_gather_probes(checks)) if checks else []
+
+
+def _echo_probe_results(results: List[ProbeResult], elapsed: float) -> None:
+    rows = [
+        (
+            f"{result.check.kind} {result.check.target}",
+            "ready" if result.ready else "timeout",
+            str(result.attempts),
+            f"{result.elapsed * 1000:.0f}ms",
+        )
+        for result in results
+    ]
+    _echo_table(("Probe", "Status", "Attempts", "Time"), rows)
+    click.echo(f"Readiness checks finished in {elapsed * 1000:.0f}ms")
+    for result in results:
+        if not result.ready:
+            click.echo(f"{result.check.kind} {result.check.target}: {result.error}", err=True)
+
+
+def wait_until_ready(checks: List[ReadinessCheck]) -> bool:
+    start = time.perf_counter()
+    results = run_readiness_probes(checks)
+    _echo_probe_results(results, time.perf_counter() - start)
+    return all(result.ready for result in results)
+
+
+def _attach_tmux_session(session_name: str) -> None:
+    verb = "switch-client" if os.environ.get("TMUX") else "attach-session"
+    argv = ["tmux", verb, "-t", f"={session_name}"]
+    sys.stdout.flush()
+    if EXEC_HANDOFF is not None:
+        EXEC_HANDOFF(argv)
+    os.execvp("tmux", argv)
+
+
+@dataclass
+class PaneSnapshot:
+    index: int
+    path: str
+    command: str | None = None
+
+
+@dataclass
+class WindowSnapshot:
+    index: int
+    name: str
+    layout: str
+    active: bool
+    panes: List[PaneSnapshot]
+    lazy: str | None = None
+
+
+@dataclass
+class SessionSnapshot:
+    name: str
+    activity: float
+    attached: bool
+    windows: List[WindowSnapshot]
+    pane_pids: List[int] = field(default_factory=list)
+
+
+# One row per pane across every session; fields are tab separated.
+_TMUX_PANE_FORMAT = "\t".join(
+    [
+        "#{session_name}",
+        "#{session_attached}",
+        "#{session_activity}",
+        "#{window_index}",
+        "#{window_name}",
+        "#{window_layout}",
+        "#{window_active}",
+        f"#{{?{TMUX_LAZY_OPTION},1,0}}",
+        "#{pane_index}",
+        "#{pane_pid}",
+        "#{pane_current_path}",
+    ]
+)
+_SHELL_NAMES = {"sh", "bash", "zsh", "fish", "dash", "ksh", "tcsh"}
+
+
+def query_tmux_sessions() -> List[SessionSnapshot]:
+    """Describe every running session, window and pane with a single tmux query."""
+
+    result = _run_tmux(["list-panes", "-a", "-F", _TMUX_PANE_FORMAT], check=False)
+    if result.returncode != 0:
+        return []
+    sessions: dict[str, SessionSnapshot] = {}
+    windows: dict[tuple[str, int], WindowSnapshot] = {}
+    for line in result.stdout.splitlines():
+        fields = line.split("\t", 10)
+        if len(fields) != 11:
+            continue
+        name, attached, activity, w_index, w_name, layout, w_active, lazy, p_index, pid, path = fields
+        session = sessions.setdefault(
+            name, SessionSnapshot(name=name, activity=float(activity), attached=attached != "0", windows=[])
+        )
+        key = (name, int(w_index))
+        window = windows.get(key)
+        if window is None:
+            window = WindowSnapshot(
+                index=int(w_index),
+                name=w_name,
+                layout=layout,
+                active=w_active == "1",
+                panes=[],
+                lazy="" if lazy == "1" else None,
+            )
+            windows[key] = window
+            session.windows.append(window)
+        window.panes.append(PaneSnapshot(index=int(p_index), path=path))
+        session.pane_pids.append(int(pid))
+    return list(sessions.values())
+
+
+def _process_table() -> dict[int, tuple[int, int, str]]:
+    """Map pid to (ppid, rss KiB, args) from one ``ps`` call."""
+
+    result = subprocess.run(["ps", "-axo", "pid=,ppid=,rss=,args="], capture_output=True, text=True)
+    table: dict[int, tuple[int, int, str]] = {}
+    for line in result.stdout.splitlines():
+        parts = line.split(None, 3)
+        if len(parts) >= 3 and parts[0].isdigit() and parts[1].isdigit() and parts[2].isdigit():
+            table[int(parts[0])] = (int(parts[1]), int(parts[2]), parts[3] if len(parts) == 4 else "")
+    return table
+
+
+def _children_map(table: dict[int, tuple[int, int, str]]) -> dict[int, List[int]]:
+    children: dict[int, List[int]] = {}
+    for pid, (ppid, _, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    return children
+
+
+def _process_tree(pid: int, children: dict[int, List[int]]) -> List[int]:
+    tree = [pid]
+    for node in tree:
+        tree.extend(children.get(node, []))
+    return tree
+
+
+def _foreground_command(pane_pid: int, table: dict, children: dict[int, List[int]]) -> str | None:
+    """Best-effort command line of what the pane's shell is running, if anything."""
+
+    entry = table.get(pane_pid)
+    if entry is None:
+        return None
+    if Path(entry[2].split(" ", 1)[0]).name.lstrip("-") not in _SHELL_NAMES:
+        return entry[2] or None
+    kids = sorted(children.get(pane_pid, []))
+    if not kids:
+        return None
+    return table[kids[0]][2] or None
+
+
+def _session_rss_bytes(snapshot: SessionSnapshot, table: dict, children: dict[int, List[int]]) -> int:
+    pids = {pid for pane_pid in snapshot.pane_pids for pid in _process_tree(pane_pid, children)}
+    return sum(table[pid][1] for pid in pids if pid in table) * 1024
+
+
+def _fill_snapshot_commands(snapshot: SessionSnapshot, table: dict, children: dict[int, List[int]]) -> None:
+    pane_pids = iter(snapshot.pane_pids)
+    for window in snapshot.windows:
+        for pane in window.panes:
+            pane.command = _foreground_command(next(pane_pids), table, children)
+        if window.lazy is not None:
+            target = f"={snapshot.name}:{window.index}"
+            window.lazy = _run_tmux(["show-options", "-wqv", "-t", target, TMUX_LAZY_OPTION], check=False).stdout.rstrip("\n")
+
+
+def _snapshot_path(session_name: str) -> Path:
+    return TMUX_SNAPSHOT_DIR / f"{session_name}.json"
+
+
+def save_session_snapshot(snapshot: SessionSnapshot) -> Path:
+    path = _snapshot_path(snapshot.name)
+    payload = {
+        "session": snapshot.name,
+        "saved": time.time(),
+        "windows": [
+            {
+                "index": window.index,
+                "name": window.name,
+                "layout": window.layout,
+                "active": window.active,
+                "lazy": window.lazy,
+                "panes": [{"index": pane.index, "path": pane.path, "command": pane.command} for pane in window.panes],
+            }
+            for window in snapshot.windows
+        ],
+    }
+    _write_atomic(path, (json.dumps(payload, indent=2) + "\n").encode("utf-8"))
+    return path
+
+
+def load_session_snapshot(session_name: str) -> SessionSnapshot | None:
+    path = _snapshot_path(session_name)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        windows = [
+            WindowSnapshot(
+                index=int(window["index"]),
+                name=window["name"],
+                layout=window["layout"],
+                active=bool(window["active"]),
+                lazy=window.get("lazy"),
+                panes=[PaneSnapshot(int(pane["index"]), pane["path"], pane.get("command")) for pane in window["panes"]],
+            )
+            for window in data["windows"]
+        ]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise ProjectManagerError(f"Unreadable tmux snapshot {path}: {exc}") from exc
+    if not windows:
+        return None
+    return SessionSnapshot(name=data["session"], activity=float(data.get("saved", 0)), attached=False, windows=windows)
+
+
+def _snapshot_commands(snapshot: SessionSnapshot) -> List[List[str]]:
+    """Rebuild a reaped session's windows, panes, layouts and commands."""
+
+    name = snapshot.name
+    commands: List[List[str]] = []
+    has_lazy = False
+    for position, window in enumerate(snapshot.windows):
+        target = f"{name}:{window.index}"
+        first = window.panes[0]
+        if position == 0:
+            commands.append(["new-session", "-d", "-s", name, "-n", window.name, "-c", first.path])
+        else:
+            commands.append(["new-window", "-d", "-t", target, "-n", window.name, "-c", first.path])
+        for pane in window.panes[1:]:
+            commands.append(["split-window", "-d", "-t", target, "-c", pane.path])
+        if len(window.panes) > 1:
+            commands.append(["select-layout", "-t", target, window.layout])
+        if window.lazy:
+            has_lazy = True
+            commands.append(["set-option", "-w", "-t", target, TMUX_LAZY_OPTION, window.lazy])
+            continue
+        for pane in window.panes:
+            if pane.command:
+                commands.append(["send-keys", "-t", f"{target}.{pane.index}", pane.command, "C-m"])
+    if has_lazy:
+        commands.append(["set-hook", "-t", name, "session-window-changed", TMUX_LAZY_HOOK])
+    active = next((window for window in snapshot.windows if window.active), snapshot.windows[0])
+    commands.append(["select-window", "-t", f"{name}:{active.index}"])
+    return commands
+
+
+@tmux.command("up")
+@click.argument("session_name", shell_complete=_complete_session)
+@click.option("--script", "script_path", type=click.Path(path_type=Path), default=None, help="Explicit path to the tmux start script.")
+@click.option("--detach", is_flag=True, help="Create the session without attaching to it.")
+@click.option(
+    "--benchmark",
+    is_flag=True,
+    help="Compare per-command tmux forks against one batched call on a throwaway server.",
+)
+@click.option("--no-wait", is_flag=True, help="Skip the session's readiness checks.")
+@click.option("--lazy", is_flag=True, help="Defer every window's commands until it is first selected.")
+@click.option("--fresh", is_flag=True, help="Ignore and discard a snapshot left by pm tmux reap.")
+def tmux_up(
+    session_name: str,
+    script_path: Path | None,
+    detach: bool,
+    benchmark: bool,
+    no_wait: bool,
+    lazy: bool,
+    fresh: bool,
+) -> None:
+    """Create a session from its launcher in a single tmux client call, then attach.
+
+    A session suspended by ``pm tmux reap`` is restored from its snapshot
+    instead, with the same windows, panes, layouts and running commands.
+    """
+
+    try:
+        path, launcher = _load_launcher(session_name, script_path)
+    except ProjectManagerError:
+        if benchmark or fresh or load_session_snapshot(session_name) is None:
+            raise
+        path, launcher = _snapshot_path(session_name), LauncherCommands(session_name, [], [])
+    target = launcher.session_name or session_name
+
+    snapshot = None if benchmark else load_session_snapshot(target)
+    if snapshot is not None and (fresh or _tmux_session_exists(target)):
+        _snapshot_path(target).unlink(missing_ok=True)
+        snapshot = None
+    if snapshot is not None:
+        path = _snapshot_path(target)
+        launcher = LauncherCommands(target, _snapshot_commands(snapshot), [])
+    elif lazy:
+        launcher = replace(launcher, commands=defer_window_commands(launcher.commands)[0])
+
+    if benchmark:
+        commands = _benchmark_commands(launcher.commands)
+        socket_base = f"pm-bench-{os.getpid()}"
+        sequential = _time_tmux_boot(commands, f"{socket_base}-seq", chained=False)
+        batched = _time_tmux_boot(commands, f"{socket_base}-batch", chained=True)
+        click.echo(f"Benchmark for {path.name} ({len(commands)} tmux commands):")
+        click.echo(f"  per-command: {sequential * 1000:8.1f} ms  ({len(commands)} tmux clients)")
+        click.echo(f"  batched:     {batched * 1000:8.1f} ms  (1 tmux client)")
+        if batched > 0:
+            click.echo(f"  speedup:     {sequential / batched:8.1f}x")
+        return
+
+    if _tmux_session_exists(target):
+        click.echo(f"Session '{target}' already running.")
+    else:
+        if launcher.skipped:
+            click.echo(
+                f"Warning: skipped {len(launcher.skipped)} non-tmux step(s) from {path.name}; "
+                "run the launcher directly if they are needed.",
+                err=True,
+            )
+        session = launcher.session
+        if session is not None and session.python_venv:
+            venv_path = session.project_dir / ".venv"
+            if not venv_path.exists():
+                click.echo(f"Creating Python virtual environment at {venv_path}")
+                subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
+        if session is not None and session.ready and not no_wait:
+            if not wait_until_ready(session.ready):
+                raise ProjectManagerError(
+                    f"Readiness checks failed for '{target}'; rerun with --no-wait to start anyway."
+                )
+        start = time.perf_counter()
+        _run_tmux(_chain_tmux_commands(launcher.commands))
+        elapsed = time.perf_counter() - start
+        verb = "Restored" if snapshot is not None else "Created"
+        click.echo(
+            f"{verb} session '{target}' with {len(launcher.commands)} tmux commands "
+            f"in {elapsed * 1000:.1f} ms (1 tmux client)."
+        )
+        if snapshot is not None:
+            path.unlink(missing_ok=True)
+        lazy_windows = sum(1 for command in launcher.commands if TMUX_LAZY_OPTION in command)
+        if lazy_windows:
+            click.echo(f"{lazy_windows} window(s) will start their commands when first selected.")
+
+    if not detach:
+        _attach_tmux_session(target)
+
+
+def _collect_checks(kind: str, targets: tuple[str, ...], timeout: float) -> List[ReadinessCheck]:
+    return [ReadinessCheck(kind=kind, target=target, timeout=timeout) for target in targets]
+
+
+@tmux.command("wait")
+@click.option("--tcp", "tcp_targets", multiple=True, help="host:port that must accept connections.")
+@click.option("--http", "http_targets", multiple=True, help="URL that must answer with a non-error status.")
+@click.option("--path", "path_targets", multiple=True, help="Path that must exist.")
+@click.option("--command", "command_targets", multiple=True, help="Shell command that must exit 0.")
+@click.option("--timeout", type=float, default=60.0, show_default=True, help="Deadline per probe in seconds.")
+def tmux_wait(
+    tcp_targets: tuple[str, ...],
+    http_targets: tuple[str, ...],
+    path_targets: tuple[str, ...],
+    command_targets: tuple[str, ...],
+    timeout: float,
+) -> None:
+    """Wait for services concurrently; use in launchers instead of sleep loops."""
+
+    checks = [
+        *_collect_checks("tcp", tcp_targets, timeout),
+        *_collect_checks("http", http_targets, timeout),
+        *_collect_checks("path", path_targets, timeout),
+        *_collect_checks("command", command_targets, timeout),
+    ]
+    if not checks:
+        raise click.UsageError("Give at least one of --tcp, --http, --path or --command.")
+    if not wait_until_ready(checks):
+        raise ProjectManagerError("Some readiness checks did not pass before their deadline.")
+
+
+@tmux.command("render")
+@click.argument("session_name", shell_complete=_complete_session)
+@click.option("--script", "script_path", type=click.Path(path_type=Path), default=None, help="Explicit path to the tmux start script.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["source", "chained"]),
+    default="source",
+    show_default=True,
+    help="Emit a tmux source-file or a single chained tmux invocation.",
+)
+@click.option("--output", type=click.Path(path_type=Path), default=None, help="Write to this file instead of stdout.")
+@click.option("--lazy", is_flag=True, help="Defer every window's commands until it is first selected.")
+def tmux_render(
+    session_name: str,
+    script_path: Path | None,
+    output_format: str,
+    output: Path | None,
+    lazy: bool,
+) -> None:
+    """Compile a launcher into a batched tmux command stream."""
+
+    _, launcher = _load_launcher(session_name, script_path)
+    commands = defer_window_commands(launcher.commands)[0] if lazy else launcher.commands
+    content = render_tmux_commands(commands, output_format)
+    if output is None:
+        click.echo(content, nl=False)
+        return
+    output = output.expanduser()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(content, encoding="utf-8")
+    click.echo(f"Wrote {output_format} tmux commands to {output}")
+
+
+def _parse_duration(value: str) -> float:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", value, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"invalid duration: {value!r} (use e.g. 90m, 4h, 2d)")
+    unit = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2).lower()]
+    return float(match.group(1)) * unit
+
+
+def _duration_option(ctx: click.Context, param: click.Parameter, value: str) -> float:
+    try:
+        return _parse_duration(value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+
+def _format_duration(seconds: float) -> str:
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds / size:.1f}{unit}"
+    return f"{seconds:.0f}s"
+
+
+@tmux.command("reap")
+@click.option(
+    "--idle",
+    "idle_seconds",
+    default=DEFAULT_REAP_IDLE,
+    show_default=True,
+    callback=_duration_option,
+    help="Reap detached sessions with no activity for this long (e.g. 90m, 4h, 2d).",
+)
+@click.option("--session", "session_names", multiple=True, help="Only consider these sessions (repeatable).")
+@click.option("--dry-run", is_flag=True, help="Report what would be reaped without killing anything.")
+def tmux_reap(idle_seconds: float, session_names: tuple[str, ...], dry_run: bool) -> None:
+    """Snapshot and kill idle detached sessions; pm tmux up restores them."""
+
+    now = time.time()
+    candidates = [
+        snapshot
+        for snapshot in query_tmux_sessions()
+        if not snapshot.attached
+        and now - snapshot.activity >= idle_seconds
+        and (not session_names or snapshot.name in session_names)
+    ]
+    if not candidates:
+        click.echo(f"No detached sessions idle for {_format_duration(idle_seconds)} or longer.")
+        return
+
+    table = _process_table()
+    children = _children_map(table)
+    rows = []
+    freed = 0
+    for snapshot in candidates:
+        rss = _session_rss_bytes(snapshot, table, children)
+        freed += rss
+        _fill_snapshot_commands(snapshot, table, children)
+        rows.append(
+            (
+                snapshot.name,
+                _format_duration(now - snapshot.activity),
+                str(len(snapshot.windows)),
+                str(len(snapshot.pane_pids)),
+                _format_bytes(rss),
+            )
+        )
+        if not dry_run:
+            save_session_snapshot(snapshot)
+            _run_tmux(["kill-session", "-t", f"={snapshot.name}"])
+
+    _echo_table(("Session", "Idle", "Windows", "Panes", "RSS"), rows)
+    if dry_run:
+        click.echo(f"[DRY-RUN] Would reap {len(candidates)} session(s), freeing about {_format_bytes(freed)}")
+    else:
+        click.echo(
+            f"Reaped {len(candidates)} session(s), freeing about {_format_bytes(freed)} resident memory. "
+            f"Snapshots in {TMUX_SNAPSHOT_DIR}; restore with pm tmux up <session>."
+        )
+
+
+@dataclass(frozen=True)
+class KnownSession:
+    name: str
+    tmux_name: str
+    source: str
+    windows: int
+    project_dir: str | None
+    path: str
+
+
+def _describe_spec(path: Path) -> dict:
+    session = load_session_spec(path)
+    return {
+        "name": path.stem,
+        "tmux_name": session.name,
+        "source": "spec",
+        "windows": len(session.windows) + 1,
+        "project_dir": str(session.project_dir),
+        "launcher": str(_launcher_path_for(session).resolve()),
+    }
+
+
+def _describe_script(path: Path) -> dict:
+    text = path.read_text(encoding="utf-8")
+    launcher = _parse_launcher_commands(text)
+    project_dir = _parse_project_dir(text)
+    name = path.stem[len("start_") :]
+    return {
+        "name": name,
+        "tmux_name": launcher.session_name or name,
+        "source": "script",
+        "windows": sum(1 for command in launcher.commands if command[0] in ("new-session", "new-window")),
+        "project_dir": str(project_dir) if project_dir else None,
+    }
+
+
+def _scan_launcher_dir(directory: Path, suffix: str, prefix: str = "") -> List[os.DirEntry]:
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                (
+                    entry
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()
+                ),
+                key=lambda entry: entry.name,
+            )
+    except FileNotFoundError:
+        return []
+
+
+def known_sessions() -> List[KnownSession]:
+    """Describe every spec and hand-written launcher, reparsing only changed files.
+
+    Parsed metadata is cached in ``TMUX_LAUNCHER_CACHE`` keyed by path, size
+    and mtime, so listing 30+ launchers costs one ``stat`` each once warm.
+    """
+
+    try:
+        cache = _load_json_cached(TMUX_LAUNCHER_CACHE, copied=False)
+        if cache.get("version") != TMUX_LAUNCHER_CACHE_VERSION:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    cached_entries = cache.get("entries", {})
+    entries: dict[str, dict] = {}
+    changed = False
+
+    def describe(entry: os.DirEntry, parser) -> dict:
+        nonlocal changed
+        info = entry.stat()
+        cached = cached_entries.get(entry.path)
+        if cached and cached.get("mtime_ns") == info.st_mtime_ns and cached.get("size") == info.st_size:
+            entries[entry.path] = cached
+            return cached
+        described = {**parser(Path(entry.path)), "mtime_ns": info.st_mtime_ns, "size": info.st_size}
+        entries[entry.path] = described
+        changed = True
+        return described
+
+    specs = [describe(entry, _describe_spec) for entry in _scan_launcher_dir(TMUX_SPEC_DIR, ".json")]
+    generated = {spec["launcher"] for spec in specs}
+    for entry in _scan_launcher_dir(TMUX_DIR, ".sh", prefix="start_"):
+        if str(Path(entry.path).resolve()) not in generated:
+            describe(entry, _describe_script)
+    if changed or set(entries) != set(cached_entries):
+        try:
+            payload = {"version": TMUX_LAUNCHER_CACHE_VERSION, "entries": entries}
+            _write_atomic(TMUX_LAUNCHER_CACHE, json.dumps(payload).encode("utf-8"))
+        except OSError:
+            pass
+
+    return [
+        KnownSession(
+            name=item["name"],
+            tmux_name=item["tmux_name"],
+            source=item["source"],
+            windows=item["windows"],
+            project_dir=item["project_dir"],
+            path=path,
+        )
+        for path, item in entries.items()
+    ]
+
+
+def _session_label(known: KnownSession) -> str:
+    if known.tmux_name == known.name:
+        return known.name
+    return f"{known.name} ({known.tmux_name})"
+
+
+@tmux.command("list")
+def tmux_list() -> None:
+    """List tmux sessions defined by specs and hand-written start scripts."""
+
+    rows = [
+        (
+            _session_label(known),
+            str(known.windows),
+            known.source,
+            _homeify_path(Path(known.project_dir)) if known.project_dir else "-",
+        )
+        for known in known_sessions()
+    ]
+    if not rows:
+        click.echo(f"No tmux sessions found in {TMUX_DIR}")
+        return
+    _echo_table(("Session", "Windows", "Source", "Project"), sorted(rows))
+
+
+@tmux.command("status")
+def tmux_status() -> None:
+    """Show every known session with its state, windows, activity and project."""
+
+    running = {snapshot.name: snapshot for snapshot in query_tmux_sessions()}
+    reaped = {path.stem for path in TMUX_SNAPSHOT_DIR.glob("*.json")} if TMUX_SNAPSHOT_DIR.is_dir() else set()
+    now = time.time()
+    rows = []
+    seen: set[str] = set()
+    for known in known_sessions():
+        seen.add(known.tmux_name)
+        live = running.get(known.tmux_name)
+        project = _homeify_path(Path(known.project_dir)) if known.project_dir else "-"
+        if live is not None:
+            state = "attached" if live.attached else "running"
+            windows = str(len(live.windows))
+            activity = f"{_format_duration(now - live.activity)} ago"
+        else:
+            state = "reaped" if known.tmux_name in reaped else "stopped"
+            windows = str(known.windows)
+            activity = "-"
+        rows.append((_session_label(known), state, windows, activity, project))
+    for name, live in running.items():
+        if name not in seen:
+            state = "attached" if live.attached else "running"
+            rows.append((name, state, str(len(live.windows)), f"{_format_duration(now - live.activity)} ago", "-"))
+    for name in sorted(reaped - seen - set(running)):
+        rows.append((name, "reaped", "-", "-", "-"))
+
+    if not rows:
+        click.echo(f"No tmux sessions found in {TMUX_DIR}")
+        return
+    order = {"attached": 0, "running": 1, "reaped": 2, "stopped": 3}
+    rows.sort(key=lambda row: (order[row[1]], row[0]))
+    _echo_table(("Session", "State", "Windows", "Activity", "Project"), rows)
+
+
+@tmux.command("compile")
+@click.argument("session_names", nargs=-1, shell_complete=_complete_session)
+@click.option("--force", is_flag=True, help="Recompile even if the spec is unchanged, replacing hand-written scripts.")
+def tmux_compile(session_names: tuple[str, ...], force: bool) -> None:
+    """Regenerate start scripts whose session spec changed."""
+
+    if session_names:
+        spec_paths = [_tmux_spec_path(name) for name in session_names]
+    else:
+        spec_paths = sorted(TMUX_SPEC_DIR.glob("*.json"))
+    if not spec_paths:
+        click.echo(f"No session specs found in {TMUX_SPEC_DIR}")
+        return
+    for spec_path in spec_paths:
+        script_path, changed = compile_session_spec(spec_path, force=force)
+        status = "Compiled" if changed else "Up to date:"
+        click.echo(f"{status} {script_path}")
+
+
+# tmux flags that take a value on new-session/new-window; anything else
+# starting with "-" is a switch, and the first other word is the shell command.
+_TMUX_VALUE_FLAGS = {"-s", "-n", "-c", "-t", "-x", "-y", "-e", "-F", "-f"}
+
+
+def _tmux_shell_command(command: List[str]) -> List[str]:
+    index = 1
+    while index < len(command) and command[index].startswith("-"):
+        index += 2 if command[index] in _TMUX_VALUE_FLAGS else 1
+    return command[index:]
+
+
+def _window_index(target: str | None, names: dict[str, int]) -> int | None:
+    window = (target or "").rpartition(":")[2]
+    if "." in window:
+        return None
+    if window.isdigit():
+        return int(window)
+    return names.get(window)
+
+
+def session_from_launcher(name: str, script_path: Path) -> tuple[TmuxSession, List[str]]:
+    """Rebuild a hand-written launcher as a session spec.
+
+    Returns the session and a list of what the spec cannot express (shell
+    steps, panes, restarts, extra tmux commands). Those parts are dropped, so a
+    non-empty list means the generated launcher would behave differently.
+    """
+
+    text = script_path.read_text(encoding="utf-8")
+    launcher = _parse_launcher_commands(text)
+    losses = [f"shell step {line!r}" for line in launcher.skipped]
+    for raw_line in text.splitlines():
+        words = raw_line.split()
+        if words[:2] == ["tmux", "kill-session"]:
+            losses.append("kills and recreates a running session instead of reattaching")
+        elif words and words[0] in ("else", "elif"):
+            losses.append("builds the layout conditionally")
+
+    sessions = [command for command in launcher.commands if command[0] == "new-session"]
+    if not sessions:
+        raise ProjectManagerError(f"No tmux new-session command found in {script_path}")
+    if len(sessions) > 1:
+        losses.append(f"runs new-session {len(sessions)} times")
+    first = sessions[0]
+    directory = _option_value(first, "-c")
+    project_dir = Path(directory) if directory else _parse_project_dir(text)
+    if project_dir is None:
+        raise ProjectManagerError(f"Cannot determine the project directory of {script_path}")
+
+    session = TmuxSession(
+        name=launcher.session_name or name,
+        project_dir=project_dir,
+        windows=[],
+        main_name=_option_value(first, "-n") or "main",
+    )
+    names = {session.main_name: 0}
+    for command in launcher.commands:
+        verb = command[0]
+        if verb in ("new-session", "new-window"):
+            shell = _tmux_shell_command(command)
+            if shell not in ([], ["/bin/zsh"]):
+                losses.append(f"{verb} runs {' '.join(shell)!r} instead of /bin/zsh")
+        if verb == "new-session":
+            continue
+        if verb == "new-window":
+            index = len(session.windows) + 1
+            requested = _window_index(_option_value(command, "-t"), {})
+            if requested not in (None, index):
+                losses.append(f"window {requested} becomes window {index}")
+            window_name = _option_value(command, "-n") or f"window{index}"
+            directory = _option_value(command, "-c")
+            session.windows.append(
+                TmuxWindow(name=window_name, path=Path(directory) if directory else project_dir, commands=[])
+            )
+            names[window_name] = index
+            continue
+
+        target = _option_value(command, "-t")
+        index = _window_index(target, names)
+        if verb == "select-window" and index is not None and index <= len(session.windows):
+            session.select_window = index
+            continue
+        keys = command[3:] if command[1:2] == ["-t"] else None
+        if verb != "send-keys" or index is None or index > len(session.windows) or keys is None:
+            losses.append(f"tmux {' '.join(command[:3])}")
+            continue
+        if len(keys) != 2 or keys[1] not in ("C-m", "Enter"):
+            losses.append(f"send-keys to {target} is not a single command followed by Enter")
+            continue
+        if "$" in keys[0] or "`" in keys[0]:
+            losses.append(f"send-keys to {target} types a literal $ or backquote")
+            continue
+        (session.main_commands if index == 0 else session.windows[index - 1].commands).append(keys[0])
+
+    return session, losses
+
+
+def _hand_written_launchers() -> List[tuple[str, Path]]:
+    generated = {str(_launcher_path_for(load_session_spec(path)).resolve()) for path in TMUX_SPEC_DIR.glob("*.json")}
+    return [
+        (entry.name[len("start_") : -len(".sh")], Path(entry.path))
+        for entry in _scan_launcher_dir(TMUX_DIR, ".sh", prefix="start_")
+        if str(Path(entry.path).resolve()) not in generated
+    ]
+
+
+@tmux.command("import")
+@click.argument("session_names", nargs=-1, shell_complete=_complete_session)
+@click.option("--force", is_flag=True, help="Import launchers even when parts of them cannot be expressed in a spec.")
+@click.option("--dry-run", is_flag=True, help="Report what would be imported without writing anything.")
+def tmux_import(session_names: tuple[str, ...], force: bool, dry_run: bool) -> None:
+    """Convert hand-written start scripts into session specs and compile them."""
+
+    if session_names:
+        launchers = [(name, _tmux_script_path(name)) for name in session_names]
+    else:
+        launchers = _hand_written_launchers()
+    if not launchers:
+        click.echo(f"No hand-written start scripts found in {TMUX_DIR}")
+        return
+
+    imported = 0
+    for name, script_path in launchers:
+        spec_path = _tmux_spec_path(name)
+        if not script_path.exists():
+            raise ProjectManagerError(f"Script not found: {script_path}")
+        if spec_path.exists():
+            click.echo(f"Skipped {name}: {spec_path} already exists")
+            continue
+        session, losses = session_from_launcher(name, script_path)
+        counts: dict[str, int] = {}
+        for loss in losses:
+            counts[loss] = counts.get(loss, 0) + 1
+        for loss, count in counts.items():
+            click.echo(f"  {name}: {loss}" + (f" (x{count})" if count > 1 else ""))
+        if losses and not force:
+            click.echo(f"Skipped {name}: the spec would drop {len(losses)} step(s); use --force to import anyway")
+            continue
+        if script_path.resolve() != _tmux_script_path(session.name).resolve():
+            session.launcher = script_path
+        if dry_run:
+            click.echo(f"[DRY-RUN] Would import {script_path} into {spec_path}")
+            imported += 1
+            continue
+        save_session_spec(spec_path, session)
+        compile_session_spec(spec_path, force=True)
+        click.echo(f"Imported {script_path} into {spec_path}")
+        imported += 1
+
+    verb = "Would import" if dry_run else "Imported"
+    click.echo(f"{verb} {imported} of {len(launchers)} launcher(s).")
+
+
+def _alias_token(session_name: str) -> str:
+    token = session_name.replace("-", "_").replace(" ", "_")
+    token = re.sub(r"[^A-Za-z0-9_]", "", token)
+    if not token:
+        token = "project"
+    if token[0].isdigit():
+        token = f"p{token}"
+    return token
+
+
+def _path_with_tilde(path: Path) -> str:
+    return _homeify_path(path)
+
+
+def _ensure_aliases_for_session(session_name: str, script_path: Path) -> bool:
+    alias_file = ALIASES_FILE
+    alias_file.parent.mkdir(parents=True, exist_ok=True)
+    if not alias_file.exists():
+        alias_file.write_text("", encoding="utf-8")
+
+    content = alias_file.read_text(encoding="utf-8")
+    existing_lines = set(content.splitlines())
+
+    token = _alias_token(session_name)
+    script_alias = f'alias tm{token}="{_path_with_tilde(script_path)}"'
+    attach_alias = f'alias tma{token}="tmux attach -t {session_name}"'
+
+    additions = [line for line in (script_alias, attach_alias) if line not in existing_lines]
+    if not additions:
+        return False
+
+    with alias_file.open("a", encoding="utf-8") as handle:
+        if content and not content.endswith("\n"):
+            handle.write("\n")
+        handle.write("\n".join(additions) + "\n")
+    return True
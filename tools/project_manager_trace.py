@@ -0,0 +1,159 @@
+"""Phase timing and syscall counting behind ``pm --timings`` / ``--trace-json``.
+
+Imported only when one of those flags is given. ``start_tracing`` wraps the
+``os``, ``shutil`` and ``subprocess`` entry points the CLI goes through (and
+that ``pathlib`` and ``os.path`` call into) so each call is counted by
+category, and installs a ``Tracer`` as ``project_manager_core._TRACER`` so the
+``_trace_span`` blocks in the command code record timed phases. Nothing is
+patched on normal runs.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import click
+
+import project_manager_core as core
+from project_manager_core import _echo_table, _write_atomic
+
+SYSCALL_CATEGORIES = ("stat", "readlink", "scandir", "copy", "unlink", "spawn")
+# (owner, attribute, category). Path.stat/exists/is_symlink, os.path.* and
+# realpath all reach os.stat, os.lstat or os.readlink; shutil.copy2 and
+# friends reach shutil.copyfile, and backups go through core._clone_file;
+# subprocess.run and Popen reach _execute_child.
+SYSCALL_HOOKS = (
+    (os, "stat", "stat"),
+    (os, "lstat", "stat"),
+    (os, "readlink", "readlink"),
+    (os, "scandir", "scandir"),
+    (shutil, "copyfile", "copy"),
+    (core, "_clone_file", "copy"),
+    (os, "unlink", "unlink"),
+    (os, "remove", "unlink"),
+    (subprocess.Popen, "_execute_child", "spawn"),
+)
+
+
+class Tracer:
+    """Collects spans (Chrome trace "complete" events) and syscall counts."""
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.origin_ns = time.perf_counter_ns()
+        self.counts: Counter[str] = Counter()
+        self.events: list[dict] = []
+        self.phases: dict[str, list] = {}
+        self._patched: list[tuple[object, str, object]] = []
+
+    def install(self) -> None:
+        for owner, attribute, category in SYSCALL_HOOKS:
+            original = getattr(owner, attribute)
+            setattr(owner, attribute, self._counting(category, original))
+            self._patched.append((owner, attribute, original))
+        core._TRACER = self
+
+    def uninstall(self) -> None:
+        core._TRACER = None
+        for owner, attribute, original in reversed(self._patched):
+            setattr(owner, attribute, original)
+        self._patched.clear()
+
+    def _counting(self, category: str, func):
+        counts = self.counts
+
+        @functools.wraps(func)
+        def counted(*args, **kwargs):
+            counts[category] += 1
+            return func(*args, **kwargs)
+
+        return counted
+
+    @contextmanager
+    def span(self, name: str, args: dict) -> Iterator[None]:
+        before = self.counts.copy()
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            delta = self.counts - before
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": "pm",
+                    "ph": "X",
+                    "ts": (start_ns - self.origin_ns) / 1000,
+                    "dur": elapsed_ns / 1000,
+                    "pid": os.getpid(),
+                    "tid": 1,
+                    "args": {**args, **delta},
+                }
+            )
+            phase = self.phases.setdefault(name, [0, 0, Counter()])
+            phase[0] += 1
+            phase[1] += elapsed_ns
+            phase[2].update(delta)
+
+    def chrome_trace(self) -> dict:
+        metadata = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": 1,
+            "args": {"name": self.label},
+        }
+        return {
+            "traceEvents": [metadata, *sorted(self.events, key=lambda event: event["ts"])],
+            "displayTimeUnit": "ms",
+            "otherData": {"command": self.label, "syscalls": dict(self.counts)},
+        }
+
+    def echo_summary(self) -> None:
+        header = ("Phase", "Calls", "Total", *SYSCALL_CATEGORIES)
+        rows = [
+            (
+                name,
+                str(calls),
+                f"{elapsed_ns / 1e6:.1f}ms",
+                *(str(counts[category]) for category in SYSCALL_CATEGORIES),
+            )
+            for name, (calls, elapsed_ns, counts) in sorted(
+                self.phases.items(), key=lambda item: item[1][1], reverse=True
+            )
+        ]
+        _echo_table(header, rows, err=True)
+        click.echo("Phase times and counts include nested phases.", err=True)
+
+
+def start_tracing(ctx: click.Context, timings: bool, trace_json: Path | None) -> Tracer:
+    """Trace the rest of this invocation and report when ``ctx`` closes."""
+
+    tracer = Tracer(" ".join(["pm", *sys.argv[1:]]))
+    tracer.install()
+
+    def finish() -> None:
+        tracer.uninstall()
+        if timings:
+            tracer.echo_summary()
+        if trace_json is not None:
+            try:
+                _write_atomic(trace_json, json.dumps(tracer.chrome_trace()).encode("utf-8"))
+            except OSError as exc:
+                click.echo(f"Could not write trace to {trace_json}: {exc}", err=True)
+            else:
+                click.echo(f"Wrote trace to {trace_json}", err=True)
+
+    # Close callbacks run last-in first-out, so the command span ends first.
+    ctx.call_on_close(finish)
+    ctx.with_resource(tracer.span("command", {"argv": sys.argv[1:]}))
+    return tracer
@@ -0,0 +1,123 @@
+"""The completion fast path must answer exactly what click would."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import click
+import pytest
+
+import project_manager_complete
+import project_manager_core as core
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+COMPLETERS = {
+    core._complete_session: "sessions",
+    core._complete_repo: "repos",
+    core._complete_workspace: "workspaces",
+}
+SCENARIOS = (
+    "pm tmux up ",
+    "pm tmux up al",
+    "pm tmux compile alpha ",
+    "pm tmux add-tab --session g",
+    "pm llm:agents sync --repo ",
+    "pm llm:agents sync --repo ~/code/al",
+    "pm graveyard list --repo /nowhere",
+    "pm workspace --name ",
+)
+
+
+def _walk(command: click.Command, path: tuple[str, ...] = ()):
+    ctx = click.Context(command)
+    for param in command.params:
+        yield path, param
+    if isinstance(command, click.Group):
+        for name in command.list_commands(ctx):
+            yield from _walk(command.get_command(ctx, name), (*path, name))
+
+
+def test_tables_cover_every_completed_parameter() -> None:
+    options = {}
+    arguments = {}
+    for path, param in _walk(core.cli):
+        source = COMPLETERS.get(param._custom_shell_complete)
+        if source is None:
+            continue
+        if isinstance(param, click.Option):
+            for opt in param.opts:
+                options[(path, opt)] = source
+        else:
+            assert source == "sessions"
+            arguments[path] = param.nargs == -1
+    assert options == project_manager_complete.OPTION_SOURCES
+    assert arguments == project_manager_complete.ARGUMENT_SESSIONS
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch) -> Path:
+    projects = tmp_path / "code" / "projects"
+    (projects / "tmux" / "sessions").mkdir(parents=True)
+    (projects / "vscode").mkdir()
+    for name in ("alpha", "alpine"):
+        (tmp_path / "code" / name).mkdir()
+        (projects / "tmux" / f"start_{name}.sh").write_text(
+            f'PROJECT_DIR="$HOME/code/{name}"\ntmux new-session -d -s {name}\n', encoding="utf-8"
+        )
+    (projects / "tmux" / "sessions" / "gamma.json").write_text("{}", encoding="utf-8")
+    (projects / "notes.code-workspace").write_text('{"folders": []}', encoding="utf-8")
+    (projects / "vscode" / "dir_map.sh").write_text("", encoding="utf-8")
+    # Freshly written directories are racy, and the index would never be trusted.
+    past = time.time() - 60
+    for path in (projects, projects / "tmux", projects / "tmux" / "sessions", projects / "vscode" / "dir_map.sh"):
+        os.utime(path, (past, past))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(
+        project_manager_complete,
+        "COMPLETION_INDEX",
+        str(tmp_path / ".local" / "share" / "project-manager" / "completion-index.json"),
+    )
+    return tmp_path
+
+
+def _click_output(words: str, cword: int, shell: str) -> bytes:
+    env = {
+        **os.environ,
+        "PM_NO_DAEMON": "1",
+        "_PROJECT_MANAGER_COMPLETE": f"{shell}_complete",
+        "COMP_WORDS": words,
+        "COMP_CWORD": str(cword),
+    }
+    return subprocess.run(
+        [sys.executable, "-c", "import project_manager_core; project_manager_core.main()"],
+        cwd=TOOLS_DIR,
+        env=env,
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh"])
+@pytest.mark.parametrize("words", SCENARIOS)
+def test_fast_path_matches_click(home: Path, words: str, shell: str, monkeypatch, capsysbinary) -> None:
+    cword = len(words.split(" ")) - 1
+    expected = _click_output(words, cword, shell)
+    monkeypatch.setenv("COMP_WORDS", words)
+    monkeypatch.setenv("COMP_CWORD", str(cword))
+    assert project_manager_complete.complete(f"{shell}_complete")
+    assert capsysbinary.readouterr().out == expected
+
+
+def test_declines_options_and_stale_index(home: Path, monkeypatch) -> None:
+    monkeypatch.setenv("COMP_WORDS", "pm tmux up --")
+    monkeypatch.setenv("COMP_CWORD", "3")
+    assert not project_manager_complete.complete("bash_complete")
+
+    monkeypatch.setenv("COMP_WORDS", "pm tmux up ")
+    assert not project_manager_complete.complete("bash_complete")  # no index yet
+    _click_output("pm tmux up ", 3, "bash")
+    (home / "code" / "projects" / "tmux" / "start_delta.sh").write_text("", encoding="utf-8")
+    assert not project_manager_complete.complete("bash_complete")
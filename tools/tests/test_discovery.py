@@ -0,0 +1,142 @@
+"""The discovery cache and the hook-run fingerprint must never hide a change."""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import project_manager_core as core
+
+PAST_NS = time.time_ns() - core.RACY_MTIME_WINDOW_NS - 60 * 10**9
+
+
+def _backdate(*paths: Path) -> None:
+    for path in paths:
+        os.utime(path, ns=(PAST_NS, PAST_NS))
+
+
+def _gather(repo: Path) -> set[str]:
+    found = core._gather_named_files(repo, ["CLAUDE.md"], "filesystem")
+    return {path.relative_to(repo).as_posix() for path in found}
+
+
+def _cached_mtimes(repo: Path) -> dict[str, int | None]:
+    payload = json.loads(core._discovery_cache_path(repo).read_text(encoding="utf-8"))
+    return {rel: entry["mtime"] for rel, entry in payload["dirs"].items()}
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setattr(core, "DISCOVERY_CACHE_ROOT", tmp_path / "cache")
+    root = tmp_path / "repo"
+    (root / "docs").mkdir(parents=True)
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "CLAUDE.md").write_text("# root\n", encoding="utf-8")
+    (root / "docs" / "CLAUDE.md").write_text("# docs\n", encoding="utf-8")
+    return root
+
+
+def test_changed_directories_are_rescanned(repo: Path) -> None:
+    _backdate(repo, repo / "docs", repo / "src", repo / "src" / "pkg")
+    assert _gather(repo) == {"CLAUDE.md", "docs/CLAUDE.md"}
+    assert set(_cached_mtimes(repo).values()) == {PAST_NS}
+
+    (repo / "src" / "pkg" / "CLAUDE.md").write_text("# pkg\n", encoding="utf-8")
+    (repo / "docs" / "CLAUDE.md").unlink()
+    assert _gather(repo) == {"CLAUDE.md", "src/pkg/CLAUDE.md"}
+
+    shutil.rmtree(repo / "src")
+    assert _gather(repo) == {"CLAUDE.md"}
+    assert set(_cached_mtimes(repo)) == {"", "docs"}
+
+
+def test_racy_directories_are_never_trusted(repo: Path) -> None:
+    _backdate(repo, repo / "src", repo / "src" / "pkg")
+    assert _gather(repo) == {"CLAUDE.md", "docs/CLAUDE.md"}
+    assert _cached_mtimes(repo)["docs"] is None
+    assert _cached_mtimes(repo)["src/pkg"] == PAST_NS
+
+    # Changes that land within the directory's current mtime tick leave that
+    # mtime unchanged: the trusted directory misses them, the racy one cannot.
+    for directory, change in ((repo / "docs", "unlink"), (repo / "src" / "pkg", "create")):
+        mtime_ns = os.stat(directory).st_mtime_ns
+        if change == "unlink":
+            (directory / "CLAUDE.md").unlink()
+        else:
+            (directory / "CLAUDE.md").write_text("# new\n", encoding="utf-8")
+        os.utime(directory, ns=(mtime_ns, mtime_ns))
+    assert _gather(repo) == {"CLAUDE.md"}
+
+
+def test_cache_is_dropped_when_the_wanted_names_change(repo: Path) -> None:
+    _backdate(repo, repo / "docs", repo / "src", repo / "src" / "pkg")
+    _gather(repo)
+    (repo / "AGENTS.md").write_text("# agents\n", encoding="utf-8")
+    _backdate(repo)
+    found = core._gather_named_files(repo, ["CLAUDE.md", "AGENTS.md"], "filesystem")
+    assert sorted(path.relative_to(repo).as_posix() for path in found) == [
+        "AGENTS.md",
+        "CLAUDE.md",
+        "docs/CLAUDE.md",
+    ]
+
+
+@pytest.fixture
+def hook_repo(repo: Path, monkeypatch) -> tuple[Path, list[Path]]:
+    if shutil.which("git") is None:
+        pytest.skip("needs git")
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / core.LLM_SYNC_CONFIG_NAME).write_text("claude\n", encoding="utf-8")
+    calls: list[Path] = []
+
+    def fake_sync(path: Path, dry_run: bool) -> list[str]:
+        calls.append(path)
+        return []
+
+    monkeypatch.setattr(core, "run_llm_sync", fake_sync)
+    _backdate(*(repo / name for name in core.llm_sync_managed_files() if (repo / name).exists()))
+    return repo, calls
+
+
+def _hook_run(repo: Path) -> None:
+    result = CliRunner().invoke(core.cli, ["llm:agents", "hook-run", "--repo", str(repo)])
+    assert result.exit_code == 0, result.output
+
+
+def test_hook_run_skips_when_nothing_changed(hook_repo) -> None:
+    repo, calls = hook_repo
+    _hook_run(repo)
+    _hook_run(repo)
+    assert len(calls) == 1
+
+    (repo / "CLAUDE.md").write_text("# edited\n", encoding="utf-8")
+    os.utime(repo / "CLAUDE.md", ns=(PAST_NS + 10**9, PAST_NS + 10**9))
+    _hook_run(repo)
+    _hook_run(repo)
+    assert len(calls) == 2
+
+
+def test_hook_run_never_records_a_racy_fingerprint(hook_repo) -> None:
+    repo, calls = hook_repo
+    (repo / "AGENTS.md").write_text("# just written\n", encoding="utf-8")
+    _hook_run(repo)
+    _hook_run(repo)
+    assert len(calls) == 2
+    assert not (repo / ".git" / core.LLM_SYNC_FINGERPRINT_NAME).exists()
+
+
+def test_hook_skips_commits_without_staged_managed_files(hook_repo) -> None:
+    repo, _ = hook_repo
+    script = "\n".join([f'REPO_ROOT="{repo}"', *core._staged_fast_path_lines(), "exit 3"])
+    (repo / "src" / "main.py").write_text("", encoding="utf-8")
+    subprocess.run(["git", "-C", str(repo), "add", "src/main.py"], check=True)
+    assert subprocess.run(["bash", "-c", script]).returncode == 0
+
+    subprocess.run(["git", "-C", str(repo), "add", "CLAUDE.md"], check=True)
+    assert subprocess.run(["bash", "-c", script]).returncode == 3
@@ -0,0 +1,115 @@
+"""Graveyard blobs must stay intact until the retention policy lets them go."""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from project_manager_core import (
+    GraveyardEntry,
+    RetentionPolicy,
+    _select_retained,
+    collect_graveyard_garbage,
+    graveyard_blob_path,
+    read_graveyard_index,
+    store_backup,
+)
+
+NOW = time.time()
+
+
+def test_backup_survives_edits_through_another_hardlink(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    agents = repo / "AGENTS.md"
+    agents.write_text("original\n", encoding="utf-8")
+    claude = repo / "CLAUDE.md"
+    os.link(agents, claude)
+
+    entry = store_backup(claude, tmp_path / "graveyard", repo)
+    claude.unlink()
+    with agents.open("w", encoding="utf-8") as handle:  # rewrite the same inode in place
+        handle.write("edited\n")
+
+    blob = graveyard_blob_path(tmp_path / "graveyard", entry.digest)
+    assert blob.read_text(encoding="utf-8") == "original\n"
+    assert os.stat(blob).st_ino != os.stat(agents).st_ino
+
+
+def test_identical_content_is_stored_once(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for name in ("CLAUDE.md", "CODEX.md"):
+        (repo / name).write_text("same\n", encoding="utf-8")
+
+    first = store_backup(repo / "CLAUDE.md", tmp_path / "graveyard", repo)
+    second = store_backup(repo / "CODEX.md", tmp_path / "graveyard", repo)
+    assert first.digest == second.digest
+    assert (first.path, second.path) == ("CLAUDE.md", "CODEX.md")
+    assert len(list((tmp_path / "graveyard" / "objects").rglob("*"))) == 2  # one shard dir, one blob
+
+
+def _entry(digest: str, repo: str, age_days: float, size: int = 10) -> GraveyardEntry:
+    created = NOW - age_days * 86400
+    return GraveyardEntry(digest=digest, repo=repo, path="CLAUDE.md", created=created, size=size)
+
+
+def test_gc_evicts_oldest_first_and_shares_blob_sizes() -> None:
+    entries = [
+        _entry("a", "/r1", 1),
+        _entry("b", "/r1", 2),
+        _entry("a", "/r2", 3),  # same blob as the newest entry: free against the budget
+        _entry("c", "/r2", 4),
+        _entry("d", "/r2", 400),
+    ]
+    policy = RetentionPolicy(max_bytes=25, max_age_days=180, keep_per_repo=None)
+    kept, evicted = _select_retained(entries, policy, NOW)
+    assert [entry.digest for entry in kept] == ["a", "b", "a"]
+    assert [entry.digest for entry in evicted] == ["c", "d"]
+
+    policy = RetentionPolicy(max_bytes=None, max_age_days=None, keep_per_repo=1)
+    kept, evicted = _select_retained(entries, policy, NOW)
+    assert [(entry.digest, entry.repo) for entry in kept] == [("a", "/r1"), ("a", "/r2")]
+
+
+def test_gc_keeps_blobs_still_referenced(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    graveyard = tmp_path / "graveyard"
+    (repo / "CLAUDE.md").write_text("shared\n", encoding="utf-8")
+    (repo / "CODEX.md").write_text("old\n", encoding="utf-8")
+    old = store_backup(repo / "CODEX.md", graveyard, repo)
+    shared_old = store_backup(repo / "CLAUDE.md", graveyard, repo)
+    shared_new = store_backup(repo / "CLAUDE.md", graveyard, repo)
+
+    policy = RetentionPolicy(max_bytes=None, max_age_days=None, keep_per_repo=1)
+    assert collect_graveyard_garbage(graveyard, policy, dry_run=True).evicted == 2
+    assert graveyard_blob_path(graveyard, old.digest).exists()
+
+    result = collect_graveyard_garbage(graveyard, policy, dry_run=False)
+    assert (result.kept, result.evicted, result.removed_blobs) == (1, 2, 1)
+    assert not graveyard_blob_path(graveyard, old.digest).exists()
+    assert graveyard_blob_path(graveyard, shared_old.digest).exists()
+    assert read_graveyard_index(graveyard) == [shared_new]
+
+
+def test_gc_evicts_legacy_slug_directories_by_mtime(tmp_path: Path) -> None:
+    graveyard = tmp_path / "graveyard"
+    slug = graveyard / "home-me-code-repo"
+    slug.mkdir(parents=True)
+    stale = slug / "claude-md-20200101T000000Z"
+    stale.write_text("ancient\n", encoding="utf-8")
+    past = NOW - 400 * 86400
+    os.utime(stale, (past, past))
+    recent = slug / "codex-md-20260101T000000Z"
+    recent.write_text("recent\n", encoding="utf-8")
+
+    policy = RetentionPolicy(max_bytes=None, max_age_days=180, keep_per_repo=None)
+    result = collect_graveyard_garbage(graveyard, policy, dry_run=False)
+    assert (result.kept, result.evicted, result.removed_blobs) == (1, 1, 1)
+    assert not stale.exists() and recent.exists()
+    assert not (graveyard / "index.jsonl").exists()
+
+    os.utime(recent, (past, past))
+    collect_graveyard_garbage(graveyard, RetentionPolicy(None, 180, None), dry_run=False)
+    assert not slug.exists()
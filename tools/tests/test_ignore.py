@@ -0,0 +1,104 @@
+"""Ignore patterns must match the same paths git ignores."""
+from __future__ import annotations
+
+import shutil
+import subprocess
+import warnings
+from pathlib import Path
+
+import pytest
+
+from project_manager_ignore import (
+    EMPTY_MATCHER,
+    IgnoreMatcher,
+    compile_ignore_line,
+    compile_ignore_lines,
+)
+
+PATTERNS = (
+    "[]a]",
+    "a[!]]b",
+    "[z-a]",
+    "[a-c-e]",
+    "[!]",
+    "[]",
+    "[[:alpha:]]",
+    "[[:digit:]x]",
+    "[[:foo:]]",
+    "[abc",
+    "[a-]",
+    "[-a]",
+    "[!a-c]x",
+    "[[:al]",
+    "[\\]]",
+    "x[^y]z",
+    "*.py[co]",
+    "a[[:punct:]]b",
+    "foo/a[!x]b",
+    "foo/a[[:punct:]]b",
+    "trailing\\",
+)
+NAMES = (
+    "]", "a", "b", "c", "d", "e", "z", "-", "d/:", "[", "l", "1", "x", "a]b", "azb", "a.b", "a b", "ax", "dx",
+    "x.pyc", "x.pyo", "x.py", "xyz", "xaz", "foo/a/b", "foo/acb", "foo/a.b", "trailing",
+)
+
+
+def _ignored(matcher: IgnoreMatcher, path: str) -> bool:
+    *parents, name = path.split("/")
+    for parent in parents:
+        if matcher.ignored(parent, is_dir=True):
+            return True
+        matcher = matcher.child(parent)
+    return matcher.ignored(name, is_dir=False)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_pattern_matches_like_git(pattern: str, tmp_path: Path) -> None:
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text(pattern + "\n", encoding="utf-8")
+    result = subprocess.run(
+        ["git", "-C", str(tmp_path), "check-ignore", "--no-index", "--", *NAMES],
+        capture_output=True,
+        text=True,
+    )
+    expected = set(result.stdout.splitlines())
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        matcher = EMPTY_MATCHER.with_rules(compile_ignore_lines([pattern]))
+    assert {name for name in NAMES if _ignored(matcher, name)} == expected
+
+
+@pytest.mark.parametrize("pattern", ["[abc", "[[:foo:]]", "a[", "x\\", "[z-"])
+def test_malformed_lines_never_match(pattern: str) -> None:
+    assert compile_ignore_line(pattern) is None
+
+
+def test_later_lines_and_deeper_files_win() -> None:
+    root = EMPTY_MATCHER.with_rules(compile_ignore_lines(["*.log", "!keep.log", "build/"]))
+    assert root.ignored("debug.log", is_dir=False)
+    assert not root.ignored("keep.log", is_dir=False)
+    assert root.ignored("build", is_dir=True)
+    assert not root.ignored("build", is_dir=False)
+
+    sub = root.child("src").with_rules(compile_ignore_lines(["!debug.log"]))
+    assert not sub.ignored("debug.log", is_dir=False)
+
+
+def test_anchored_rules_are_relative_to_their_file() -> None:
+    root = EMPTY_MATCHER.with_rules(compile_ignore_lines(["/top.md", "docs/*.md"]))
+    assert root.ignored("top.md", is_dir=False)
+    assert not root.child("sub").ignored("top.md", is_dir=False)
+    assert root.child("docs").ignored("guide.md", is_dir=False)
+    assert not root.child("sub").child("docs").ignored("guide.md", is_dir=False)
+
+    nested = root.child("sub").with_rules(compile_ignore_lines(["docs/*.md"]))
+    assert nested.child("docs").ignored("guide.md", is_dir=False)
+
+
+def test_name_only_rules_share_the_matcher() -> None:
+    matcher = EMPTY_MATCHER.with_rules(compile_ignore_lines(["*.tmp"]))
+    assert matcher.child("deep") is matcher
+    assert matcher.child("deep").ignored("x.tmp", is_dir=False)
@@ -0,0 +1,33 @@
+"""``pm --help`` must list lazy subcommands without importing them."""
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+import project_manager_core as core
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+
+
+def test_static_help_matches_the_commands() -> None:
+    ctx = click.Context(core.cli)
+    for name, help_text in core.LAZY_SUBCOMMAND_HELP.items():
+        command = core.cli.get_command(ctx, name)
+        assert command.get_short_help_str(limit=200) == help_text
+
+
+def test_help_skips_lazy_imports() -> None:
+    probe = (
+        "import sys, click, project_manager_core as pm\n"
+        "help_text = pm.cli.get_help(click.Context(pm.cli, info_name='pm'))\n"
+        "assert 'Manage tmux project scripts.' in help_text, help_text\n"
+        "lazy = {target.split(':')[0] for target in pm.LAZY_SUBCOMMANDS.values()}\n"
+        "print(' '.join(sorted(lazy & set(sys.modules))))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=TOOLS_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
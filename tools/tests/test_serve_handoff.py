@@ -0,0 +1,57 @@
+"""A forwarded ``pm tmux up`` must attach from the caller's session, not the daemon's."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ENTRY = Path(__file__).resolve().parents[1] / "project_manager.py"
+# Record the session id of whichever process runs each tmux subcommand.
+TMUX_STUB = """#!/bin/sh
+echo "$1 $(ps -o sid= -p $$ | tr -d ' ')" >> "$PM_TEST_LOG"
+"""
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="needs SCM_RIGHTS and ps -o sid")
+def test_attach_runs_in_caller_session(tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "tmux").write_text(TMUX_STUB, encoding="utf-8")
+    (bin_dir / "tmux").chmod(0o755)
+    launchers = tmp_path / "home" / "code" / "projects" / "tmux"
+    launchers.mkdir(parents=True)
+    (launchers / "start_demo.sh").write_text(
+        'SESSION_NAME="demo"\ntmux new-session -d -s $SESSION_NAME -n main -c /tmp /bin/zsh\n',
+        encoding="utf-8",
+    )
+    log = tmp_path / "tmux.log"
+    env = {
+        key: value for key, value in os.environ.items() if key not in ("TMUX", "PM_NO_DAEMON")
+    }
+    env.update(
+        HOME=str(tmp_path / "home"),
+        PATH=f"{bin_dir}{os.pathsep}{env.get('PATH', '')}",
+        PM_SOCKET=str(tmp_path / "pm.sock"),
+        PM_TEST_LOG=str(log),
+    )
+
+    daemon = subprocess.Popen(
+        [sys.executable, str(ENTRY), "serve", "--idle-timeout", "1m"], env=env, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not (tmp_path / "pm.sock").exists():
+            assert time.monotonic() < deadline and daemon.poll() is None, "pm serve did not start"
+            time.sleep(0.05)
+        subprocess.run([sys.executable, str(ENTRY), "tmux", "up", "demo"], env=env, check=True)
+    finally:
+        subprocess.run([sys.executable, str(ENTRY), "serve", "--stop"], env=env, capture_output=True)
+        daemon.wait(timeout=10)
+
+    sessions = dict(line.split() for line in log.read_text(encoding="utf-8").splitlines())
+    assert sessions["has-session"] != str(os.getsid(0)), "layout should run in the daemon handler"
+    assert sessions["attach-session"] == str(os.getsid(0))
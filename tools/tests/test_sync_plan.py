@@ -0,0 +1,56 @@
+"""A confirmed sync plan is applied only to the files it was computed from."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import project_manager_core as core
+from project_manager_core import ProjectManagerError, SyncConfig, apply_sync_plan, plan_alias_sync
+
+
+@pytest.fixture
+def config(tmp_path: Path, monkeypatch) -> SyncConfig:
+    monkeypatch.setattr(core, "DISCOVERY_CACHE_ROOT", tmp_path / "cache")
+    repo = tmp_path / "repo"
+    (repo / "docs").mkdir(parents=True)
+    (repo / "AGENTS.md").write_text("# canonical\n", encoding="utf-8")
+    (repo / "docs" / "CLAUDE.md").write_text("# promoted\n", encoding="utf-8")
+    return SyncConfig(
+        repo_path=repo,
+        canonical_name="AGENTS.md",
+        alias_names=["CLAUDE.md"],
+        branch=None,
+        dry_run=False,
+        graveyard_root=tmp_path / "graveyard",
+        discovery="filesystem",
+    )
+
+
+def test_plan_applies_when_nothing_changed(config: SyncConfig) -> None:
+    plan = plan_alias_sync(config)
+    apply_sync_plan(plan)
+    repo = config.repo_path
+    assert os.readlink(repo / "CLAUDE.md") == "AGENTS.md"
+    assert (repo / "docs" / "AGENTS.md").read_text(encoding="utf-8") == "# promoted\n"
+    assert os.readlink(repo / "docs" / "CLAUDE.md") == "AGENTS.md"
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda repo: (repo / "CLAUDE.md").write_text("# new alias\n", encoding="utf-8"),
+        lambda repo: (repo / "docs" / "AGENTS.md").write_text("# new canonical\n", encoding="utf-8"),
+        lambda repo: (repo / "docs" / "CLAUDE.md").unlink(),
+        lambda repo: (repo / "AGENTS.md").unlink(),
+    ],
+    ids=["alias-created", "canonical-created", "promoted-file-removed", "canonical-removed"],
+)
+def test_plan_refuses_to_apply_after_a_change(config: SyncConfig, change) -> None:
+    plan = plan_alias_sync(config)
+    change(config.repo_path)
+    with pytest.raises(ProjectManagerError, match="Files changed since the sync plan was computed"):
+        apply_sync_plan(plan)
+    assert not (config.repo_path / "CLAUDE.md").is_symlink()
+    assert not config.graveyard_root.exists()
@@ -0,0 +1,79 @@
+"""Importing a hand-written launcher must keep its tmux layout or say why not."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from project_manager_tmux import (
+    _parse_launcher_commands,
+    _render_tmux_script,
+    _session_commands,
+    session_from_launcher,
+    session_from_spec,
+    session_to_spec,
+)
+
+TMUX_DIR = Path(__file__).resolve().parents[2] / "tmux"
+LAUNCHERS = sorted(TMUX_DIR.glob("start_*.sh"))
+
+
+def _layout(commands: list[list[str]]) -> list[tuple[str, ...]]:
+    # Keys sent to one window may be interleaved with another window's
+    # creation; tmux ends up in the same state either way.
+    return sorted(tuple("C-m" if arg == "Enter" else arg for arg in command) for command in commands)
+
+
+@pytest.mark.parametrize("launcher", LAUNCHERS, ids=lambda path: path.name)
+def test_lossless_import_keeps_layout(launcher: Path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", "/home/pm-test")
+    session, losses = session_from_launcher(launcher.stem[len("start_") :], launcher)
+    if losses:
+        pytest.skip(f"not importable without --force: {losses[0]}")
+    original = _parse_launcher_commands(launcher.read_text(encoding="utf-8")).commands
+    assert _layout(_session_commands(session)) == _layout(original)
+
+    rendered = _render_tmux_script(
+        session.name,
+        session.project_dir,
+        session.windows,
+        session.python_venv,
+        main_name=session.main_name,
+        main_commands=session.main_commands,
+        select_window=session.select_window,
+    )
+    assert _layout(_parse_launcher_commands(rendered).commands) == _layout(original)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("tmmeta", "tmux split-window -t meta:0"),
+        ("parkukb", "runs new-session 2 times"),
+        ("lrc", "kills and recreates a running session instead of reattaching"),
+    ],
+)
+def test_unrepresentable_steps_are_reported(name: str, expected: str) -> None:
+    _, losses = session_from_launcher(name, TMUX_DIR / f"start_{name}.sh")
+    assert expected in losses
+
+
+def test_main_window_and_selection_round_trip(tmp_path: Path) -> None:
+    script = tmp_path / "start_demo.sh"
+    script.write_text(
+        'SESSION_NAME="demo"\n'
+        'tmux new-session -d -s $SESSION_NAME -n "shell" -c "/srv/demo" /bin/zsh\n'
+        'tmux send-keys -t $SESSION_NAME:0 "source .venv/bin/activate" C-m\n'
+        'tmux new-window -t $SESSION_NAME:1 -n "claude" -c "/srv/demo" /bin/zsh\n'
+        'tmux send-keys -t $SESSION_NAME:1 "claude" Enter\n'
+        "tmux select-window -t $SESSION_NAME:shell\n",
+        encoding="utf-8",
+    )
+    session, losses = session_from_launcher("demo", script)
+    assert losses == []
+    assert (session.main_name, session.main_commands, session.select_window) == (
+        "shell",
+        ["source .venv/bin/activate"],
+        0,
+    )
+    assert session_from_spec(session_to_spec(session), script) == session
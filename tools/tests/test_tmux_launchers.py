@@ -0,0 +1,58 @@
+"""Launcher parsing must see the same tmux argv bash would run."""
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from project_manager_tmux import TMUX_LAYOUT_COMMANDS, _parse_launcher_commands
+
+LAUNCHERS = sorted((Path(__file__).resolve().parents[2] / "tmux").glob("start_*.sh"))
+# Print each call's argv NUL-separated, ending with a record separator.
+TMUX_STUB = "tmux() { printf '%s\\0' \"$@\"; printf '\\036\\0'; }\n"
+
+
+def _bash_layout_commands(script_text: str, env: dict) -> list[list[str]]:
+    """Replay the launcher's assignments and tmux layout lines through bash."""
+
+    lines = [TMUX_STUB]
+    for raw_line in script_text.splitlines():
+        line = raw_line.strip()
+        words = line.split()
+        if len(words) > 1 and words[0] == "tmux" and words[1] in TMUX_LAYOUT_COMMANDS:
+            lines.append(line)
+        elif words and "=" in words[0] and words[0].split("=")[0].isidentifier():
+            lines.append(line)
+    output = subprocess.run(
+        ["bash", "-c", "\n".join(lines)], env=env, capture_output=True, check=True
+    ).stdout.decode()
+    commands: list[list[str]] = [[]]
+    for field in output.split("\0")[:-1]:
+        if field == "\036":
+            commands.append([])
+        else:
+            commands[-1].append(field)
+    return commands[:-1]
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+@pytest.mark.parametrize("launcher", LAUNCHERS, ids=lambda path: path.name)
+def test_launcher_matches_bash(launcher: Path, monkeypatch) -> None:
+    monkeypatch.setenv("HOME", "/home/pm-test")
+    text = launcher.read_text(encoding="utf-8")
+    parsed = _parse_launcher_commands(text)
+    assert parsed.commands == _bash_layout_commands(text, dict(os.environ))
+
+
+def test_double_quoted_escapes_follow_bash() -> None:
+    script = 'S=dvc\ntmux send-keys -t $S:3 "day_\\$(cat f) \\`x\\` \\"q\\" a\\\\b" C-m\n'
+    commands = _parse_launcher_commands(script).commands
+    assert commands == [["send-keys", "-t", "dvc:3", 'day_$(cat f) `x` "q" a\\b', "C-m"]]
+
+
+def test_single_quotes_keep_backslashes() -> None:
+    commands = _parse_launcher_commands("tmux send-keys -t s 'a\\$b' C-m\n").commands
+    assert commands == [["send-keys", "-t", "s", "a\\$b", "C-m"]]